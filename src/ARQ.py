@@ -0,0 +1,492 @@
+import time
+import socket
+import select
+import struct
+import threading
+from collections import deque
+import numpy as np
+from src.CamadaFisica import CamadaFisica
+from src.CamadaEnlace import Enlace
+from src.Canal import Canal
+from src.Protocolo import Protocolo
+
+class ARQ:
+    MODOS = ("Go-Back-N", "Selective Repeat")
+
+    # Número de sequência do ARQ, no início de cada quadro de dados (protegido pelo EDC)
+    CABECALHO = struct.Struct(">H")
+    MODULO = 1 << 16
+
+    # Mensagens na conexão TCP (dados TX → RX, ACK/NAK RX → TX, FIM TX → RX), sem pickle:
+    #     tipo (B) | instante de envio (d) | sequência (H) | número de amostras (I) | amostras (float64, só DADOS)
+    MENSAGEM = struct.Struct(">BdHI")
+    TIPOS = ("DADOS", "ACK", "NAK", "FIM")  # Código do tipo = posição na tupla
+    AMOSTRA = np.dtype(">f8")
+
+    @staticmethod
+    def adicionar_cabecalho(seq:int, dado:bytes) -> bytes:
+        """Coloca o número de sequência (módulo 2^16) na frente dos dados"""
+        return ARQ.CABECALHO.pack(seq % ARQ.MODULO) + bytes(dado)
+
+
+    @staticmethod
+    def ler_cabecalho(dado:bytes) -> tuple:
+        """
+        Separa o número de sequência dos dados.
+
+        Retorna:
+        • tuple: (sequência módulo 2^16, dados).
+
+        Exceção:
+        • ValueError: Se o quadro for menor que o cabeçalho.
+        """
+        if len(dado) < ARQ.CABECALHO.size:
+            raise ValueError("Quadro menor que o cabeçalho do ARQ")
+        return ARQ.CABECALHO.unpack_from(dado)[0], bytes(dado[ARQ.CABECALHO.size:])
+
+
+    @staticmethod
+    def desembrulhar(seq:int, referencia:int) -> int:
+        """
+        Converte a sequência módulo 2^16 no número absoluto mais próximo da referência (ex: base da janela).
+        """
+        diferenca = (seq - referencia) % ARQ.MODULO
+        if diferenca >= ARQ.MODULO // 2:
+            diferenca -= ARQ.MODULO
+        return referencia + diferenca
+
+
+    @staticmethod
+    def enviar_mensagem(conexao:socket.socket, tipo:str, instante:float = 0.0, seq:int = 0, sinal=None) -> None:
+        """
+        Envia uma mensagem do ARQ na conexão TCP (ver MENSAGEM).
+
+        Parâmetros:
+        • conexao (socket.socket): Conexão entre TX e RX.
+        • tipo (str): "DADOS", "ACK", "NAK" ou "FIM" (ver TIPOS).
+        • instante (float): Instante de envio (time.monotonic), pro atraso de propagação simulado.
+        • seq (int): Sequência do ACK/NAK (módulo 2^16).
+        • sinal (np.ndarray | None): Sinal modulado do quadro (só DADOS).
+        """
+        amostras = np.ascontiguousarray([] if sinal is None else sinal, dtype=ARQ.AMOSTRA)
+        cabecalho = ARQ.MENSAGEM.pack(ARQ.TIPOS.index(tipo), instante, seq % ARQ.MODULO, len(amostras))
+        Protocolo.enviar(conexao, [cabecalho, memoryview(amostras).cast("B")])
+
+
+    @staticmethod
+    def receber_mensagem(conexao:socket.socket):
+        """
+        Recebe uma mensagem enviada com enviar_mensagem.
+
+        Retorna:
+        • tuple | None: (tipo, instante, sequência, sinal (np.ndarray, vazio se não for DADOS)),
+                        ou None se a conexão foi fechada.
+
+        Exceção:
+        • ValueError: Se o tipo da mensagem for desconhecido.
+        """
+        cabecalho = ARQ.receber_exato(conexao, ARQ.MENSAGEM.size)
+        if cabecalho is None:
+            return None
+        codigo, instante, seq, num_amostras = ARQ.MENSAGEM.unpack(cabecalho)
+        if codigo >= len(ARQ.TIPOS):
+            raise ValueError(f"Tipo de mensagem do ARQ desconhecido: {codigo}")
+        dados = ARQ.receber_exato(conexao, num_amostras * ARQ.AMOSTRA.itemsize)
+        if dados is None:
+            return None
+        return ARQ.TIPOS[codigo], instante, seq, np.frombuffer(dados, dtype=ARQ.AMOSTRA).astype(np.float64)
+
+
+    @staticmethod
+    def receber_exato(conexao:socket.socket, tamanho:int):
+        """Lê exatamente tamanho bytes (None se a conexão fechar antes)"""
+        dados = bytearray()
+        while len(dados) < tamanho:
+            pacote = conexao.recv(tamanho - len(dados))
+            if not pacote:
+                return None
+            dados += pacote
+        return bytes(dados)
+
+
+class TransmissorARQ:
+    """
+    Lado transmissor do ARQ por janela deslizante.
+
+    • O receptor responde cada quadro recebido com exatamente um ACK ou NAK, e o enlace entrega
+      na ordem (ponto a ponto, sem perda, só com erros de bit). Então a i-ésima resposta é sobre a i-ésima transmissão.
+
+    Go-Back-N:
+        • ACK n = recebeu tudo antes de n (cumulativo). Um único temporizador, o do quadro mais antigo.
+        • NAK n = quadro com erro ou fora de ordem (n = quadro esperado) → retransmite de n até o último enviado,
+          se a última cópia de n foi enviada antes do quadro que gerou o NAK.
+        • Estouro do temporizador → retransmite da base até o último enviado.
+
+    Selective Repeat:
+        • ACK n = recebeu o quadro n. Um temporizador por quadro.
+        • NAK = o quadro dessa transmissão chegou com erro → retransmite só ele (se não houver cópia mais nova).
+        • Estouro do temporizador de n → retransmite só o quadro n.
+    """
+    def __init__(self, modo:str = "Go-Back-N", janela:int = 4, timeout:float = 0.5):
+        if modo not in ARQ.MODOS:
+            raise ValueError(f"Modo de ARQ inválido: {modo}")
+        limite = ARQ.MODULO // 2 if modo == "Selective Repeat" else ARQ.MODULO - 1
+        if not 1 <= janela <= limite:
+            raise ValueError(f"Janela inválida para {modo}: {janela} (1 a {limite})")
+
+        self.modo = modo
+        self.janela = janela            # Quadros enviados e ainda não confirmados, no máximo
+        self.timeout = timeout          # Segundos até retransmitir um quadro sem confirmação
+        self.base = 0                   # Quadro mais antigo sem confirmação
+        self.proximo = 0                # Sequência do próximo quadro novo
+        self.pendentes = {}             # Sequência → dados, dos quadros sem confirmação
+        self.prazos = {}                # Sequência → instante de retransmissão (Go-Back-N: só a base)
+        self.sem_resposta = deque()     # (índice da transmissão, sequência) ainda sem ACK/NAK, na ordem de envio
+        self.ultima_copia = {}          # Sequência → índice da transmissão mais recente
+
+        # Contadores
+        self.enviados = 0               # Quadros enviados (inclui retransmissões)
+        self.retransmissoes = 0         # Quadros retransmitidos
+        self.confirmados = 0            # Quadros confirmados pelo receptor
+
+
+    def pode_enviar(self) -> bool:
+        """Há espaço na janela para um quadro novo"""
+        return self.proximo < self.base + self.janela
+
+
+    def enviar(self, dado:bytes, agora:float) -> int:
+        """
+        Registra um quadro novo na janela.
+
+        Parâmetros:
+        • dado (bytes): Dados do quadro (sem o cabeçalho do ARQ).
+        • agora (float): Instante atual (time.monotonic()).
+
+        Retorna:
+        • int: Número de sequência do quadro.
+        """
+        if not self.pode_enviar():
+            raise ValueError("Janela do ARQ cheia")
+        seq = self.proximo
+        self.pendentes[seq] = dado
+        if self.modo == "Selective Repeat" or not self.prazos:
+            self.prazos[seq] = agora + self.timeout
+        self.proximo += 1
+        self.registrar_envio(seq)
+        return seq
+
+
+    def registrar_envio(self, seq:int) -> None:
+        self.sem_resposta.append((self.enviados, seq))
+        self.ultima_copia[seq] = self.enviados
+        self.enviados += 1
+
+
+    def receber_controle(self, tipo:str, seq:int, agora:float) -> list:
+        """
+        Processa o ACK ou NAK da transmissão mais antiga ainda sem resposta.
+
+        Parâmetros:
+        • tipo (str): "ACK" ou "NAK".
+        • seq (int): Sequência do ACK/NAK (módulo 2^16).
+        • agora (float): Instante atual.
+
+        Retorna:
+        • list[tuple]: (sequência, dados) de cada quadro a retransmitir.
+        """
+        indice, transmitido = self.sem_resposta.popleft() if self.sem_resposta else (self.enviados, None)
+        seq = ARQ.desembrulhar(seq, self.base)
+
+        if self.modo == "Go-Back-N":
+            # ACK n e NAK n confirmam tudo antes de n
+            if self.base < seq <= self.proximo:
+                for confirmado in range(self.base, seq):
+                    del self.pendentes[confirmado]
+                    del self.ultima_copia[confirmado]
+                self.confirmados += seq - self.base
+                self.base = seq
+                self.prazos = {self.base: agora + self.timeout} if self.pendentes else {}
+            # Volta só se a cópia mais nova de n não foi enviada depois do quadro que gerou o NAK
+            if tipo == "NAK" and self.base == seq < self.proximo and self.ultima_copia[seq] <= indice:
+                return self.retransmitir(range(seq, self.proximo), agora)
+            return []
+
+        # Selective Repeat
+        if tipo == "NAK":
+            if transmitido in self.pendentes and self.ultima_copia[transmitido] == indice:
+                return self.retransmitir([transmitido], agora)
+            return []
+
+        if seq in self.pendentes:
+            del self.pendentes[seq]
+            del self.prazos[seq]
+            del self.ultima_copia[seq]
+            self.confirmados += 1
+            self.base = min(self.pendentes) if self.pendentes else self.proximo
+        return []
+
+
+    def expirados(self, agora:float) -> list:
+        """
+        Quadros cujo temporizador estourou.
+
+        Retorna:
+        • list[tuple]: (sequência, dados) de cada quadro a retransmitir.
+        """
+        vencidos = [seq for seq, prazo in self.prazos.items() if prazo <= agora]
+        if not vencidos:
+            return []
+        if self.modo == "Go-Back-N":
+            return self.retransmitir(range(self.base, self.proximo), agora)
+        return self.retransmitir(sorted(vencidos), agora)
+
+
+    def proximo_prazo(self):
+        """Instante do próximo estouro de temporizador (None se não houver quadro pendente)"""
+        return min(self.prazos.values()) if self.prazos else None
+
+
+    def retransmitir(self, sequencias, agora:float) -> list:
+        """Registra as retransmissões e reinicia os temporizadores"""
+        sequencias = list(sequencias)
+        self.retransmissoes += len(sequencias)
+        for seq in sequencias:
+            self.registrar_envio(seq)
+            if self.modo == "Selective Repeat":
+                self.prazos[seq] = agora + self.timeout
+        if self.modo == "Go-Back-N":
+            self.prazos = {self.base: agora + self.timeout}
+        return [(seq, self.pendentes[seq]) for seq in sequencias]
+
+
+class ReceptorARQ:
+    """
+    Lado receptor do ARQ por janela deslizante.
+
+    • Entrega os dados em ordem, sem repetição.
+    • Responde cada quadro recebido com exatamente um ACK ou NAK.
+    • Quadro com erro (EDC ou desenquadramento) → NAK do quadro esperado.
+    • Go-Back-N: descarta quadros fora de ordem (NAK do esperado); ACK n = próximo esperado (cumulativo).
+    • Selective Repeat: guarda quadros dentro da janela e responde ACK de cada um.
+    """
+    def __init__(self, modo:str = "Go-Back-N", janela:int = 4):
+        if modo not in ARQ.MODOS:
+            raise ValueError(f"Modo de ARQ inválido: {modo}")
+        self.modo = modo
+        self.janela = janela if modo == "Selective Repeat" else 1
+        self.base = 0           # Próximo quadro a entregar
+        self.guardados = {}     # Sequência → dados (Selective Repeat, fora de ordem)
+
+        # Contadores
+        self.recebidos = 0      # Quadros recebidos (com ou sem erro)
+        self.com_erro = 0       # Quadros descartados pelo EDC ou desenquadramento
+        self.duplicados = 0     # Quadros repetidos, fora de ordem (Go-Back-N) ou fora da janela
+
+
+    def receber(self, quadro) -> tuple:
+        """
+        Processa um quadro recebido.
+
+        Parâmetros:
+        • quadro (bytes | None): Quadro já verificado e desenquadrado (cabeçalho do ARQ + dados),
+          ou None se o EDC/desenquadramento falhou.
+
+        Retorna:
+        • tuple: (lista de dados entregues em ordem, resposta (tipo, sequência módulo 2^16)).
+        """
+        self.recebidos += 1
+        try:
+            if quadro is None:
+                raise ValueError("Quadro com erro")
+            seq, dado = ARQ.ler_cabecalho(quadro)
+        except ValueError:
+            self.com_erro += 1
+            return [], ("NAK", self.base % ARQ.MODULO)
+        seq = ARQ.desembrulhar(seq, self.base)
+
+        if self.modo == "Go-Back-N":
+            if seq == self.base:
+                self.base += 1
+                return [dado], ("ACK", self.base % ARQ.MODULO)
+            self.duplicados += 1
+            tipo = "NAK" if seq > self.base else "ACK"
+            return [], (tipo, self.base % ARQ.MODULO)
+
+        # Selective Repeat
+        if not seq < self.base + self.janela:
+            self.duplicados += 1
+            return [], ("NAK", self.base % ARQ.MODULO)
+        if seq < self.base or seq in self.guardados:
+            self.duplicados += 1
+            return [], ("ACK", seq % ARQ.MODULO)
+
+        self.guardados[seq] = dado
+        entregues = []
+        while self.base in self.guardados:
+            entregues.append(self.guardados.pop(self.base))
+            self.base += 1
+        return entregues, ("ACK", seq % ARQ.MODULO)
+
+
+"""
+Padrao config (mesmas chaves da msg da GUI)
+{'enquadramento': 'Contagem de caracteres', 'detecao': 'CRC', 'edc': 8, 'mod_analogica': 'ASK'}
+"""
+class EnlaceARQ:
+    def __init__(self, config:dict, modo:str = "Go-Back-N", janela:int = 4, timeout:float = 0.5, sigma:float = 0.0,
+                 atraso:float = 0.0, semente=None):
+        self.config = config        # Enquadramento, EDC e modulação de todos os quadros
+        self.modo = modo            # "Go-Back-N" ou "Selective Repeat"
+        self.janela = janela        # Tamanho da janela
+        self.timeout = timeout      # Segundos até retransmitir
+        self.sigma = sigma          # Ruído (σ) aplicado pelo receptor em cada quadro de dados
+        self.atraso = atraso        # Atraso de propagação simulado em cada sentido, em segundos
+        self.semente = semente      # Semente do ruído
+
+
+    def executar(self, mensagens) -> dict:
+        """
+        Transmite as mensagens com ARQ por uma conexão TCP local e mede o desempenho.
+
+        Funcionamento:
+        • TX (esta thread): enquadra, aplica o EDC, modula e envia cada quadro, respeitando a janela.
+          Lê os ACK/NAK da mesma conexão e retransmite por NAK ou estouro de temporizador.
+        • RX (outra thread): aplica o ruído, demodula, verifica o EDC, desenquadra e responde ACK/NAK.
+        • O caminho de volta (ACK/NAK) não passa pelo canal ruidoso.
+        • Atraso de propagação: cada mensagem leva o instante de envio e só é processada atraso segundos depois
+          (sem o atraso, a conexão local não tem tempo de ida e volta e janelas maiores não ajudam).
+
+        Parâmetros:
+        • mensagens (Iterable[bytes]): Dados de cada quadro (ex: Segmentacao.segmentar).
+
+        Retorna:
+        • dict: Contadores e desempenho (ver chaves no final).
+        """
+        mensagens = [bytes(m) for m in mensagens]
+        transmissor = TransmissorARQ(self.modo, self.janela, self.timeout)
+        entregues = []
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as servidor:
+            servidor.bind(("localhost", 0))
+            servidor.listen(1)
+            lado_rx = threading.Thread(target=self.lado_receptor, args=(servidor, entregues), daemon=True)
+            lado_rx.start()
+
+            with socket.create_connection(servidor.getsockname()) as conexao:
+                conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Mensagens pequenas saem na hora
+                inicio = time.monotonic()
+                sinais = {}         # Sequência → sinal modulado (retransmissão reenvia o mesmo sinal)
+                chegadas = deque()  # (instante de chegada, tipo, sequência) das respostas ainda em trânsito
+                proxima_mensagem = 0
+
+                while transmissor.confirmados < len(mensagens):
+                    agora = time.monotonic()
+
+                    # Preenche a janela com quadros novos
+                    while proxima_mensagem < len(mensagens) and transmissor.pode_enviar():
+                        seq = transmissor.enviar(mensagens[proxima_mensagem], agora)
+                        sinais[seq] = self.modular(seq, mensagens[proxima_mensagem])
+                        ARQ.enviar_mensagem(conexao, "DADOS", time.monotonic(), sinal=sinais[seq])
+                        proxima_mensagem += 1
+
+                    # Espera ACK/NAK até o próximo estouro de temporizador ou a próxima resposta em trânsito
+                    prazos = [p for p in (transmissor.proximo_prazo(), chegadas[0][0] if chegadas else None) if p is not None]
+                    espera = max(min(prazos) - time.monotonic(), 0) if prazos else None
+                    legiveis, _, _ = select.select([conexao], [], [], espera)
+                    if legiveis:
+                        resposta = ARQ.receber_mensagem(conexao)
+                        if resposta is None:
+                            raise ConnectionError("Receptor do ARQ fechou a conexão")
+                        tipo, respondido_em, seq, _ = resposta
+                        chegadas.append((respondido_em + self.atraso, tipo, seq))
+
+                    # Processa as respostas que já "chegaram" e os temporizadores vencidos
+                    retransmitir = []
+                    while chegadas and chegadas[0][0] <= time.monotonic():
+                        _, tipo, seq = chegadas.popleft()
+                        retransmitir += transmissor.receber_controle(tipo, seq, time.monotonic())
+                    retransmitir += transmissor.expirados(time.monotonic())
+
+                    for seq, _ in retransmitir:
+                        ARQ.enviar_mensagem(conexao, "DADOS", time.monotonic(), sinal=sinais[seq])
+                    for seq in [s for s in sinais if s < transmissor.base]:
+                        del sinais[seq]
+
+                tempo = time.monotonic() - inicio
+                ARQ.enviar_mensagem(conexao, "FIM", time.monotonic())
+            lado_rx.join()
+
+        bytes_entregues = sum(len(m) for m in entregues)
+        return {
+            "modo": self.modo,
+            "janela": self.janela,
+            "quadros": len(mensagens),                                  # Quadros de dados distintos
+            "enviados": transmissor.enviados,                           # Quadros enviados (com retransmissões)
+            "retransmissoes": transmissor.retransmissoes,               # Quadros retransmitidos
+            "entregues": len(entregues),                                # Quadros entregues em ordem ao receptor
+            "erros_nao_detectados": sum(a != b for a, b in zip(entregues, mensagens)),  # Entregues com dados errados
+            "tempo": tempo,                                             # Segundos até a última confirmação
+            "vazao": 8 * bytes_entregues / tempo if tempo > 0 else 0.0, # Bits de dados entregues por segundo (goodput)
+            "eficiencia": len(mensagens) / max(transmissor.enviados, 1) # Quadros distintos / quadros enviados
+        }
+
+
+    def modular(self, seq:int, dado:bytes) -> np.ndarray:
+        """Cabeçalho do ARQ + enquadramento + EDC + modulação de um quadro"""
+        quadro_sem_edc = Enlace.enquadramento(self.config["enquadramento"], ARQ.adicionar_cabecalho(seq, dado))
+        quadro = Enlace.aplicar_edc(self.config["detecao"], quadro_sem_edc, self.config["edc"], self.config.get("entrelacamento", 1))
+        return CamadaFisica.modulador(self.config["mod_analogica"], quadro)
+
+
+    def lado_receptor(self, servidor:socket.socket, entregues:list) -> None:
+        """Thread do receptor: recebe os sinais, verifica cada quadro e responde ACK/NAK"""
+        receptor = ReceptorARQ(self.modo, self.janela)
+        canal = Canal(semente=self.semente)
+        conexao, _ = servidor.accept()
+        conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with conexao:
+            while True:
+                mensagem = ARQ.receber_mensagem(conexao)
+                if mensagem is None or mensagem[0] == "FIM":
+                    break
+                _, enviado_em, _, sinal = mensagem
+                time.sleep(max(enviado_em + self.atraso - time.monotonic(), 0))  # Propagação
+                if self.sigma > 0:
+                    sinal = canal.awgn(sinal, self.sigma)
+                dados, resposta = receptor.receber(EnlaceARQ.verificar_quadro(self.config, sinal))
+                entregues.extend(dados)
+                tipo, seq = resposta
+                ARQ.enviar_mensagem(conexao, tipo, time.monotonic(), seq)
+
+
+    @staticmethod
+    def verificar_quadro(config:dict, sinal):
+        """
+        Demodula, verifica o EDC e desenquadra um quadro.
+
+        Retorna:
+        • bytes | None: Quadro (cabeçalho do ARQ + dados), ou None se o EDC ou o desenquadramento falhar.
+        """
+        quadro = CamadaFisica.demodulador(config["mod_analogica"], sinal)
+        try:
+            quadro_sem_edc = Enlace.verificar_edc(config["detecao"], quadro, config["edc"], config.get("entrelacamento", 1))
+            return Enlace.desenquadramento(config["enquadramento"], quadro_sem_edc)
+        except ValueError:
+            return None
+
+
+if __name__ == "__main__":
+    import sys
+    sigma = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    atraso = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    mensagens = [np.random.default_rng(i).integers(0, 256, 32, dtype=np.uint8).tobytes() for i in range(200)]
+    print(f"σ = {sigma}, atraso = {1000 * atraso:.0f} ms")
+    print(f"{'EDC':>20} {'modo':>17} {'janela':>6} {'enviados':>8} {'retrans.':>8} {'efic.':>6} {'vazão (kbit/s)':>14} {'não detect.':>11}")
+    for detecao in ["Bit de paridade par", "CRC"]:
+        config = {"enquadramento": "Contagem de caracteres", "detecao": detecao, "edc": 16, "mod_analogica": "ASK"}
+        for modo in ARQ.MODOS:
+            for janela in [1, 4, 8]:
+                r = EnlaceARQ(config, modo, janela, timeout=0.5, sigma=sigma, atraso=atraso, semente=0).executar(mensagens)
+                print(f"{detecao:>20} {modo:>17} {janela:>6} {r['enviados']:>8} {r['retransmissoes']:>8} "
+                      f"{r['eficiencia']:>6.2f} {r['vazao'] / 1000:>14.1f} {r['erros_nao_detectados']:>11}")
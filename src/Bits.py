@@ -0,0 +1,137 @@
+import numpy as np
+
+class Bits:
+    """
+    Sequência de bits compactada (8 bits por byte, MSB primeiro), com tamanho em bits.
+
+    • Guarda os bits em um bytearray; os bits de padding do último byte são sempre 0.
+    • Passa entre as camadas sem virar string de '0'/'1' (só byte_formarter/formatar, na exibição).
+    """
+    __slots__ = ("dados", "tamanho")
+
+    def __init__(self, dados=b"", tamanho:int = None):
+        self.dados = bytearray(dados)  # Bits compactados
+        self.tamanho = 8 * len(self.dados) if tamanho is None else tamanho  # Número de bits válidos
+        if not 0 <= self.tamanho <= 8 * len(self.dados) or len(self.dados) != (self.tamanho + 7) // 8:
+            raise ValueError(f"Tamanho inválido: {self.tamanho} bits em {len(self.dados)} bytes")
+        self.limpar_padding()
+
+
+    @staticmethod
+    def de_array(bits) -> "Bits":
+        """
+        Cria a sequência a partir de um array de bits (0/1 ou bool).
+
+        Parâmetros:
+        • bits (np.ndarray | list): Um bit por posição.
+
+        Retorna:
+        • Bits: Sequência compactada com len(bits) bits.
+        """
+        bits = np.asarray(bits, dtype=np.uint8)
+        return Bits(np.packbits(bits).tobytes(), len(bits))
+
+
+    def para_array(self) -> np.ndarray:
+        """
+        Retorna:
+        • np.ndarray: Array uint8 com um bit por posição (tamanho bits, sem padding).
+        """
+        return np.unpackbits(np.frombuffer(self.dados, dtype=np.uint8), count=self.tamanho)
+
+
+    def __bytes__(self) -> bytes:
+        """Bits compactados (o último byte é completado com zeros)"""
+        return bytes(self.dados)
+
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+
+    def __getitem__(self, indice):
+        """
+        • Inteiro → bit (0 ou 1).
+        • Fatia → nova sequência Bits (fatias alinhadas em byte copiam os bytes direto).
+        """
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(self.tamanho)
+            if passo == 1 and inicio % 8 == 0:
+                fim = max(fim, inicio)
+                return Bits(self.dados[inicio // 8:(fim + 7) // 8], fim - inicio)
+            return Bits.de_array(self.para_array()[indice])
+
+        if indice < 0:
+            indice += self.tamanho
+        if not 0 <= indice < self.tamanho:
+            raise IndexError("Índice de bit fora da sequência")
+        return (self.dados[indice // 8] >> (7 - indice % 8)) & 1
+
+
+    def __eq__(self, outro) -> bool:
+        if isinstance(outro, (bytes, bytearray)):
+            outro = Bits(outro)
+        if not isinstance(outro, Bits):
+            return NotImplemented
+        return self.tamanho == outro.tamanho and self.dados == outro.dados
+
+
+    def __add__(self, outro) -> "Bits":
+        resultado = Bits(self.dados, self.tamanho)
+        resultado.extend(outro)
+        return resultado
+
+
+    def __repr__(self) -> str:
+        return f"Bits('{self.formatar()}')"
+
+
+    def append(self, bit:int) -> None:
+        """Acrescenta um bit no final"""
+        if self.tamanho % 8 == 0:
+            self.dados.append(0)
+        if bit:
+            self.dados[-1] |= 1 << (7 - self.tamanho % 8)
+        self.tamanho += 1
+
+
+    def extend(self, outro) -> None:
+        """
+        Acrescenta outra sequência no final.
+
+        Parâmetros:
+        • outro (Bits | bytes): Bits a acrescentar (bytes contam como 8 bits cada).
+        """
+        if not isinstance(outro, Bits):
+            outro = Bits(outro)
+
+        if self.tamanho % 8 == 0:
+            # Alinhado em byte: só concatena os bytes
+            self.dados += outro.dados
+            self.tamanho += outro.tamanho
+        else:
+            juntos = Bits.de_array(np.concatenate([self.para_array(), outro.para_array()]))
+            self.dados, self.tamanho = juntos.dados, juntos.tamanho
+
+
+    def contar_uns(self) -> int:
+        """Número de bits 1 (popcount)"""
+        return int.from_bytes(self.dados, "big").bit_count()
+
+
+    def limpar_padding(self) -> None:
+        """Zera os bits do último byte que passam do tamanho"""
+        resto = self.tamanho % 8
+        if resto:
+            self.dados[-1] &= (0xFF << (8 - resto)) & 0xFF
+
+
+    def formatar(self) -> str:
+        """
+        String dos bits pra exibição, com espaço a cada 8 bits.
+
+        Exemplo:
+            Bits(b'A') + Bits.de_array([1, 0]) → "01000001 10"
+        """
+        texto = ''.join(f"{byte:08b}" for byte in self.dados)[:self.tamanho]
+        return ' '.join(texto[i:i + 8] for i in range(0, len(texto), 8))
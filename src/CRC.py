@@ -0,0 +1,422 @@
+import sys
+import array
+import functools
+
+class CRC:
+    # CRCs padronizados: nome → (largura, polinômio, refletido, valor inicial, xor final, CRC de b"123456789")
+    PRESETS = {
+        "CRC-8":        (8,  0x07,               False, 0x00,               0x00,               0xF4),
+        "CRC-16-CCITT": (16, 0x1021,             False, 0xFFFF,             0x0000,             0x29B1),
+        "CRC-24":       (24, 0x864CFB,           False, 0xB704CE,           0x000000,           0x21CF02),
+        "CRC-32":       (32, 0x04C11DB7,         True,  0xFFFFFFFF,         0xFFFFFFFF,         0xCBF43926),
+        "CRC-40-GSM":   (40, 0x0004820009,       False, 0x0000000000,       0xFFFFFFFFFF,       0xD4164FC646),
+        "CRC-64":       (64, 0x42F0E1EBA9EA3693, True,  0xFFFFFFFFFFFFFFFF, 0xFFFFFFFFFFFFFFFF, 0x995DC9BBDF1939FA),
+    }
+
+    # CRC usado pra cada largura que tem um padrão
+    PRESET_POR_LARGURA = {8: "CRC-8", 16: "CRC-16-CCITT", 24: "CRC-24", 32: "CRC-32", 40: "CRC-40-GSM", 64: "CRC-64"}
+
+    # Larguras da GUI sem CRC padronizado: polinômio g(x) = (x + 1)·p(x), com p(x) irredutível de grau largura - 1
+    # (trinômio x^(w-1) + x^k + 1; pentanômio em 144). Detecta todo erro em número ímpar de bits e toda rajada ≤ largura.
+    # Representação usual: sem o termo x^largura.
+    POLINOMIOS_POR_LARGURA = {
+        48:  0x800000000063,
+        56:  0x80000000000183,
+        72:  0x8000000000000000C3,
+        80:  0x80000000000000000603,
+        88:  0x8000000000000000006003,
+        96:  0x800000000000000000001803,
+        104: 0x80000000000000000000000603,
+        112: 0x8000000000000000000000000C03,
+        120: 0x800000000000000000000000000303,
+        128: 0x80000000000000000000000000000005,
+        136: 0x8000000000000000000000000000001803,
+        144: 0x800000000000000000000000000000000077,
+        152: 0x8000000000000000000000000000000000001B,
+        160: 0x8000000000000000000000000000000180000003,
+        168: 0x8000000000000000000000000000000000000000C3,
+        176: 0x800000000000000000000000000000000000000000C3,
+        184: 0x8000000000000000000000000000000300000000000003,
+        192: 0x800000000000000000000000000000000000000000000603,
+        200: 0x80000000000000000000000000000000000000000C00000003,
+        208: 0x8000000000000000000000000000000000000000180000000003,
+        216: 0x800000000000000000000000000000000000000000000001800003,
+        224: 0x80000000000000000000000000000000000000000000000600000003,
+        232: 0x800000000000000000000000000000000000000000000000000C000003,
+        240: 0x800000000000000000000000000000000000000000000000003000000003,
+        248: 0x80000000000000000000000000000000000000000C00000000000000000003,
+        256: 0x8000000000000000000000000000000000000000000000000030000000000003,
+    }
+
+    def __init__(self, nome:str, largura:int, polinomio:int, refletido:bool = False, inicial:int = 0, xor_final:int = 0):
+        if largura < 8:
+            raise ValueError(f"Largura de CRC inválida: {largura} (mínimo 8 bits)")
+        self.nome = nome
+        self.largura = largura                      # Bits do CRC
+        self.polinomio = polinomio                  # Polinômio gerador (sem o termo x^largura)
+        self.refletido = refletido                  # Bits de cada byte processados do LSB pro MSB (ex: CRC-32)
+        self.inicial = inicial                      # Valor inicial do registrador
+        self.xor_final = xor_final                  # XOR aplicado no resultado
+        self.mascara = (1 << largura) - 1
+        self.num_bytes = (largura + 7) // 8         # Bytes do CRC no final do quadro
+        self.tabelas = CRC.tabelas(largura, polinomio, refletido)
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def obter(largura:int, polinomio:int, refletido:bool = False, inicial:int = 0, xor_final:int = 0, nome:str = None) -> "CRC":
+        """
+        Monta (uma única vez por combinação de parâmetros) um CRC qualquer.
+
+        Parâmetros:
+        • largura (int): Bits do CRC.
+        • polinomio (int): Polinômio gerador (sem o termo x^largura).
+        • refletido (bool): Processa os bits de cada byte do LSB pro MSB.
+        • inicial (int): Valor inicial do registrador.
+        • xor_final (int): XOR aplicado no resultado.
+        • nome (str): Nome pra exibição.
+
+        Retorna:
+        • CRC: Motor de CRC com as tabelas prontas.
+        """
+        return CRC(nome or f"CRC-{largura}", largura, polinomio, refletido, inicial, xor_final)
+
+
+    @staticmethod
+    def por_nome(nome:str) -> "CRC":
+        """
+        Escolhe algum CRC padronizado.
+
+        Parâmetros:
+        • nome (str): "CRC-8", "CRC-16-CCITT", "CRC-24", "CRC-32", "CRC-40-GSM" ou "CRC-64".
+
+        Retorna:
+        • CRC: Motor de CRC.
+        """
+        if nome not in CRC.PRESETS:
+            raise ValueError(f"CRC inválido: {nome}")
+        largura, polinomio, refletido, inicial, xor_final, _ = CRC.PRESETS[nome]
+        return CRC.obter(largura, polinomio, refletido, inicial, xor_final, nome)
+
+
+    @staticmethod
+    def por_largura(largura:int) -> "CRC":
+        """
+        Escolhe o CRC usado pra uma largura da GUI (8 a 256 bits, de 8 em 8).
+
+        Funcionamento:
+        • Larguras com CRC padronizado (8, 16, 24, 32, 40, 64) usam o padrão.
+        • As outras usam o polinômio da tabela POLINOMIOS_POR_LARGURA (valor inicial 0, sem reflexão).
+
+        Parâmetros:
+        • largura (int): Bits do CRC.
+
+        Retorna:
+        • CRC: Motor de CRC.
+        """
+        if largura in CRC.PRESET_POR_LARGURA:
+            return CRC.por_nome(CRC.PRESET_POR_LARGURA[largura])
+        if largura in CRC.POLINOMIOS_POR_LARGURA:
+            return CRC.obter(largura, CRC.POLINOMIOS_POR_LARGURA[largura])
+        raise ValueError(f"Sem polinômio de CRC para {largura} bits")
+
+
+    @staticmethod
+    def refletir(valor:int, largura:int) -> int:
+        """Inverte a ordem dos bits de valor (largura bits)"""
+        return int(f"{valor:0{largura}b}"[::-1], 2)
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def tabelas(largura:int, polinomio:int, refletido:bool) -> tuple:
+        """
+        Monta as 8 tabelas de 256 entradas usadas no slicing-by-8.
+
+        Funcionamento:
+        • T0[b]: efeito no registrador de processar o byte b (equivale aos 8 passos de deslocamento/XOR).
+        • Tk[b]: efeito do byte b seguido de k bytes zero (T0 aplicada mais k vezes).
+        • Como o CRC é linear, 8 bytes de uma vez = XOR de T7[byte 0], T6[byte 1], ..., T0[byte 7].
+
+        Parâmetros:
+        • largura (int): Bits do CRC.
+        • polinomio (int): Polinômio gerador (sem o termo x^largura).
+        • refletido (bool): Processa os bits de cada byte do LSB pro MSB.
+
+        Retorna:
+        • tuple: (T0, ..., T7), cada uma uma tupla de 256 inteiros.
+        """
+        mascara = (1 << largura) - 1
+        topo = 1 << (largura - 1)
+        polinomio_refletido = CRC.refletir(polinomio, largura)
+
+        t0 = []
+        for byte in range(256):
+            if refletido:
+                crc = byte
+                for _ in range(8):
+                    crc = (crc >> 1) ^ polinomio_refletido if crc & 1 else crc >> 1
+            else:
+                crc = byte << (largura - 8)
+                for _ in range(8):
+                    crc = ((crc << 1) ^ polinomio if crc & topo else crc << 1) & mascara
+            t0.append(crc)
+
+        tabelas = [t0]
+        for _ in range(7):
+            anterior = tabelas[-1]
+            if refletido:
+                tabelas.append([(crc >> 8) ^ t0[crc & 0xFF] for crc in anterior])
+            else:
+                tabelas.append([((crc << 8) & mascara) ^ t0[crc >> (largura - 8)] for crc in anterior])
+        return tuple(tuple(tabela) for tabela in tabelas)
+
+
+    def parametros(self) -> tuple:
+        """(largura, polinomio, refletido, inicial, xor_final): identifica o CRC"""
+        return (self.largura, self.polinomio, self.refletido, self.inicial, self.xor_final)
+
+
+    def registrador_inicial(self) -> int:
+        """Valor inicial do registrador (refletido, se o CRC for refletido)"""
+        return CRC.refletir(self.inicial, self.largura) if self.refletido else self.inicial
+
+
+    @staticmethod
+    def palavras(dados:bytes, ordem:str) -> array.array:
+        """
+        Lê os bytes (múltiplo de 8) como inteiros de 64 bits, sem fatiar byte a byte.
+
+        Parâmetros:
+        • dados (bytes): Bytes de entrada.
+        • ordem (str): "little" ou "big" (ordem dos bytes dentro de cada palavra).
+
+        Retorna:
+        • array.array: Palavras de 64 bits.
+        """
+        palavras = array.array('Q', dados)
+        if ordem != sys.byteorder:
+            palavras.byteswap()
+        return palavras
+
+
+    def atualizar(self, registrador:int, dados) -> int:
+        """
+        Processa mais bytes no registrador do CRC (slicing-by-8 + tabela byte a byte no resto).
+
+        Parâmetros:
+        • registrador (int): Estado atual (ex: registrador_inicial()).
+        • dados (bytes | bytearray | memoryview): Bytes a processar.
+
+        Retorna:
+        • int: Novo estado do registrador.
+        """
+        dados = bytes(dados)
+        t0, t1, t2, t3, t4, t5, t6, t7 = self.tabelas
+        mascara = self.mascara
+        fim = len(dados) - len(dados) % 8
+
+        if self.refletido:
+            # O registrador entra nos próximos bytes a partir do LSB
+            for palavra in CRC.palavras(dados[:fim], "little"):
+                x = registrador ^ palavra
+                registrador = ((x >> 64) ^ t7[x & 0xFF] ^ t6[(x >> 8) & 0xFF] ^ t5[(x >> 16) & 0xFF]
+                               ^ t4[(x >> 24) & 0xFF] ^ t3[(x >> 32) & 0xFF] ^ t2[(x >> 40) & 0xFF]
+                               ^ t1[(x >> 48) & 0xFF] ^ t0[(x >> 56) & 0xFF])
+            for byte in dados[fim:]:
+                registrador = (registrador >> 8) ^ t0[(registrador ^ byte) & 0xFF]
+        else:
+            # O registrador entra nos próximos bytes a partir do MSB (alinha os dois em max(largura, 64) bits)
+            s = max(self.largura - 64, 0)
+            alinhamento = max(64 - self.largura, 0)
+            for palavra in CRC.palavras(dados[:fim], "big"):
+                x = (registrador << alinhamento) ^ (palavra << s)
+                registrador = (((x << 64) & mascara) ^ t7[(x >> (s + 56)) & 0xFF] ^ t6[(x >> (s + 48)) & 0xFF]
+                               ^ t5[(x >> (s + 40)) & 0xFF] ^ t4[(x >> (s + 32)) & 0xFF] ^ t3[(x >> (s + 24)) & 0xFF]
+                               ^ t2[(x >> (s + 16)) & 0xFF] ^ t1[(x >> (s + 8)) & 0xFF] ^ t0[(x >> s) & 0xFF])
+            deslocamento = self.largura - 8
+            for byte in dados[fim:]:
+                registrador = ((registrador << 8) & mascara) ^ t0[((registrador >> deslocamento) ^ byte) & 0xFF]
+        return registrador
+
+
+    def finalizar(self, registrador:int) -> int:
+        """Converte o registrador no valor do CRC (aplica o XOR final)"""
+        return registrador ^ self.xor_final
+
+
+    def calcular(self, dados) -> int:
+        """
+        Calcula o CRC de uma sequência de bytes.
+
+        Parâmetros:
+        • dados (bytes | bytearray | memoryview): Bytes de entrada.
+
+        Retorna:
+        • int: Valor do CRC (largura bits).
+
+        Exemplo:
+            CRC.por_nome("CRC-32").calcular(b"123456789") → 0xCBF43926
+        """
+        return self.finalizar(self.atualizar(self.registrador_inicial(), dados))
+
+
+    def calcular_bytes(self, dados) -> bytes:
+        """CRC de dados em num_bytes bytes (big-endian), como vai no final do quadro"""
+        return self.calcular(dados).to_bytes(self.num_bytes, byteorder='big')
+
+
+    def novo(self, dados=b"") -> "CalculoCRC":
+        """
+        Cria um cálculo incremental deste CRC (estilo hashlib).
+
+        Parâmetros:
+        • dados (bytes | bytearray | memoryview): Primeiros bytes (opcional).
+
+        Retorna:
+        • CalculoCRC: Objeto com update()/digest()/verify()/combine().
+
+        Exemplo:
+            calculo = CRC.por_nome("CRC-32").novo()
+            calculo.update(b"12345"); calculo.update(b"6789")
+            calculo.hexdigest() → "cbf43926"
+        """
+        return CalculoCRC(self, dados)
+
+
+    def multiplicar_mod(self, a:int, b:int) -> int:
+        """Produto a·b mod g(x) dos polinômios em GF(2) (bit i = coeficiente de x^i; a e b < 2^largura)"""
+        modulo = (1 << self.largura) | self.polinomio
+        resultado = 0
+        while b:
+            if b & 1:
+                resultado ^= a
+            b >>= 1
+            a <<= 1
+            if a >> self.largura:
+                a ^= modulo
+        return resultado
+
+
+    def deslocar_zeros(self, registrador:int, num_bytes:int) -> int:
+        """
+        Estado do registrador depois de processar num_bytes bytes zero, em O(log num_bytes).
+
+        Funcionamento:
+        • Processar um byte zero multiplica o registrador por x^8 (mod g(x)).
+        • Calcula x^(8·num_bytes) mod g(x) por quadrados sucessivos e multiplica uma vez só.
+        • CRC refletido: o registrador é refletido antes e depois (os bits estão em ordem invertida).
+        """
+        if num_bytes == 0:
+            return registrador
+
+        potencia, base, expoente = 1, 2, 8 * num_bytes  # base = x
+        while expoente:
+            if expoente & 1:
+                potencia = self.multiplicar_mod(potencia, base)
+            base = self.multiplicar_mod(base, base)
+            expoente >>= 1
+
+        if self.refletido:
+            registrador = CRC.refletir(registrador, self.largura)
+        registrador = self.multiplicar_mod(registrador, potencia)
+        return CRC.refletir(registrador, self.largura) if self.refletido else registrador
+
+
+    def combinar(self, crc_a:int, crc_b:int, tamanho_b:int) -> int:
+        """
+        CRC de A + B a partir do CRC de A, do CRC de B e do tamanho de B (como o crc32_combine do zlib).
+
+        Funcionamento:
+        • O CRC é linear: processar B a partir do estado de A = (A deslocado por len(B) zeros) ⊕ (B a partir de zero).
+        • O CRC de B foi calculado a partir do valor inicial, então o valor inicial deslocado é descontado.
+
+        Parâmetros:
+        • crc_a (int): CRC do primeiro trecho.
+        • crc_b (int): CRC do segundo trecho (calculado de forma independente, ex: em outro processo).
+        • tamanho_b (int): Bytes do segundo trecho.
+
+        Retorna:
+        • int: CRC dos dois trechos concatenados.
+        """
+        registrador_a = crc_a ^ self.xor_final
+        registrador_b = crc_b ^ self.xor_final
+        deslocado = self.deslocar_zeros(registrador_a ^ self.registrador_inicial(), tamanho_b)
+        return self.finalizar(deslocado ^ registrador_b)
+
+
+class CalculoCRC:
+    """
+    Cálculo incremental de um CRC, com a interface dos objetos do hashlib.
+
+    • Recebe os dados em pedaços (ex: conforme chegam do socket), sem juntar o quadro inteiro na memória.
+    • combine() junta CRCs de trechos calculados separadamente (ex: em processos diferentes).
+    """
+    def __init__(self, motor:CRC, dados=b""):
+        self.motor = motor                                  # CRC usado (tabelas e parâmetros)
+        self.registrador = motor.registrador_inicial()      # Estado atual do cálculo
+        self.tamanho = 0                                    # Bytes processados até agora
+        self.name = motor.nome
+        self.digest_size = motor.num_bytes
+        if dados:
+            self.update(dados)
+
+
+    def update(self, dados) -> None:
+        """Processa mais bytes (bytes, bytearray ou memoryview)"""
+        self.registrador = self.motor.atualizar(self.registrador, dados)
+        self.tamanho += len(dados)
+
+
+    def valor(self) -> int:
+        """CRC dos bytes processados até agora (inteiro)"""
+        return self.motor.finalizar(self.registrador)
+
+
+    def digest(self) -> bytes:
+        """CRC em digest_size bytes (big-endian), como vai no final do quadro"""
+        return self.valor().to_bytes(self.digest_size, byteorder='big')
+
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+
+    def copy(self) -> "CalculoCRC":
+        copia = CalculoCRC(self.motor)
+        copia.registrador, copia.tamanho = self.registrador, self.tamanho
+        return copia
+
+
+    def verify(self, crc_recebido) -> bool:
+        """
+        Compara o CRC calculado com o CRC recebido.
+
+        Parâmetros:
+        • crc_recebido (bytes | int): CRC que veio no final do quadro.
+
+        Retorna:
+        • bool: True se forem iguais.
+        """
+        if isinstance(crc_recebido, int):
+            return self.valor() == crc_recebido
+        return self.digest() == bytes(crc_recebido)
+
+
+    def combine(self, outro:"CalculoCRC") -> "CalculoCRC":
+        """
+        Junta com o cálculo de um trecho seguinte, feito de forma independente.
+
+        Parâmetros:
+        • outro (CalculoCRC): Cálculo dos bytes que vêm depois destes (mesmo CRC).
+
+        Retorna:
+        • CalculoCRC: Cálculo equivalente a processar os dois trechos em sequência.
+        """
+        if outro.motor.parametros() != self.motor.parametros():
+            raise ValueError(f"Não é possível combinar {self.name} com {outro.name}")
+        junto = CalculoCRC(self.motor)
+        valor = self.motor.combinar(self.valor(), outro.valor(), outro.tamanho)
+        junto.registrador = valor ^ self.motor.xor_final
+        junto.tamanho = self.tamanho + outro.tamanho
+        return junto
@@ -1,6 +1,14 @@
-import src.Utils as Utils
+import re
+import functools
+import numpy as np
+from src.Bits import Bits
+from src.CRC import CRC
+from src.Hamming import Hamming
 
 class Enlace:
+    # EDCs do Hamming (7,4) (tabelas de 1 byte por palavra, com decisão suave no receptor)
+    HAMMING_7_4 = ("Hamming", "Hamming compactado")
+
     @staticmethod
     def enquadramento(tipo:str, dado:bytes) -> bytes:
         """
@@ -29,11 +37,12 @@ class Enlace:
 
         Parâmetros:
         • tipo (str): Tipo de enquadramento.
-        • dado (bytes): Quadro enquadrado.
+        • dado (bytes | Bits): Quadro enquadrado.
 
         Retorna:
         • bytes: Dados da camada de aplicação.
         """
+        dado = bytes(dado) # Bits vindos da camada física → bytes
         unframed_msg = ''
         if(tipo == "Contagem de caracteres"):
             return Enlace.desenquadrar_contagem_caracteres(dado)
@@ -44,24 +53,33 @@ class Enlace:
         raise ValueError(f"Tipo de enquadramento inválido: {tipo}")
 
     @staticmethod
-    def aplicar_edc(tipo:str, quadro:bytes, edc:int) -> bytes:
+    def aplicar_edc(tipo:str, quadro:bytes, edc:int, entrelacamento:int = 1) -> bytes:
         if tipo == "Bit de paridade par":
             return Enlace.bit_de_paridade_par(quadro)
         elif tipo == "CRC":
             return Enlace.crc(quadro, edc)
         elif tipo == "Hamming":
             return Enlace.hamming(quadro)
+        elif tipo == "Hamming compactado":
+            return Enlace.hamming(quadro, compactar=True)
+        elif tipo in Hamming.NOMES:
+            return Enlace.hamming_generico(quadro, tipo, entrelacamento)
         raise ValueError(f"Tipo de EDC inválido: {tipo}")
 
    
     @staticmethod
-    def verificar_edc(tipo:str, quadro:bytes, edc:int) -> bytes:
+    def verificar_edc(tipo:str, quadro:bytes, edc:int, entrelacamento:int = 1) -> bytes:
+        quadro = bytes(quadro) # Bits vindos da camada física → bytes
         if tipo == "Bit de paridade par":
             return Enlace.verifica_bit_de_paridade_par(quadro)
         elif tipo == "CRC":
             return Enlace.verifica_crc(quadro, edc)
         elif tipo == "Hamming":
             return Enlace.verifica_hamming(quadro)
+        elif tipo == "Hamming compactado":
+            return Enlace.verifica_hamming(quadro, compactado=True)
+        elif tipo in Hamming.NOMES:
+            return Enlace.verifica_hamming_generico(quadro, tipo, entrelacamento)
         raise ValueError(f"Tipo de EDC inválido: {tipo}")
 
     
@@ -118,85 +136,75 @@ class Enlace:
             Caso haja uma flag "acidental" na mensagem, é adicionado um caractere de escape. Ex: mensagem = flagRANTE -> flag + esc + flagRANTE + flag.
             Caso um caractere de escape "acidental", é adicionado um outro caractere de escape antes do esc. Ex: mensagem = escOLA -> flag + esc + escOLA + flag.
 
+        Funcionamento:
+        • Cada substituição percorre os dados uma única vez (bytes.replace), em tempo linear.
+        • Funciona com qualquer payload binário (bytes, bytearray ou memoryview).
+
         Parâmetros:
-        • quadro (bytes): Quadro com o byte de tamanho seguido do payload.
-        • flag (bytes): Flag de sinal.
-        • esc (bytes): caractere de escape.
+        • dado (bytes): Dados da camada de aplicação.
+        • flag (bytes): Flag de sinal (1 byte).
+        • esc (bytes): caractere de escape (1 byte).
 
         Retorna:
-        • bytes: Apenas o payload (dados da camada de aplicação).
+        • bytes: Quadro enquadrado (flag + dados com escapes + flag).
+        """
+        # Escapes primeiro, pra não escapar os escapes inseridos antes das flags
+        dado = bytes(dado).replace(esc, esc + esc).replace(flag, esc + flag)
+        return flag + dado + flag
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def padroes_insercao_byte(flag:bytes, esc:bytes) -> tuple:
         """
-        if flag in dado:
-           esc_pos = Utils.findall(esc, dado)
-           for pos in range(0, len(esc_pos)):
-               offset = len(esc) * pos
-               
-               dado = dado[:(esc_pos[pos] + offset)] + esc + dado[(esc_pos[pos] + offset):]
+        Expressões regulares (compiladas uma única vez) do enquadramento por inserção de bytes.
 
-           flag_pos = Utils.findall(flag, dado)
-           for pos in range(0, len(flag_pos)):
-               offset = len(esc) * pos
-               dado = dado[:(flag_pos[pos] + offset)] + esc + dado[(flag_pos[pos] + offset):]            
-        return (flag + dado + flag)
+        Retorna:
+        • tuple: (conteúdo válido entre as flags, escape + byte escapado).
+        """
+        if len(flag) != 1 or len(esc) != 1:
+            raise ValueError("Flag e escape precisam ter 1 byte")
+        f, e = re.escape(flag), re.escape(esc)
+        conteudo = b"(?:[^" + f + e + b"]|" + e + b".)*"          # Bytes comuns ou pares escape + byte
+        return re.compile(conteudo, re.DOTALL), re.compile(e + b"(.)", re.DOTALL)
 
     @staticmethod
-    def desenquadrar_flag_insercao_byte(quadro: bytes, flag=b'\x7E', esc='\x7D') -> bytes:
+    def desenquadrar_flag_insercao_byte(quadro: bytes, flag=b'\x7E', esc=b'\x7D') -> bytes:
         """
         Desenquadramento por insercao de bytes.
 
         Dinâmica:
             Remove as flags do inicio e do final do quadro.
             Remove os caracteres de escape inseridos, reconstruindo a mensagem original.
-            Quando encontra um escape, remove-o e mantém o próximo bloco (seja flag ou escape) como dado.
+            Quando encontra um escape, remove-o e mantém o próximo byte (seja flag ou escape) como dado.
+
+        Funcionamento:
+        • Valida e remove os escapes com expressões regulares sobre os bytes (uma passada, sem decodificar texto).
 
         Parâmetros:
-        • quadro (bytes): Quadro enquadrado a ser processado.
-        • flag (string): Flag de sinal utilizada no enquadramento.
-        • esc (string): Caractere de escape utilizado no enquadramento.
+        • quadro (bytes): Quadro enquadrado a ser processado (bytes, bytearray ou memoryview).
+        • flag (bytes): Flag de sinal utilizada no enquadramento.
+        • esc (bytes): Caractere de escape utilizado no enquadramento.
 
         Retorna:
         • bytes: Dados originais (payload da camada de aplicação).
 
         Exceções:
-        • ValueError: Se o quadro não tiver formato válido (UTF-8, flags ausentes ou escape incompleto).
+        • ValueError: Se o quadro não tiver formato válido (flags ausentes, flag sem escape ou escape incompleto).
         """
-        try:
-            quadro_str = quadro.decode("utf-8")
-        except UnicodeDecodeError as e:
-            raise ValueError("Quadro não é UTF-8 válido") from e
-
-        len_flag = len(flag)
-        len_quadro = len(quadro_str)
+        conteudo, escape = Enlace.padroes_insercao_byte(flag, esc)
+        quadro = bytes(quadro)
 
-        if len_quadro < 2 * len_flag:
+        if len(quadro) < 2:
             raise ValueError("Quadro muito curto")
 
         if not (quadro.startswith(flag) and quadro.endswith(flag)):
             raise ValueError("Flags de início/fim ausentes")
 
-        # Remove flags externas
-        dado_sem_flag = quadro_str[len_flag:len_quadro - len_flag]
-        len_esc = len(esc)
-        resultado = []
-        i = 0
-        n = len(dado_sem_flag)
-
-        # Processa o conteúdo removendo escapes
-        while i < n:
-            # Verifica se há uma ocorrência de escape na posição atual
-            if i + len_esc <= n and dado_sem_flag[i:i+len_esc] == esc:
-                i += len_esc  # Pula o escape
-                if i + len_esc > n:
-                    raise ValueError("Escape incompleto")
-                # Mantém o próximo bloco (dado original)
-                resultado.append(dado_sem_flag[i:i+len_esc])
-                i += len_esc
-            else:
-                # Adiciona caracteres normais
-                resultado.append(dado_sem_flag[i])
-                i += 1
-
-        return ''.join(resultado).encode("utf-8")
+        # Remove flags externas e confere se o resto só tem bytes comuns ou escapes completos
+        dado_sem_flag = quadro[1:-1]
+        if not conteudo.fullmatch(dado_sem_flag):
+            raise ValueError("Escape incompleto ou flag sem escape dentro do quadro")
+        return escape.sub(rb"\1", dado_sem_flag)
 
     @staticmethod
     def enquadrar_flag_insercao_bit(dado:bytes) -> bytes:
@@ -207,6 +215,10 @@ class Enlace:
             Insere um 0 após 5 bits 1 consecutivos para evitar sequência de flag.
             Garante que o byte 0x7E nunca apareça dentro do quadro, somente nas extremidades.
 
+        Funcionamento:
+        • Encontra todas as sequências de 1s de uma vez (corridas_de_uns).
+        • Regra: depois de cada 5 bits 1 seguidos, entra um 0 (todos inseridos de uma vez com np.insert).
+
         Parâmetro:
         dados (bytes): Conteúdo da carga útil.
 
@@ -215,43 +227,27 @@ class Enlace:
         """
         FLAG = b'\x7E' # Delimitador padrão usado do protocolo HDLC (01111110)
 
-        # Converte os dados em string de bits
-        bit_str = ''.join(f'{byte:08b}' for byte in dado)
-
-        bits_preenchidos = []  # Lista para armazenar os bits com stuffing
-        cont_1bit = 0  # Contador de bits 1 consecutivos
-
-        # Percorre cada bit da mensagem original
-        for bit in bit_str:
-            if bit == '1':
-                cont_1bit += 1
-            else:
-                cont_1bit = 0  # Reinicia o contador se for 0
-
-            bits_preenchidos.append(bit)
-
-            # Se já houver 5 bits 1 consecutivos, insere um bit 0
-            if cont_1bit == 5:
-                bits_preenchidos.append('0')
-                cont_1bit = 0  # Reinicia após inserção
-
-        # Garante que a quantidade total de bits seja múltipla de 8
-        while len(bits_preenchidos) % 8 != 0:
-            bits_preenchidos.append('0')
-
-        # Agrupa os bits de 8 em 8 e converte para bytes
-        bytes_preenchidos = bytes(
-            int(''.join(bits_preenchidos[i:i+8]), 2)
-            for i in range(0, len(bits_preenchidos), 8)
-        )
-        # Adiciona FLAG 0x7E no início e no final
-        return FLAG + bytes_preenchidos + FLAG
+        bits = np.unpackbits(np.frombuffer(bytes(dado), dtype=np.uint8))
+        inicios, tamanhos = Enlace.corridas_de_uns(bits)
+
+        # Posição de cada 0 inserido: inicio + 5k (k = 1 .. L // 5 em cada sequência)
+        insercoes = tamanhos // 5
+        sequencia = np.repeat(np.arange(len(inicios)), insercoes)
+        k = np.arange(len(sequencia)) - np.repeat(np.cumsum(insercoes) - insercoes, insercoes) + 1
+        bits_preenchidos = np.insert(bits, inicios[sequencia] + 5 * k, 0)
+
+        # packbits completa com zeros até múltiplo de 8
+        return FLAG + np.packbits(bits_preenchidos).tobytes() + FLAG
     
     @staticmethod
     def desenquadrar_flag_insercao_bit(quadro:bytes) -> bytes:
         """
         Desfaz o enquadramento por inserção de bits (bit stuffing) com FLAG 0x7E.
 
+        Funcionamento:
+        • Regra: depois de cada 5 bits 1 seguidos, o próximo bit é o inserido e é removido (a contagem recomeça depois dele).
+        • Remove todos de uma vez com np.delete e descarta o padding (bits que sobram do último byte).
+
         Parâmetro:
         quadro (bytes): Quadro recebido com flags e bit stuffing aplicado.
 
@@ -261,140 +257,298 @@ class Enlace:
         FLAG = b'\x7E'  # FLAG padrão (01111110)
 
         # Remove as flags externas (primeiro e último byte)
+        quadro = bytes(quadro)
         if quadro[0:1] != FLAG or quadro[-1:] != FLAG:
             raise ValueError("FLAG de delimitação ausente no quadro")
         quadro = quadro[1:-1]  # Remove as flags
 
-        # Converte o quadro (ainda com bit stuffing) para string de bits
-        bit_str = ''.join(f'{byte:08b}' for byte in quadro)
-
-        # Remove o stuffing: elimina o 0 inserido após cinco 1 consecutivos
-        bits_desenquadrados = []
-        cont_1bit = 0
-        i = 0
-        while i < len(bit_str):
-            bit = bit_str[i]
-            bits_desenquadrados.append(bit)
-            if bit == '1':
-                cont_1bit += 1
-                if cont_1bit == 5:
-                    i += 1  # Pula o bit 0 inserido (stuffed bit)
-                    cont_1bit = 0
-            else:
-                cont_1bit = 0
-            i += 1
+        bits = np.unpackbits(np.frombuffer(quadro, dtype=np.uint8))
+        inicios, tamanhos = Enlace.corridas_de_uns(bits)
+
+        # Bits removidos em cada sequência: (L + 1) // 6 (o último pode ser o 0 logo depois dela)
+        remocoes = (tamanhos + 1) // 6
+        sequencia = np.repeat(np.arange(len(inicios)), remocoes)
+        j = np.arange(len(sequencia)) - np.repeat(np.cumsum(remocoes) - remocoes, remocoes)
+        posicoes = inicios[sequencia] + 5 + 6 * j
+        bits_desenquadrados = np.delete(bits, posicoes[posicoes < len(bits)])
 
         # Remove bits adicionais adicionados para alinhamento (zero padding)
-        while len(bits_desenquadrados) % 8 != 0:
-            bits_desenquadrados.pop()
-
-        # Converte os bits de volta para bytes
-        dados = bytes(
-            int(''.join(bits_desenquadrados[i:i+8]), 2)
-            for i in range(0, len(bits_desenquadrados), 8)
-        )
-        return dados
+        bits_desenquadrados = bits_desenquadrados[:len(bits_desenquadrados) // 8 * 8]
+        return np.packbits(bits_desenquadrados).tobytes()
+
+    @staticmethod
+    def corridas_de_uns(bits:np.ndarray) -> tuple:
+        """
+        Encontra as sequências de bits 1 consecutivos (run-length), sem percorrer bit a bit.
+
+        Parâmetro:
+        bits (np.ndarray): Um bit (0/1) por posição.
+
+        Retorna:
+        tuple: (posição inicial, tamanho) de cada sequência, como arrays.
+        """
+        bordas = np.diff(np.concatenate([[0], bits.astype(np.int8), [0]]))
+        inicios = np.flatnonzero(bordas == 1)
+        fins = np.flatnonzero(bordas == -1)
+        return inicios, fins - inicios
         
     @staticmethod
-    def hamming(dado: bytes) -> bytes:
+    def hamming(dado: bytes, compactar: bool = False) -> bytes:
         """
         Codifica os dados usando o código de Hamming (7,4).
 
+        Funcionamento:
+        • Separa todos os bytes em nibbles (alto, baixo) de uma vez.
+        • Troca cada nibble pela sua palavra-código na tabela de 16 entradas (indexação do NumPy).
+        • Compactado: junta as palavras de 7 bits em sequência, sem o bit não usado
+          (14 bits por byte de dados em vez de 16; o último byte é completado com zeros).
+
         Parâmetros:
         • data (bytes): Dados de entrada a serem codificados, byte a byte.
+        • compactar (bool): Junta as palavras de 7 bits em sequência.
 
         Retorna:
-        • bytes: Dados codificados com código Hamming (7,4)
+        • bytes: Dados codificados com código Hamming (7,4), um byte [0, p1, p2, d1, p3, d2, d3, d4] por nibble
+          (ou as palavras de 7 bits em sequência, se compactar)
         """
-        def calcular_bits_paridade(bits_dados: list) -> tuple:
-            p1 = bits_dados[0] ^ bits_dados[1] ^ bits_dados[3]  # p1 = d1 ⊕ d2 ⊕ d4
-            p2 = bits_dados[0] ^ bits_dados[2] ^ bits_dados[3]  # p2 = d1 ⊕ d3 ⊕ d4
-            p3 = bits_dados[1] ^ bits_dados[2] ^ bits_dados[3]  # p3 = d2 ⊕ d3 ⊕ d4
-            return p1, p2, p3
-
-        codificacao_bytes = [] # Lista que vai armazenar os bytes codificados
+        dado = np.frombuffer(bytes(dado), dtype=np.uint8)
+        nibbles = np.stack([dado >> 4, dado & 0b1111], axis=1).ravel()
+        palavras = Enlace.palavras_hamming()[nibbles]
+        if compactar:
+            return np.packbits(np.unpackbits(palavras[:, None], axis=1)[:, 1:]).tobytes()
+        return palavras.tobytes()
 
-        for byte in dado:
-            # Divide o byte em dois nibbles
-            nibbles = [(byte >> 4) & 0b1111, byte & 0b1111]
+    @staticmethod
+    def palavras_compactadas(bits) -> np.ndarray:
+        """
+        Separa as palavras de 7 bits de um quadro Hamming compactado.
 
-            for nibble in nibbles:
-                # Converte o nibble em uma lista de bits [d1, d2, d3, d4]
-                bits_dados = [(nibble >> j) & 1 for j in range(3, -1, -1)]
+        • O padding final tem menos de 7 bits (0, 2, 4 ou 6), então o número de palavras é ⌊bits / 7⌋.
 
-                # Calcula os bits de paridade p1, p2, p3
-                p1, p2, p3 = calcular_bits_paridade(bits_dados)
+        Parâmetros:
+        • bits (np.ndarray): Bits (ou valores suaves) do quadro, um por posição.
 
-                # Organiza os bits no formato [p1, p2, d1, p3, d2, d3, d4]
-                bloco_hamming = [
-                    p1,
-                    p2,
-                    bits_dados[0],
-                    p3,
-                    bits_dados[1],
-                    bits_dados[2],
-                    bits_dados[3]
-                ]
+        Retorna:
+        • np.ndarray: Matriz palavras × 7.
+        """
+        return bits[:len(bits) // 7 * 7].reshape(-1, 7)
 
-                # Converte os 7 bits para um byte (bit mais significativo não usado)
-                byte_codificado = 0
-                for i, bit in enumerate(bloco_hamming):
-                    byte_codificado |= bit << (6 - i) # Alinha o bit na posição certa
+    @staticmethod
+    def verifica_hamming(quadro: bytes, compactado: bool = False) -> bytes:
+        """
+        Verifica e corrige os dados codificados com o código de Hamming (7,4).
 
-                # Adiciona o byte codificado à lista
-                codificacao_bytes.append(byte_codificado)
+        Parâmetros:
+            quadro (bytes): Dados codificados com Hamming (7,4).
+            compactado (bool): Quadro com as palavras de 7 bits em sequência (ver hamming).
 
-        # Converte a lista para bytes e retorna
-        return bytes(codificacao_bytes)
+        Retorna:
+            bytes: Dados corrigidos e decodificados (sem bits de paridade).
+        """
+        return Enlace.corrige_hamming(quadro, compactado=compactado)[0]
 
     @staticmethod
-    def verifica_hamming(quadro: bytes) -> bytes:
+    def corrige_hamming(quadro: bytes, palavras_por_bloco: int = 2, compactado: bool = False) -> tuple:
         """
-        Verifica e corrige os dados codificados com o código de Hamming (7,4).
+        Decodifica o Hamming (7,4) e conta as correções, numa única passada.
+
+        Funcionamento:
+        • Os 7 bits úteis de cada byte indexam a tabela de síndromes (128 entradas),
+          que já dá o nibble corrigido e se houve correção, para todas as palavras de uma vez.
+        • Junta os nibbles de 2 em 2 para formar os bytes originais.
 
         Parâmetros:
             quadro (bytes): Dados codificados com Hamming (7,4).
+            palavras_por_bloco (int): Palavras-código por bloco na contagem (padrão: 2 = 1 byte de dados).
+            compactado (bool): Quadro com as palavras de 7 bits em sequência (ver hamming).
 
         Retorna:
-            bytes: Dados corrigidos e decodificados (sem bits de paridade).
+            tuple: (dados corrigidos e decodificados (bytes), palavras corrigidas em cada bloco (np.ndarray)).
+        """
+        nibbles_corrigidos, corrigidas = Enlace.sindromes_hamming()
+        quadro = np.frombuffer(bytes(quadro), dtype=np.uint8)
+        if compactado:
+            bits = Enlace.palavras_compactadas(np.unpackbits(quadro))
+            palavras = (bits @ (1 << np.arange(6, -1, -1))).astype(np.uint8)
+        else:
+            palavras = quadro & 0x7F
+        nibbles = nibbles_corrigidos[palavras]
+
+        # Combina nibbles para formar bytes originais (último nibble sozinho é preenchido com 0)
+        if len(nibbles) % 2:
+            nibbles = np.append(nibbles, 0)
+        dados = ((nibbles[0::2] << 4) | nibbles[1::2]).astype(np.uint8).tobytes()
+
+        inicios = np.arange(0, len(palavras), palavras_por_bloco)
+        correcoes = np.add.reduceat(corrigidas[palavras].astype(np.int64), inicios) if len(palavras) else np.zeros(0, dtype=np.int64)
+        return dados, correcoes
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def palavras_hamming() -> np.ndarray:
+        """
+        Tabela das 16 palavras-código Hamming (7,4), indexada pelo nibble de dados.
+
+        Funcionamento:
+        • p1 = d1 ⊕ d2 ⊕ d4, p2 = d1 ⊕ d3 ⊕ d4, p3 = d2 ⊕ d3 ⊕ d4.
+        • Bits organizados no formato [0, p1, p2, d1, p3, d2, d3, d4] (bit mais significativo não usado).
+
+        Retorna:
+        • np.ndarray: 16 bytes (uint8).
+        """
+        nibbles = np.arange(16, dtype=np.uint8)
+        d1, d2, d3, d4 = (nibbles >> 3) & 1, (nibbles >> 2) & 1, (nibbles >> 1) & 1, nibbles & 1
+        p1 = d1 ^ d2 ^ d4
+        p2 = d1 ^ d3 ^ d4
+        p3 = d2 ^ d3 ^ d4
+        tabela = (p1 << 6) | (p2 << 5) | (d1 << 4) | (p3 << 3) | (d2 << 2) | (d3 << 1) | d4
+        tabela.setflags(write=False)
+        return tabela
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def sindromes_hamming() -> tuple:
+        """
+        Tabela de decodificação Hamming (7,4), indexada pelos 7 bits recebidos (128 entradas).
+
+        Funcionamento:
+        • Síndrome (s3 s2 s1) = posição do bit errado (1 a 7) ou 0 se não houver erro.
+        • Erro em bit de dado (posições 3, 5, 6, 7) é corrigido no nibble; erro em bit de paridade não muda os dados.
+
+        Retorna:
+        • tuple: (nibble corrigido de cada palavra (uint8), se a palavra tinha erro (bool)).
+        """
+        palavras = np.arange(128, dtype=np.uint8)
+        bits = np.unpackbits(palavras[:, None], axis=1)[:, 1:] # [p1, p2, d1, p3, d2, d3, d4] (posições 1 a 7)
+
+        # Síndrome: XOR das posições (1 a 7) dos bits 1
+        posicoes = np.arange(1, 8, dtype=np.uint8)
+        sindromes = np.bitwise_xor.reduce(bits * posicoes, axis=1)
+
+        # Corrige o bit apontado pela síndrome (os de paridade não entram no nibble)
+        corrigidos = bits.copy()
+        com_erro = sindromes != 0
+        corrigidos[com_erro, sindromes[com_erro] - 1] ^= 1
+        nibbles = (corrigidos[:, [2, 4, 5, 6]] @ np.array([8, 4, 2, 1])).astype(np.uint8) # d1 d2 d3 d4
+
+        for tabela in (nibbles, com_erro):
+            tabela.setflags(write=False)
+        return nibbles, com_erro
+
+    @staticmethod
+    def verifica_hamming_suave(valores, tamanho_bloco: int = 4096, compactado: bool = False) -> bytes:
+        """
+        Decodifica Hamming (7,4) por decisão suave (ver corrige_hamming_suave).
+
+        Parâmetros:
+        • valores (np.ndarray | list): Confiabilidade de cada bit do quadro (> 0 → bit 1), ex: CamadaFisica.demodulador_suave.
+        • tamanho_bloco (int): Palavras decodificadas por multiplicação de matrizes (limita a memória).
+        • compactado (bool): Quadro com as palavras de 7 bits em sequência (ver hamming).
+
+        Retorna:
+        • bytes: Dados decodificados (sem bits de paridade), como em verifica_hamming.
+        """
+        return Enlace.corrige_hamming_suave(valores, tamanho_bloco, compactado)[0]
+
+    @staticmethod
+    def corrige_hamming_suave(valores, tamanho_bloco: int = 4096, compactado: bool = False) -> tuple:
+        """
+        Decodifica Hamming (7,4) por decisão suave, direto das confiabilidades dos bits recebidos,
+        e informa quais palavras foram corrigidas.
+
+        Funcionamento:
+        • Agrupa os valores de 8 em 8 (um byte por palavra) e descarta o bit mais significativo (não usado).
+        • Correlaciona cada palavra recebida com as 16 palavras-código em ±1 (uma multiplicação de matrizes por bloco).
+        • Escolhe a palavra de maior correlação (máxima verossimilhança): corrige mais erros que a síndrome,
+          pois usa o quanto cada bit é confiável em vez de só o seu valor.
+        • Palavra corrigida = palavra escolhida diferente da decisão dura (sinal de cada valor) da palavra recebida.
+
+        Parâmetros:
+        • valores (np.ndarray | list): Confiabilidade de cada bit do quadro (> 0 → bit 1), ex: CamadaFisica.demodulador_suave.
+        • tamanho_bloco (int): Palavras decodificadas por multiplicação de matrizes (limita a memória).
+        • compactado (bool): Quadro com as palavras de 7 bits em sequência (ver hamming).
+
+        Retorna:
+        • tuple: (dados decodificados (bytes, como em verifica_hamming), palavras corrigidas (np.ndarray, 0/1 por palavra)).
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        if compactado:
+            recebidas = Enlace.palavras_compactadas(valores)
+        else:
+            recebidas = valores[:len(valores) // 8 * 8].reshape(-1, 8)[:, 1:] # Palavras × 7
+
+        # Palavras-código em ±1 (16 × 7)
+        palavras = np.unpackbits(Enlace.palavras_hamming()[:, None], axis=1)[:, 1:]
+        palavras_bipolar = 2 * palavras.astype(np.float64) - 1
+
+        nibbles = np.empty(len(recebidas), dtype=np.uint8)
+        for i in range(0, len(recebidas), tamanho_bloco):
+            correlacao = recebidas[i:i + tamanho_bloco] @ palavras_bipolar.T # Bloco × 16
+            nibbles[i:i + tamanho_bloco] = np.argmax(correlacao, axis=1)
+
+        # Decisão dura de cada palavra (7 bits) comparada com a palavra-código escolhida
+        duras = (recebidas > 0) @ (1 << np.arange(6, -1, -1))
+        correcoes = (duras != Enlace.palavras_hamming()[nibbles]).astype(np.int64)
+
+        # Combina nibbles para formar bytes originais (último nibble sozinho é preenchido com 0)
+        if len(nibbles) % 2:
+            nibbles = np.append(nibbles, 0)
+        return ((nibbles[0::2] << 4) | nibbles[1::2]).astype(np.uint8).tobytes(), correcoes
+
+    @staticmethod
+    def hamming_generico(quadro: bytes, tipo: str = "Hamming (15,11)", entrelacamento: int = 1) -> bytes:
         """
-        dados_decodificados = []
+        Codifica o quadro com um código de Hamming (2^m - 1, 2^m - 1 - m) ou SECDED (ver Hamming).
 
-        for byte in quadro:
-            # Obtém os bits do byte codificado (7 bits úteis)
-            bits = [(byte >> (6 - i)) & 1 for i in range(7)]
+        Parâmetros:
+            quadro (bytes): Dados a serem codificados.
+            tipo (str): Código. Ex: "Hamming (15,11)", "SECDED (64,57)".
+            entrelacamento (int): Profundidade do entrelaçador em bloco (1 = sem entrelaçamento).
+                                  Rajadas de até entrelacamento bits viram erros simples corrigíveis.
 
-            # Bits de paridade e dados:
-            p1, p2, d1, p3, d2, d3, d4 = bits
+        Retorna:
+            bytes: Palavras-código em sequência (completadas com zeros até múltiplo de 8 bits).
+        """
+        return Hamming.por_nome(tipo).codificar_bytes(quadro, entrelacamento)
 
-            # Calcula os bits de paridade esperados
-            s1 = p1 ^ d1 ^ d2 ^ d4
-            s2 = p2 ^ d1 ^ d3 ^ d4
-            s3 = p3 ^ d2 ^ d3 ^ d4
+    @staticmethod
+    def verifica_hamming_generico(quadro: bytes, tipo: str = "Hamming (15,11)", entrelacamento: int = 1) -> bytes:
+        """
+        Verifica e corrige os dados codificados com hamming_generico.
 
-            # Síndrome (posição do erro)
-            erro_pos = (s3 << 2) | (s2 << 1) | s1
+        Parâmetros:
+            quadro (bytes): Palavras-código recebidas.
+            tipo (str): Código usado na codificação.
+            entrelacamento (int): Profundidade do entrelaçador usada na codificação.
 
-            # Corrige o erro se for em bit de dado (posições 3,5,6,7)
-            if erro_pos in {3, 5, 6, 7}:
-                bits[erro_pos - 1] ^= 1  # Inverte o bit errado
-                # Atualiza os bits após correção
-                p1, p2, d1, p3, d2, d3, d4 = bits
+        Retorna:
+            bytes: Dados corrigidos e decodificados.
 
-            # Reconstrói o nibble (4 bits de dados)
-            nibble = (d1 << 3) | (d2 << 2) | (d3 << 1) | d4
-            dados_decodificados.append(nibble)
+        Exceção:
+            ValueError: Se o SECDED detectar erro duplo em alguma palavra.
+        """
+        return Enlace.corrige_hamming_generico(quadro, tipo, entrelacamento)[0]
 
-        # Combina nibbles para formar bytes originais
-        bytes_decodificados = bytearray()
-        for i in range(0, len(dados_decodificados), 2):
-            if i + 1 < len(dados_decodificados):
-                byte = (dados_decodificados[i] << 4) | dados_decodificados[i + 1]
-            else:
-                byte = dados_decodificados[i] << 4  # Último nibble (preenche com 0)
-            bytes_decodificados.append(byte)
+    @staticmethod
+    def corrige_hamming_generico(quadro: bytes, tipo: str = "Hamming (15,11)", entrelacamento: int = 1) -> tuple:
+        """
+        Decodifica o hamming_generico e informa as palavras corrigidas, numa única passada.
 
-        return bytes(bytes_decodificados)
+        Parâmetros:
+            quadro (bytes): Palavras-código recebidas.
+            tipo (str): Código usado na codificação.
+            entrelacamento (int): Profundidade do entrelaçador usada na codificação.
+
+        Retorna:
+            tuple: (dados corrigidos e decodificados (bytes), palavras corrigidas (np.ndarray de bool, uma por palavra)).
+
+        Exceção:
+            ValueError: Se o SECDED detectar erro duplo em alguma palavra.
+        """
+        dados, corrigidas, duplos = Hamming.por_nome(tipo).decodificar_bytes(quadro, entrelacamento)
+        if duplos.any():
+            raise ValueError(f"Erro duplo detectado em {int(duplos.sum())} palavra(s) {tipo}!")
+        return dados, corrigidas
 
     @staticmethod
     def bit_de_paridade_par(quadro:bytes) -> bytes:
@@ -420,11 +574,8 @@ class Enlace:
             Entrada: b's' → 01110010 (Número par de 1s) 
             Saída: 01110010 00000000 (Bit de paridade é zero)
         """
-        # Passa o quadro de bytes pra bits e remove espaços
-        bits = Utils.byte_formarter(quadro).replace(" ", "")
-
-        # Se o número de bits for ímpar, acrescenta o bit de paridade par
-        if (bits.count("1") % 2 != 0):
+        # Se o número de bits 1 for ímpar, acrescenta o bit de paridade par
+        if (Bits(quadro).contar_uns() % 2 != 0):
             return quadro + b"\x01"
         else:
             return quadro + b"\x00"
@@ -445,57 +596,43 @@ class Enlace:
             Entrada: b's' → 01110011 (Número ímpar de 1s) 
             Saída: ValueError: "Erro de paridade! número ímpar de bits 1."
         """
-        # Passa o quadro de bytes pra bits e remove espaços
-        bits = Utils.byte_formarter(quadro).replace(" ", "")
-
         # Verifica se o número de 1s é ímpar
-        if (bits.count("1") % 2 != 0):
+        if (Bits(quadro).contar_uns() % 2 != 0):
             raise ValueError("Erro de paridade! número ímpar de bits 1.")
         
         # Remove o último byte com o bit de paridade
         return quadro[:-1]
     
     @staticmethod
-    def crc(quadro: bytes, tamanho_do_edc: int = 8, polinomio: int = 0x07) -> bytes:
+    def crc(quadro: bytes, tamanho_do_edc: int = 8, polinomio: int = None) -> bytes:
         """
-        Aplica o código CRC no quadro, suportando tamanho de CRC variável (ex.: 8, 16, 32 bits).
+        Aplica o código CRC no quadro, suportando tamanho de CRC variável (8 a 256 bits).
+
+        Funcionamento:
+        • Usa o CRC da largura escolhida (CRC.por_largura): CRC-8, CRC-16-CCITT, CRC-32, CRC-64...
+        • Cálculo por tabela (slicing-by-8), em vez de 8 passos de deslocamento/XOR por byte.
 
         Parâmetros:
         • quadro (bytes): Quadro de entrada (sem CRC).
-        • polinomio (int): Polinômio gerador do CRC (padrão: 0x07).
         • tamanho_do_edc (int): Quantidade de bits do CRC (ex.: 8, 16, 32).
+        • polinomio (int): Polinômio gerador (opcional; padrão: o do CRC da largura).
 
         Retorna:
-        • bytes: Quadro com o CRC no final (em bytes).
+        • bytes: Quadro com o CRC no final (em bytes, big-endian).
         """
-        crc = 0
-        for byte in quadro:
-            crc ^= byte
-            for _ in range(8):
-                # Verifica o bit mais significativo (posição depende do tamanho do CRC)
-                if crc & (1 << (tamanho_do_edc - 1)):
-                    crc = (crc << 1) ^ polinomio
-                else:
-                    crc <<= 1
-                # Mantém o CRC com o tamanho correto (ex.: 8 bits → 0xFF, 16 bits → 0xFFFF)
-                crc &= (1 << tamanho_do_edc) - 1
-
-        # Calcula quantos bytes o CRC precisa para ser armazenado
-        num_bytes_crc = (tamanho_do_edc + 7) // 8
-        crc_bytes = crc.to_bytes(num_bytes_crc, byteorder='big')
-
-        return quadro + crc_bytes
+        motor = CRC.por_largura(tamanho_do_edc) if polinomio is None else CRC.obter(tamanho_do_edc, polinomio)
+        return quadro + motor.calcular_bytes(quadro)
 
 
     @staticmethod
-    def verifica_crc(quadro: bytes, tamanho_do_edc: int = 8, polinomio: int = 0x07) -> bytes:
+    def verifica_crc(quadro: bytes, tamanho_do_edc: int = 8, polinomio: int = None) -> bytes:
         """
         Verifica o CRC de tamanho variável no quadro (ex.: CRC-8, CRC-16, CRC-32).
 
         Parâmetros:
         • quadro (bytes): Quadro com o CRC no final.
-        • polinomio (int): Polinômio gerador do CRC.
         • tamanho_do_edc (int): Quantidade de bits do CRC (ex.: 8, 16, 32).
+        • polinomio (int): Polinômio gerador (opcional; padrão: o do CRC da largura).
 
         Retorna:
         • bytes: Quadro original sem o CRC (se válido).
@@ -503,21 +640,12 @@ class Enlace:
         Exceção:
         • ValueError: Se o CRC for inválido.
         """
-        num_bytes_crc = (tamanho_do_edc + 7) // 8  # Quantos bytes o CRC ocupa
-        crc = 0
+        motor = CRC.por_largura(tamanho_do_edc) if polinomio is None else CRC.obter(tamanho_do_edc, polinomio)
+        if len(quadro) < motor.num_bytes:
+            raise ValueError("Erro de CRC detectado! Quadro menor que o CRC.")
 
-        # Processa todos os bytes do quadro (incluindo o CRC no final)
-        for byte in quadro:
-            crc ^= byte
-            for _ in range(8):
-                if crc & (1 << (tamanho_do_edc - 1)):
-                    crc = (crc << 1) ^ polinomio
-                else:
-                    crc <<= 1
-                crc &= (1 << tamanho_do_edc) - 1  # Mantém o CRC com o tamanho correto
-
-        if crc != 0:
+        # Recalcula o CRC dos dados e compara com o CRC recebido
+        dados, crc_recebido = quadro[:-motor.num_bytes], quadro[-motor.num_bytes:]
+        if not motor.novo(dados).verify(crc_recebido):
             raise ValueError("Erro de CRC detectado!")
-
-        # Se CRC for válido, remove os bytes do CRC e retorna o quadro original
-        return quadro[:-num_bytes_crc]
+        return dados
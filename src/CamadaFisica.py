@@ -1,7 +1,15 @@
+import math
+import functools
+from fractions import Fraction
 import src.Utils as Utils
 import numpy as np
+from src.Bits import Bits
+from src.Constelacao import Constelacao
 
 class CamadaFisica:
+    # Maior número de fases do FSK guardado em tabela (acima disso, a fase é acumulada amostra a amostra)
+    MAX_FASES_FSK = 1024
+
     @staticmethod
     def codficador_banda_base(tipo, dado):
         """
@@ -9,10 +17,10 @@ class CamadaFisica:
 
         Parâmetros:
         • tipo (str): Tipo de codificação.
-        • dado (bytes): Quadro vindo da camada de enlace.
+        • dado (bytes | Bits): Quadro vindo da camada de enlace.
 
         Retorna:
-        • list[int]: Lista com o sinal codificado.
+        • np.ndarray: Array com o sinal codificado.
         """
         encoded_msg = ''
         if(tipo == "NRZ-Polar"):
@@ -36,19 +44,152 @@ class CamadaFisica:
 
 
     @staticmethod
-    def modulador(tipo, dado):
+    def modulador(tipo, dado, amostras_por_simbolo: int = 100, fs: int = 800, f0=2, f1=5):
         modulated_msg = ''
         if(tipo == "FSK"):
-            return CamadaFisica.modular_fsk(dado)
+            return CamadaFisica.modular_fsk(dado, f0, f1, amostras_por_simbolo, fs)
+        elif(tipo == "ASK"):
+             return CamadaFisica.modular_ask(dado, amostras_por_simbolo, fs)
+        elif(tipo in Constelacao.NOMES):
+            return CamadaFisica.modular_constelacao(dado, tipo, amostras_por_simbolo, fs)
+        raise ValueError(f"Tipo de modução inválida: {tipo}")
+
+    @staticmethod
+    def demodulador(tipo, sinal, amostras_por_simbolo: int = 100, fs: int = 800, f0=2, f1=5):
+        """
+        Escolhe e executa algum tipo de demodulação.
+
+        Parâmetros:
+        • tipo (str): Tipo de modulação.
+        • sinal (np.ndarray | list): Sinal analógico recebido (com ou sem ruído).
+        • amostras_por_simbolo (int): Número de amostras por símbolo (por bit no ASK/FSK).
+        • fs (int): Frequência de amostragem (Hz).
+        • f0, f1: Frequências dos bits 0 e 1 no FSK (Hz).
+
+        Retorna:
+        • Bits: Quadro da camada de enlace recuperado do sinal.
+        """
+        if(tipo == "FSK"):
+            return CamadaFisica.demodular_fsk(sinal, f0, f1, amostras_por_simbolo, fs)
+        elif(tipo == "ASK"):
+            return CamadaFisica.demodular_ask(sinal, amostras_por_simbolo, fs)
+        elif(tipo in Constelacao.NOMES):
+            return CamadaFisica.demodular_constelacao(sinal, tipo, amostras_por_simbolo, fs)
+        raise ValueError(f"Tipo de modução inválida: {tipo}")
+
+    @staticmethod
+    def demodulador_suave(tipo, sinal, amostras_por_simbolo: int = 100, fs: int = 800, f0=2, f1=5):
+        """
+        Escolhe e executa algum tipo de demodulação com decisão suave.
+
+        Parâmetros:
+        • tipo (str): Tipo de modulação.
+        • sinal (np.ndarray | list): Sinal analógico recebido (com ou sem ruído).
+        • amostras_por_simbolo (int): Número de amostras por símbolo (por bit no ASK/FSK).
+        • fs (int): Frequência de amostragem (Hz).
+        • f0, f1: Frequências dos bits 0 e 1 no FSK (Hz).
+
+        Retorna:
+        • np.ndarray: Confiabilidade de cada bit do quadro (> 0 → bit 1, < 0 → bit 0; quanto maior o módulo, mais confiável).
+        """
+        if(tipo == "FSK"):
+            return CamadaFisica.demodular_fsk_suave(sinal, f0, f1, amostras_por_simbolo, fs)
         elif(tipo == "ASK"):
-             return CamadaFisica.modular_ask(dado)
-        elif(tipo == "8-QAM"):
-            return CamadaFisica.modular_8qam(dado)
+            return CamadaFisica.demodular_ask_suave(sinal, amostras_por_simbolo, fs)
+        elif(tipo in Constelacao.NOMES):
+            return CamadaFisica.demodular_constelacao_suave(sinal, tipo, amostras_por_simbolo, fs)
         raise ValueError(f"Tipo de modução inválida: {tipo}")
     
 
     @staticmethod
-    def codificar_nrz_polar(dado: bytes) -> list:
+    def modulador_em_blocos(tipo, dados, amostras_por_bloco: int = 8192, amostras_por_simbolo: int = 100, fs: int = 800, f0=2, f1=5):
+        """
+        Modula um fluxo de pedaços de quadro, entregando o sinal em blocos de tamanho fixo.
+
+        Funcionamento:
+        • Recebe os bytes aos poucos (qualquer iterável de bytes) e modula cada pedaço assim que chega.
+        • Carrega o estado entre pedaços: fase acumulada (FSK) e bytes que ainda não fecham
+          um grupo de 8 símbolos (ex: 8-QAM: 3 bytes = 8 símbolos, sem padding no meio do fluxo).
+        • Reagrupa as amostras em blocos de amostras_por_bloco (o último pode ser menor).
+        • A concatenação dos blocos é igual ao sinal de modulador(tipo, quadro inteiro).
+
+        Parâmetros:
+        • tipo (str): Tipo de modulação.
+        • dados (Iterable[bytes]): Pedaços do quadro da camada de enlace.
+        • amostras_por_bloco (int): Número de amostras por bloco entregue.
+        • amostras_por_simbolo (int): Número de amostras por símbolo (por bit no ASK/FSK).
+        • fs (int): Frequência de amostragem (Hz).
+        • f0, f1: Frequências dos bits 0 e 1 no FSK (Hz).
+
+        Retorna:
+        • Generator[np.ndarray]: Blocos do sinal modulado.
+        """
+        bytes_por_grupo = 1
+        if tipo in Constelacao.NOMES:
+            bits_por_simbolo = Constelacao.por_nome(tipo).bits_por_simbolo
+            bytes_por_grupo = bits_por_simbolo // math.gcd(bits_por_simbolo, 8)
+        pendente = b""        # Bytes que ainda não fecham um grupo
+        fase = 0              # Fase acumulada do FSK (em passos de 2π/P)
+        resto = np.zeros(0)   # Amostras que ainda não fecham um bloco
+
+        for pedaco in dados:
+            pendente += bytes(pedaco)
+            usar = len(pendente) // bytes_por_grupo * bytes_por_grupo
+            grupo, pendente = pendente[:usar], pendente[usar:]
+
+            if tipo == "FSK":
+                amostras = CamadaFisica.modular_fsk(grupo, f0, f1, amostras_por_simbolo, fs, fase_inicial=fase)
+                fase = CamadaFisica.fase_final_fsk(grupo, f0, f1, amostras_por_simbolo, fs, fase_inicial=fase)
+            else:
+                amostras = CamadaFisica.modulador(tipo, grupo, amostras_por_simbolo, fs)
+
+            resto = np.concatenate([resto, amostras])
+            completos = len(resto) // amostras_por_bloco * amostras_por_bloco
+            for i in range(0, completos, amostras_por_bloco):
+                yield resto[i:i + amostras_por_bloco]
+            resto = resto[completos:]
+
+        # Fim do fluxo: modula o que sobrou (com o padding da constelação, se houver)
+        if pendente:
+            resto = np.concatenate([resto, CamadaFisica.modulador(tipo, pendente, amostras_por_simbolo, fs, f0, f1)])
+        for i in range(0, len(resto), amostras_por_bloco):
+            yield resto[i:i + amostras_por_bloco]
+
+    @staticmethod
+    def demodulador_em_blocos(tipo, blocos, amostras_por_simbolo: int = 100, fs: int = 800, f0=2, f1=5):
+        """
+        Demodula um fluxo de blocos de amostras, entregando os bytes conforme ficam prontos.
+
+        Funcionamento:
+        • Acumula as amostras até fechar grupos de 8 símbolos (8 · bits por símbolo = bytes inteiros).
+        • Demodula todos os grupos completos de uma vez e guarda as amostras que sobraram pro próximo bloco.
+        • No fim do fluxo, demodula o resto (descartando o padding da constelação).
+
+        Parâmetros:
+        • tipo (str): Tipo de modulação.
+        • blocos (Iterable[np.ndarray]): Blocos do sinal recebido (qualquer tamanho).
+        • amostras_por_simbolo (int): Número de amostras por símbolo (por bit no ASK/FSK).
+        • fs (int): Frequência de amostragem (Hz).
+        • f0, f1: Frequências dos bits 0 e 1 no FSK (Hz).
+
+        Retorna:
+        • Generator[bytes]: Pedaços do quadro da camada de enlace.
+        """
+        amostras_por_grupo = 8 * amostras_por_simbolo
+        resto = np.zeros(0)
+
+        for bloco in blocos:
+            resto = np.concatenate([resto, np.asarray(bloco, dtype=np.float64)])
+            completos = len(resto) // amostras_por_grupo * amostras_por_grupo
+            if completos:
+                yield bytes(CamadaFisica.demodulador(tipo, resto[:completos], amostras_por_simbolo, fs, f0, f1))
+                resto = resto[completos:]
+
+        if len(resto):
+            yield bytes(CamadaFisica.demodulador(tipo, resto, amostras_por_simbolo, fs, f0, f1))
+
+    @staticmethod
+    def codificar_nrz_polar(dado: bytes) -> np.ndarray:
         """
         Transforma sequência de bytes em um sinal codificado NRZ-Polar.
 
@@ -57,77 +198,53 @@ class CamadaFisica:
             Bit 1 → +1
         
         Funcionamento:
-        • Converte bytes (ex: b'teste') em string de bits (ex: '01000001 01100101...').
-        • Remove espaços na string de bits.
-        • Monta uma lista com valores da modulação NRZ-Polar (ex: [-1, 1, -1, ...]).
+        • Converte bytes (ex: b'teste') em array de bits (ex: [0, 1, 1, 1, 0, 1, 0, 0, ...]).
+        • Faz o mapeamento 2·bit - 1 em todos os bits de uma vez (ex: [-1, 1, 1, 1, -1, ...]).
 
         Parâmetro:
-        • dado (bytes): Um quadro da camada de enlace.
+        • dado (bytes | Bits): Um quadro da camada de enlace.
 
         Retorna:
-        • list[int]: Lista com o sinal NRZ-Polar.
+        • np.ndarray: Array int8 com o sinal NRZ-Polar.
 
         Exemplo:
             Entrada: b"A" → bits "01000001"
             Saída: [-1, 1, -1, -1, -1, -1, 1, -1]
         """
-        # Transforma bytes em string de bits e remove espaços
-        bits_str = Utils.byte_formarter(dado).replace(' ', '')
+        bits = Utils.unpack_bits(dado).astype(np.int8)
 
         # Faz o mapeamento 0 → -1 e 1 → +1
-        sinal = [1 if bit == '1' else -1 for bit in bits_str]
-        return sinal
+        return 2 * bits - 1
 
 
     @staticmethod
-    def decodificar_nrz_polar(sinal_digital:list) -> bytes:
+    def decodificar_nrz_polar(sinal_digital) -> Bits:
         """
         Decodifica um sinal digital codificado com NRZ-Polar.
 
         Funcionamento:
-        • Converte lista com valores da NRZ-Polar (ex: [-1, 1, -1, ...]) em uma lista de 1s e 0s.
-        • Agrupa bits em uma string e transforma num inteiro binário.
-        • Converte de inteiro pra bytes e recupera o quadro.
+        • Decide cada bit por limiar em 0 (valores >= 0 → 1, valores < 0 → 0), tolerando ruído.
+        • Agrupa os bits de 8 em 8 (np.packbits) e recupera o quadro.
 
         Parâmetro:
-        • list[int]: Lista com o sinal NRZ-Polar.
+        • sinal_digital (np.ndarray | list): Sinal NRZ-Polar (int8 ou float, com ou sem ruído).
 
         Retorna:
-        • bytes: Um quadro da camada de enlace.
+        • Bits: Um quadro da camada de enlace.
 
         Exemplo:
             Entrada: [-1, 1, -1, -1, -1, -1, 1, -1]
             Saída: bits "01000001" → b"A"
         """
-        # Tratamento pra ruído: caso algum valor não seja -1 ou 1
-        if (any(v not in (1, -1) for v in sinal_digital)):
-            buffer = []
-            for v in sinal_digital:
-                # Entende valores < 0 como -1
-                if (v < 0):
-                    buffer.append(-1)
-                # Entende valores >=0 como 1
-                else:
-                    buffer.append(1)
-            # Atualiza sinal digital pra decodificar após ajuste
-            sinal_digital = buffer
-
-        # Desfaz o mapeamento da NRZ-Polar numa string dos bits
-        bits_str = "".join(["1" if v == 1 else "0" for v in sinal_digital])
+        sinal_digital = np.asarray(sinal_digital)
 
-        # Toma o quadro em inteiro na base 2 pra aplicar o to_bytes()
-        quadro_bits = int(bits_str, 2)
-
-        # Calcula o número de bytes
-        num_bytes = (len(bits_str)+7)//8 
-
-        # Obtém o quadro original, em bytes
-        quadro = quadro_bits.to_bytes(num_bytes, "big")
-        return quadro
+        # Decisão por limiar: entende valores >= 0 como 1 e valores < 0 como 0
+        bits = sinal_digital >= 0
+        return Bits.de_array(bits)
 
 
     @staticmethod
-    def codificar_manchester(dado:bytes) -> list:
+    def codificar_manchester(dado:bytes) -> np.ndarray:
         """
         Transforma sequência de bytes em um sinal codificado Manchester.
 
@@ -139,71 +256,56 @@ class CamadaFisica:
             Bit 1 CLK 1 → 0
         
         Funcionamento:
-        • Converte bytes (ex: b'teste') em string de bits (ex: '01000001 01100101...').
-        • Remove espaços na string de bits.
-        • Monta um sinal clock de duas vezes o tamanho da palavra de bits.
-        • Para cada par de bit do clock, faz o XOR com a entrada de bit.
-        • Retorna a lista com a codificação manchester.
+        • Converte bytes (ex: b'teste') em array de bits.
+        • Monta um clock [0, 1] por bit (matriz bits × 2).
+        • Faz o XOR de cada bit com o seu par de clock e achata a matriz.
 
         Parâmetro:
-        • dado (bytes): Um quadro da camada de enlace.
+        • dado (bytes | Bits): Um quadro da camada de enlace.
 
         Retorna:
-        • list[int]: Lista com o sinal Manchester.
+        • np.ndarray: Array int8 com o sinal Manchester.
 
         Exemplo:
             Entrada b"A" → bits "0101001"
             Saída → [0, 1, 1, 0, 0, 1, 1, 0, 0, 1, 0, 1, 1, 0, 1, 0]
         """
-        bits_str = Utils.byte_formarter(dado).replace(' ', '')
-        clock = '01' * len(bits_str)
-        sinal = []
-        for bit in range(0,len(bits_str)):
-           bit1 = int(bits_str[bit]) ^ int(clock[2*bit])
-           bit2 = int(bits_str[bit]) ^ int(clock[(2*bit) + 1]) 
-           sinal.append(bit1)
-           sinal.append(bit2)
-        return sinal
+        bits = Utils.unpack_bits(dado).astype(np.int8)
+        clock = np.array([0, 1], dtype=np.int8)
+        return (bits[:, None] ^ clock).ravel()
 
 
     @staticmethod
-    def decodificar_manchester(sinal_digital:list) -> bytes:
+    def decodificar_manchester(sinal_digital) -> Bits:
         """
         Decodifica um sinal codificado em Manchester, recuperando os bytes originais.
 
         Dinâmica da decodificação:
-            • Cada bit original foi convertido em 2 bits no sinal:
+            • Cada bit original foi convertido em 2 níveis no sinal:
                 - '10' → bit original 1
                 - '01' → bit original 0
-            • Percorre o sinal de 2 em 2 bits para reconstruir os bits originais.
+            • Compara a primeira com a segunda metade de cada bit, para todos os pares de uma vez.
+              Assim, um par ruidoso (ex: [0.8, 0.1]) é decidido pela metade de maior nível.
             • Converte os bits em bytes.
 
         Parâmetro:
-        • sinal (list[int]): Lista com o sinal codificado Manchester.
+        • sinal_digital (np.ndarray | list): Sinal Manchester (int8 ou float, com ou sem ruído).
 
         Retorna:
-        • bytes: Dados decodificados.
-        """
-        bits_recuperados = ''
-        for i in range(0, len(sinal_digital), 2):
-            par = sinal_digital[i:i+2]
-            if par == [1, 0]:
-                bits_recuperados += '1'
-            elif par == [0, 1]:
-                bits_recuperados += '0'
-            else:
-                raise ValueError(f"Sinal Manchester inválido no par: {par}")
+        • Bits: Dados decodificados.
+        """
+        sinal_digital = np.asarray(sinal_digital, dtype=np.float64)
 
-        # Agrupa os bits em bytes (8 bits por byte)
-        bytes_recuperados = bytes(
-            int(bits_recuperados[i:i+8], 2) 
-            for i in range(0, len(bits_recuperados), 8)
-        )
-        return bytes_recuperados
+        # Agrupa o sinal em pares (matriz bits × 2), descartando amostra solta no final
+        pares = sinal_digital[:len(sinal_digital) // 2 * 2].reshape(-1, 2)
+
+        # Bit 1 se a primeira metade for maior que a segunda ('10'), senão bit 0 ('01')
+        bits = pares[:, 0] > pares[:, 1]
+        return Bits.de_array(bits)
 
 
     @staticmethod
-    def codificar_bipolar(quadro:bytes) -> list:
+    def codificar_bipolar(quadro:bytes) -> np.ndarray:
         """
         Transforma uma sequência de bytes em um sinal codificado no formato bipolar AMI (Alternate Mark Inversion).
 
@@ -211,187 +313,477 @@ class CamadaFisica:
             • Bit 0 → 0
             • Bit 1 → +1 ou -1
 
+        Funcionamento:
+        • Conta os 1s acumulados (soma acumulada) pra saber a ordem de cada 1.
+        • 1s de ordem ímpar → +1, 1s de ordem par → -1.
+
         Parâmetro:
-        • quadro (bytes): Um quadro da camada de enlace.
+        • quadro (bytes | Bits): Um quadro da camada de enlace.
 
         Retorna:
-        • list[int]: Lista com o sinal bipolar.
+        • np.ndarray: Array int8 com o sinal bipolar.
 
         Exemplo:
             Entrada: b"A" → bits "0101001" → [0, 1, 0, 1, 0, 0, 1]
             Saída: [0, 1, 0, -1, 0, 0, 1]
         """
-        bits_str = Utils.byte_formarter(quadro).replace(' ', '')
-        sinal = []
-        polaridade = 1
+        bits = Utils.unpack_bits(quadro).astype(np.int8)
 
-        for bit in bits_str:
-            if bit == '1':
-                sinal.append(polaridade)
-                polaridade *= -1
-            else:
-                sinal.append(0)
-        return sinal
+        # Polaridade alterna a cada bit 1 (começa em +1)
+        polaridade = np.where(np.cumsum(bits) % 2 == 1, 1, -1).astype(np.int8)
+        return bits * polaridade
 
 
     @staticmethod
-    def decodificar_bipolar(sinal: list) -> bytes:
+    def decodificar_bipolar(sinal) -> Bits:
         """
         Transforma um sinal codificado em bipolar de volta em bytes.
 
         Dinâmica da decodificação:
-            • Valor  0 → bit 0
-            • Valor +1 ou -1 → bit 1
+            • Valor em ]-0.5, 0.5[ → bit 0
+            • Valor <= -0.5 ou >= 0.5 → bit 1
 
         Parâmetro:
-        • sinal (list[int]): Lista com o sinal codificado em bipolar.
+        • sinal (np.ndarray | list): Sinal bipolar (int8 ou float, com ou sem ruído).
 
         Retorna:
-        • bytes: Dados decodificados a partir do sinal.
+        • Bits: Dados decodificados a partir do sinal.
 
         Exemplo:
             Entrada: [1, 0, -1, 0, 1, 0, -1, 0]
             Saída: '10101010'
         """
-        # Tratamento pra ruído: caso algum valor não seja -1, 0 ou 1
-        if (any(v not in (1, 0, -1) for v in sinal)):
-            buffer = []
-            for v in sinal:
-                # Entende valores em ]-0.5V,0.5V[ como 0
-                if (v > -0.5 and v < 0.5):
-                    buffer.append(-1)
-                # Entende valores <= -0.5V como -1
-                elif (v <= -0.5):
-                    buffer.append(-1)
-                # Entende valores >= 0.5V como 1
-                else:
-                    buffer.append(1)
-            # Atualiza sinal digital pra decodificar após ajuste
-            sinal = buffer
-        
-        # Constrói a sequência de bits
-        bits = ''.join('1' if valor != 0 else '0' for valor in sinal)
+        sinal = np.asarray(sinal)
+
+        # Decisão por limiar no módulo do sinal: marca (±1) → 1, espaço (0) → 0
+        bits = np.abs(sinal) >= 0.5
+        return Bits.de_array(bits)
+
+    @staticmethod
+    def num_fases_fsk(frequencias: tuple, amostras_por_bit: int, fs) -> int:
+        """
+        Calcula quantas fases iniciais de bit a fase contínua do FSK pode alcançar.
+
+        Funcionamento:
+        • Cada bit avança a fase em f·amostras_por_bit/fs ciclos (fração exata, aceita frequências não inteiras).
+        • As fases alcançáveis são múltiplos de 1/P ciclo, com P = mmc dos denominadores dessas frações.
+
+        Parâmetros:
+        • frequencias (tuple): Frequências de cada bit (ex: (f0, f1)), em Hz.
+        • amostras_por_bit (int): Número de amostras por bit.
+        • fs (int | float): Frequência de amostragem (Hz).
+
+        Retorna:
+        • int | None: Número P de fases (P = 8 no padrão f0=2, f1=5, 100 amostras, fs=800),
+                      ou None se P passar de MAX_FASES_FSK (ex: frequências irracionais em relação a fs).
+        """
+        num_fases = 1
+        for ciclos in CamadaFisica.ciclos_por_bit_fsk(frequencias, amostras_por_bit, fs):
+            num_fases = math.lcm(num_fases, ciclos.denominator)
+            if num_fases > CamadaFisica.MAX_FASES_FSK:
+                return None
+        return num_fases
+
+    @staticmethod
+    def ciclos_por_bit_fsk(frequencias: tuple, amostras_por_bit: int, fs) -> list:
+        """Ciclos (frações exatas) que cada frequência avança em um bit"""
+        return [Fraction(f) * amostras_por_bit / Fraction(fs) for f in frequencias]
 
-        # Agrupa em blocos
-        blocos = [bits[i:i+8] for i in range(0, len(bits), 8)]
+    @staticmethod
+    def passos_fsk(frequencias: tuple, amostras_por_bit: int, fs, num_fases: int) -> np.ndarray:
+        """Passos de 2π/P que cada frequência avança em um bit (inteiros, módulo P)"""
+        ciclos = CamadaFisica.ciclos_por_bit_fsk(frequencias, amostras_por_bit, fs)
+        return np.array([int(c * num_fases) % num_fases for c in ciclos], dtype=np.int64)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def trechos_de_simbolo(tipo: str, amostras_por_simbolo: int, fs: int, constelacao: tuple) -> np.ndarray:
+        """
+        Gera (e guarda em cache) a forma de onda de cada símbolo possível de uma modulação.
 
-        # Converte os blocos para bytes
-        return bytes(int(bloco, 2) for bloco in blocos)
+        Como as frequências têm ciclos inteiros por símbolo (ou, no FSK, um número finito de fases iniciais),
+        todo símbolo do sinal é uma linha dessa tabela. Modular vira só indexar e concatenar linhas.
+        O cache é limitado (LRU, 32 entradas) e indexado por (tipo, amostras, fs, constelação).
+
+        Parâmetros:
+        • tipo (str): "ASK", "FSK" ou uma das Constelacao.NOMES (ex: "8-QAM").
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
+        • constelacao (tuple): Amplitudes (ASK), frequências (FSK) ou pontos (I, Q) (PSK/QAM).
+
+        Retorna:
+        • np.ndarray: Matriz somente leitura símbolos × amostras.
+            ASK/PSK/QAM: uma linha por ponto da constelação.
+            FSK: linha f·P + k = frequência f começando na k-ésima fase (P = num_fases_fsk).
+        """
+        if tipo == "FSK":
+            num_fases = CamadaFisica.num_fases_fsk(constelacao, amostras_por_simbolo, fs)
+            fases = 2 * np.pi * np.arange(num_fases) / num_fases
+
+            # Mesma convenção da fase acumulada: a primeira amostra já avança um passo de fase
+            t = np.arange(1, amostras_por_simbolo + 1) / fs
+            trechos = np.vstack([np.sin(fases[:, None] + 2 * np.pi * f * t) for f in constelacao])
+        else:
+            # Portadora com 1 ciclo completo por símbolo
+            freq = fs / amostras_por_simbolo
+            fase = 2 * np.pi * freq * np.arange(amostras_por_simbolo) / fs
+            pontos = np.array(constelacao, dtype=np.float64)
+
+            if tipo == "ASK":
+                trechos = pontos[:, None] * np.sin(fase)
+            elif tipo in Constelacao.NOMES:
+                trechos = pontos[:, 0:1] * np.cos(fase) + pontos[:, 1:2] * np.sin(fase)
+            else:
+                raise ValueError(f"Tipo de modução inválida: {tipo}")
+
+        trechos.setflags(write=False) # Compartilhado pelo cache
+        return trechos
 
     @staticmethod
-    def modular_fsk(quadro: bytes, f0=2, f1=5, amostras_por_bit=100, fs=800) -> list:
+    def modular_fsk(quadro: bytes, f0=2, f1=5, amostras_por_bit=100, fs=800, fase_inicial=0) -> np.ndarray:
         """
         Modula um quadro usando FSK (Frequency Shift Keying).
+
+        Funcionamento:
+        • Cada bit avança a fase em um número inteiro de passos de 2π/P (P = num_fases_fsk).
+        • A soma acumulada dos passos dá a fase inicial de cada bit (fase contínua entre bits).
+        • O sinal é a concatenação dos trechos (frequência do bit, fase inicial) do cache.
+        • Sem P finito (num_fases_fsk = None), acumula a fase amostra a amostra (soma acumulada em radianos).
         
         Parâmetros:
-        • quadro (bytes): Um quadro da camada de enlace.
+        • quadro (bytes | Bits): Um quadro da camada de enlace.
         • f0: frequência para bit 0 (em Hz).
         • f1: frequência para bit 1 (em Hz).
         • amostras_por_bit: número de amostras (pontos no gráfico) por bit.
         • fs: frequência de amostragem (em Hz).
+        • fase_inicial: fase antes do primeiro bit, em passos de 2π/P (continuação de um bloco anterior).
+                        Sem P finito, em radianos.
 
         Retorna:
-        • Lista com o sinal FSK modulado (amostrado).
+        • np.ndarray: Sinal FSK modulado (amostrado), em float.
         """
-        bits_str = Utils.byte_formarter(quadro).replace(" ", "") # String de bits (ex: "00101...")
+        bits = Utils.unpack_bits(quadro) # Array de bits (ex: [0, 0, 1, 0, 1...])
+        num_fases = CamadaFisica.num_fases_fsk((f0, f1), amostras_por_bit, fs)
 
-        dt = 1 / fs  # Tempo entre amostras
-        fase = 0     # Fase acumulada
-        sinal_modulado = []
+        if num_fases is None:
+            incrementos = np.repeat(2 * np.pi * np.array([f0, f1], dtype=np.float64)[bits] / fs, amostras_por_bit)
+            return np.sin(fase_inicial + np.cumsum(incrementos))
 
-        for bit in bits_str:
-            freq = f1 if int(bit) == 1 else f0
-            for _ in range(amostras_por_bit):
-                fase += 2 * np.pi * freq * dt
-                sinal_modulado.append(np.sin(fase))
+        trechos = CamadaFisica.trechos_de_simbolo("FSK", amostras_por_bit, fs, (f0, f1))
 
-        return sinal_modulado
+        # Passos de fase (em 2π/P) que cada bit avança
+        passos = CamadaFisica.passos_fsk((f0, f1), amostras_por_bit, fs, num_fases)
+        avanco = passos[bits]
+
+        # Fase inicial de cada bit: soma dos avanços dos bits anteriores
+        fases = (fase_inicial + np.cumsum(avanco) - avanco) % num_fases
+
+        return trechos[bits.astype(np.intp) * num_fases + fases].ravel()
 
     @staticmethod
-    def modular_ask(quadro: bytes, amostras_por_bit: int = 100, fs: int = 800) -> list:
+    def fase_final_fsk(quadro: bytes, f0=2, f1=5, amostras_por_bit=100, fs=800, fase_inicial=0) -> int:
+        """
+        Calcula a fase do FSK depois do último bit do quadro, sem gerar o sinal.
+
+        Parâmetros:
+        • quadro (bytes | Bits): Um quadro (ou pedaço de quadro) da camada de enlace.
+        • f0, f1, amostras_por_bit, fs: mesmos parâmetros da modular_fsk.
+        • fase_inicial: fase antes do primeiro bit, em passos de 2π/P (sem P finito, em radianos).
+
+        Retorna:
+        • int | float: Fase final, em passos de 2π/P (sem P finito, em radianos) (fase_inicial do próximo pedaço).
+        """
+        bits = Utils.unpack_bits(quadro)
+        uns = int(np.count_nonzero(bits))
+        zeros = len(bits) - uns
+
+        num_fases = CamadaFisica.num_fases_fsk((f0, f1), amostras_por_bit, fs)
+        if num_fases is None:
+            return float(fase_inicial + 2 * np.pi * (uns * f1 + zeros * f0) * amostras_por_bit / fs) % (2 * np.pi)
+
+        passo0, passo1 = (int(p) for p in CamadaFisica.passos_fsk((f0, f1), amostras_por_bit, fs, num_fases))
+        return int(fase_inicial + uns * passo1 + zeros * passo0) % num_fases
+
+    @staticmethod
+    def modular_ask(quadro: bytes, amostras_por_bit: int = 100, fs: int = 800) -> np.ndarray:
         """
         Gera um sinal modulado em ASK (Amplitude Shift Keying) com ciclo completo por bit.
+
+        Funcionamento:
+        • Com 1 ciclo completo por bit, todo bit começa na fase zero da portadora.
+        • O sinal é a concatenação dos trechos do cache (amplitude 0 ou 1) indexados pelos bits.
         
         Parâmetros:
-        • quadro (bytes): Um quadro da camada de enlace.
+        • quadro (bytes | Bits): Um quadro da camada de enlace.
         • amostras_por_bit: número de amostras (pontos no gráfico) por bit.
-        • freq (float): Frequência da portadora em Hz. Se None, será calculada para 1 ciclo/bit (default=None).
         • fs: frequência de amostragem (em Hz).
         
         Retorna:
-        • list: Sinal modulado em ASK
+        • np.ndarray: Sinal modulado em ASK, em float.
         """
-        bit_str = Utils.byte_formarter(quadro).replace(" ","") # String de bits (ex: "00101...")
+        bits = Utils.unpack_bits(quadro) # Array de bits (ex: [0, 0, 1, 0, 1...])
+
+        trechos = CamadaFisica.trechos_de_simbolo("ASK", amostras_por_bit, fs, (0, 1))
+        return trechos[bits].ravel()
 
-        # Calcula frequência padrão para 1 ciclo completo por bit
-        freq = fs / amostras_por_bit
-        
-        dt = 1 / fs  # Período de amostragem
-        tempo_acumulado = 0  # Mantém o tempo contínuo
-        sinal_modulado = []
-        
-        for bit in bit_str:
-            for _ in range(amostras_por_bit):
-                if int(bit) == 1:
-                    fase = 2 * np.pi * freq * tempo_acumulado # Amplitude =/= zero
-                    sinal_modulado.append(np.sin(fase))
-                else:
-                    sinal_modulado.append(0) # Amplitude zero
-                    
-                tempo_acumulado += dt  # Atualiza o tempo
-                
-        return sinal_modulado
-    
     @staticmethod
-    def modular_8qam(quadro: bytes, amostras_por_simbolo: int = 100, fs: int = 800) -> list:
+    def modular_8qam(quadro: bytes, amostras_por_simbolo: int = 100, fs: int = 800) -> np.ndarray:
         """
         Gera um sinal modulado em 8-QAM com ciclo(s) completo(s) por símbolo.
         
         • Cada grupo de 3 bits representa um símbolo (I, Q).
         
         Parâmetros:
-        • quadro (bytes): Quadro da camada de enlace.
+        • quadro (bytes | Bits): Quadro da camada de enlace.
         • amostras_por_simbolo (int): Número de amostras por símbolo.
         • fs (int): Frequência de amostragem (Hz).
         
         Retorna:
-        • list: Sinal modulado 8-QAM (lista de pontos no tempo)
-        """
-        # Tabela de mapeamento da constelação 8-QAM
-        rangeMap = {
-            '000': (-1, -1),
-            '001': (-1, 0),
-            '010': (-1, 1),
-            '011': (0, -1),
-            '100': (0, 1),
-            '101': (1, -1),
-            '110': (1, 0),
-            '111': (1, 1)
-        }
-
-        # Converte quadro em string de bits
-        bits_str = Utils.byte_formarter(quadro).replace(" ", "")
-        
-        # Faz padding pra múltiplo de 3
-        padding = (3 - len(bits_str) % 3) % 3
-        bits_str += '0' * padding
+        • np.ndarray: Sinal modulado 8-QAM (pontos no tempo), em float.
+        """
+        return CamadaFisica.modular_constelacao(quadro, "8-QAM", amostras_por_simbolo, fs)
+
+    @staticmethod
+    def modular_constelacao(quadro: bytes, tipo: str, amostras_por_simbolo: int = 100, fs: int = 800) -> np.ndarray:
+        """
+        Gera um sinal modulado em M-PSK/M-QAM com ciclo(s) completo(s) por símbolo.
+
+        Funcionamento:
+        • Faz padding dos bits pra múltiplo de bits por símbolo e converte cada grupo no índice da constelação.
+        • O sinal é a concatenação dos trechos I·cos + Q·sin do cache indexados pelos símbolos.
+
+        Parâmetros:
+        • quadro (bytes | Bits): Quadro da camada de enlace.
+        • tipo (str): Nome da constelação (Constelacao.NOMES, ex: "QPSK", "16-QAM").
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
 
-        # Calcula frequência padrão para 1 ciclo por símbolo
+        Retorna:
+        • np.ndarray: Sinal modulado (pontos no tempo), em float.
+        """
+        constelacao = Constelacao.por_nome(tipo)
+        simbolos = constelacao.indices(Utils.unpack_bits(quadro))
+
+        pontos = tuple(zip(constelacao.pontos.real, constelacao.pontos.imag))
+        trechos = CamadaFisica.trechos_de_simbolo(tipo, amostras_por_simbolo, fs, pontos)
+        return trechos[simbolos].ravel()
+
+    @staticmethod
+    def blocos_de_simbolos(sinal, amostras_por_simbolo: int) -> np.ndarray:
+        """
+        Agrupa as amostras do sinal em uma matriz símbolos × amostras.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal analógico amostrado.
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+
+        Retorna:
+        • np.ndarray: Matriz float (uma linha por símbolo). Amostras que não completam um símbolo são descartadas.
+        """
+        sinal = np.asarray(sinal, dtype=np.float64)
+        num_simbolos = len(sinal) // amostras_por_simbolo
+        return sinal[:num_simbolos * amostras_por_simbolo].reshape(num_simbolos, amostras_por_simbolo)
+
+    @staticmethod
+    def energia_por_tom(blocos: np.ndarray, freq: float, fs: int) -> np.ndarray:
+        """
+        Mede a energia de cada símbolo que está na frequência freq, qualquer que seja a fase.
+
+        Funcionamento:
+        • Correlaciona cada linha com o par seno/cosseno do tom (base de 2 dimensões).
+        • Projeta em mínimos quadrados na base (corrige a não ortogonalidade em frações de ciclo).
+        • Retorna a energia da projeção, para todos os símbolos em uma única multiplicação de matrizes.
+
+        Parâmetros:
+        • blocos (np.ndarray): Matriz símbolos × amostras.
+        • freq (float): Frequência do tom (Hz).
+        • fs (int): Frequência de amostragem (Hz).
+
+        Retorna:
+        • np.ndarray: Energia do tom em cada símbolo.
+        """
+        fase = 2 * np.pi * freq * np.arange(blocos.shape[1]) / fs
+        base = np.stack([np.sin(fase), np.cos(fase)], axis=1) # Amostras × 2
+        correlacao = blocos @ base                            # Símbolos × 2
+        coeficientes = correlacao @ np.linalg.inv(base.T @ base)
+        return np.sum(correlacao * coeficientes, axis=1)
+
+    @staticmethod
+    def demodular_ask(sinal, amostras_por_bit: int = 100, fs: int = 800) -> Bits:
+        """
+        Demodula um sinal ASK por detecção de energia na portadora (decisão pelo sinal de demodular_ask_suave).
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal ASK recebido (com ou sem ruído).
+        • amostras_por_bit: número de amostras por bit.
+        • fs: frequência de amostragem (em Hz).
+
+        Retorna:
+        • Bits: Quadro da camada de enlace.
+        """
+        return Bits.de_array(CamadaFisica.demodular_ask_suave(sinal, amostras_por_bit, fs) > 0)
+
+    @staticmethod
+    def demodular_ask_suave(sinal, amostras_por_bit: int = 100, fs: int = 800) -> np.ndarray:
+        """
+        Demodula um sinal ASK por detecção de energia na portadora, com decisão suave.
+
+        Funcionamento:
+        • Agrupa o sinal em uma matriz bits × amostras.
+        • Mede a energia de cada bit na frequência da portadora (1 ciclo por bit).
+        • Converte a energia em amplitude (raiz, normalizada pela do bit 1), que é linear no sinal
+          e simétrica em torno do limiar: a confiabilidade não cresce com o quadrado do ruído.
+        • Compara com o limiar de metade da amplitude do bit 1.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal ASK recebido (com ou sem ruído).
+        • amostras_por_bit: número de amostras por bit.
+        • fs: frequência de amostragem (em Hz).
+
+        Retorna:
+        • np.ndarray: Amplitude - 1/2 de cada bit (> 0 → bit 1; sem ruído: +1/2 ou -1/2).
+        """
+        blocos = CamadaFisica.blocos_de_simbolos(sinal, amostras_por_bit)
+        freq = fs / amostras_por_bit
+
+        # Energia de um bit 1 sem ruído: Σ sin² = amostras_por_bit / 2
+        energia_bit_1 = amostras_por_bit / 2
+        amplitude = np.sqrt(CamadaFisica.energia_por_tom(blocos, freq, fs) / energia_bit_1)
+
+        return amplitude - 0.5
+
+    @staticmethod
+    def demodular_fsk(sinal, f0=2, f1=5, amostras_por_bit=100, fs=800) -> Bits:
+        """
+        Demodula um sinal FSK por correlação com cada tom (decisão pelo sinal de demodular_fsk_suave).
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal FSK recebido (com ou sem ruído).
+        • f0: frequência para bit 0 (em Hz).
+        • f1: frequência para bit 1 (em Hz).
+        • amostras_por_bit: número de amostras por bit.
+        • fs: frequência de amostragem (em Hz).
+
+        Retorna:
+        • Bits: Quadro da camada de enlace.
+        """
+        return Bits.de_array(CamadaFisica.demodular_fsk_suave(sinal, f0, f1, amostras_por_bit, fs) > 0)
+
+    @staticmethod
+    def demodular_fsk_suave(sinal, f0=2, f1=5, amostras_por_bit=100, fs=800) -> np.ndarray:
+        """
+        Demodula um sinal FSK por correlação com cada tom, com decisão suave.
+
+        Funcionamento:
+        • Como a fase é contínua, cada bit começa em uma de P fases possíveis
+          (múltiplos de 2π·mdc(f0·amostras, f1·amostras, fs)/fs; P = 8 no padrão).
+        • Usa os 2·P trechos possíveis (tom × fase inicial) do cache e correlaciona a matriz bits × amostras
+          com todos eles de uma vez.
+        • Compara a maior verossimilhança (correlação - energia/2) entre os trechos de f1 e os de f0.
+        • Sem P finito (num_fases_fsk = None), compara a energia de cada tom em qualquer fase (não coerente).
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal FSK recebido (com ou sem ruído).
+        • f0: frequência para bit 0 (em Hz).
+        • f1: frequência para bit 1 (em Hz).
+        • amostras_por_bit: número de amostras por bit.
+        • fs: frequência de amostragem (em Hz).
+
+        Retorna:
+        • np.ndarray: Métrica de f1 - métrica de f0 de cada bit (> 0 → bit 1).
+        """
+        blocos = CamadaFisica.blocos_de_simbolos(sinal, amostras_por_bit)
+        num_fases = CamadaFisica.num_fases_fsk((f0, f1), amostras_por_bit, fs)
+        if num_fases is None:
+            return CamadaFisica.energia_por_tom(blocos, f1, fs) - CamadaFisica.energia_por_tom(blocos, f0, fs)
+
+        # Trechos possíveis (2·P) × amostras: tom f0 nas P fases, depois tom f1 nas P fases
+        trechos = CamadaFisica.trechos_de_simbolo("FSK", amostras_por_bit, fs, (f0, f1))
+
+        metrica = blocos @ trechos.T - 0.5 * np.sum(trechos ** 2, axis=1)
+
+        # Trechos de índice >= P são do tom f1 (bit 1)
+        return np.max(metrica[:, num_fases:], axis=1) - np.max(metrica[:, :num_fases], axis=1)
+
+    @staticmethod
+    def demodular_8qam(sinal, amostras_por_simbolo: int = 100, fs: int = 800) -> Bits:
+        """
+        Demodula um sinal 8-QAM por projeção I/Q e escolha do ponto mais próximo da constelação.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal 8-QAM recebido (com ou sem ruído).
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
+
+        Retorna:
+        • Bits: Quadro da camada de enlace.
+        """
+        return CamadaFisica.demodular_constelacao(sinal, "8-QAM", amostras_por_simbolo, fs)
+
+    @staticmethod
+    def projecao_iq(sinal, amostras_por_simbolo: int = 100, fs: int = 800) -> np.ndarray:
+        """
+        Recupera o símbolo complexo (I + jQ) de cada trecho do sinal.
+
+        Funcionamento:
+        • Agrupa o sinal em uma matriz símbolos × amostras.
+        • Projeta cada símbolo no cosseno (I) e no seno (Q) da portadora (uma multiplicação de matrizes).
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal PSK/QAM recebido (com ou sem ruído).
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
+
+        Retorna:
+        • np.ndarray: Símbolos complexos recebidos.
+        """
+        blocos = CamadaFisica.blocos_de_simbolos(sinal, amostras_por_simbolo)
         freq = fs / amostras_por_simbolo
-        
-        dt = 1 / fs  # Período de amostragem
-        tempo_acumulado = 0
-        sinal_modulado = []
-
-        # Modula cada símbolo
-        for i in range(0, len(bits_str), 3):
-            bits = bits_str[i:i+3]
-            I, Q = rangeMap.get(bits, (0, 0))
-            
-            for _ in range(amostras_por_simbolo):
-                fase = 2 * np.pi * freq * tempo_acumulado
-                s = I * np.cos(fase) + Q * np.sin(fase)
-                sinal_modulado.append(s)
-                tempo_acumulado += dt
-
-        return sinal_modulado
+
+        # Portadoras de um símbolo (ciclo completo, fase zero no início de cada símbolo)
+        fase = 2 * np.pi * freq * np.arange(amostras_por_simbolo) / fs
+        portadoras = np.stack([np.cos(fase), np.sin(fase)], axis=1) # Amostras × 2
+
+        # Projeção I/Q normalizada (Σ cos² = Σ sin² = amostras / 2)
+        iq = blocos @ portadoras / (amostras_por_simbolo / 2)
+        return iq[:, 0] + 1j * iq[:, 1]
+
+    @staticmethod
+    def demodular_constelacao(sinal, tipo: str, amostras_por_simbolo: int = 100, fs: int = 800) -> Bits:
+        """
+        Demodula um sinal M-PSK/M-QAM por projeção I/Q e distância mínima à constelação.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal recebido (com ou sem ruído).
+        • tipo (str): Nome da constelação (Constelacao.NOMES).
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
+
+        Retorna:
+        • Bits: Quadro da camada de enlace (sem o padding da modulação).
+        """
+        simbolos = CamadaFisica.projecao_iq(sinal, amostras_por_simbolo, fs)
+        bits = Constelacao.por_nome(tipo).demapear(simbolos)
+
+        # Remove o padding da modulação
+        return Bits.de_array(bits[:len(bits) // 8 * 8])
+
+    @staticmethod
+    def demodular_constelacao_suave(sinal, tipo: str, amostras_por_simbolo: int = 100, fs: int = 800) -> np.ndarray:
+        """
+        Demodula um sinal M-PSK/M-QAM por projeção I/Q, com decisão suave por bit.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal recebido (com ou sem ruído).
+        • tipo (str): Nome da constelação (Constelacao.NOMES).
+        • amostras_por_simbolo (int): Número de amostras por símbolo.
+        • fs (int): Frequência de amostragem (Hz).
+
+        Retorna:
+        • np.ndarray: Confiabilidade de cada bit do quadro (> 0 → bit 1), sem o padding da modulação.
+        """
+        simbolos = CamadaFisica.projecao_iq(sinal, amostras_por_simbolo, fs)
+        suave = Constelacao.por_nome(tipo).demapear_suave(simbolos)
+
+        # Remove o padding da modulação
+        return suave[:len(suave) // 8 * 8]
@@ -0,0 +1,178 @@
+import numpy as np
+
+class Canal:
+    def __init__(self, rng:np.random.Generator=None, semente=None):
+        # Gerador próprio do canal: mesma semente → mesmo ruído (não usa o estado global do np.random)
+        self.rng = rng if rng is not None else np.random.default_rng(semente)
+
+
+    def ruido(self, tipo:str, sinal, **parametros) -> np.ndarray:
+        """
+        Escolhe e aplica algum modelo de ruído ao sinal.
+
+        Parâmetros:
+        • tipo (str): "AWGN", "AWGN Eb/N0", "Gilbert-Elliott" ou "Impulsivo".
+        • sinal (np.ndarray | list): Sinal analógico.
+        • parametros: Parâmetros do modelo escolhido (ver cada método).
+
+        Retorna:
+        • np.ndarray: Sinal com ruído.
+        """
+        if tipo == "AWGN":
+            return self.awgn(sinal, **parametros)
+        elif tipo == "AWGN Eb/N0":
+            return self.awgn_ebn0(sinal, **parametros)
+        elif tipo == "Gilbert-Elliott":
+            return self.gilbert_elliott(sinal, **parametros)
+        elif tipo == "Impulsivo":
+            return self.impulsivo(sinal, **parametros)
+        raise ValueError(f"Tipo de ruído inválido: {tipo}")
+
+
+    def awgn(self, sinal, sigma:float) -> np.ndarray:
+        """
+        Soma ruído branco gaussiano (média 0, desvio σ) em todas as amostras de uma vez.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal analógico.
+        • sigma (float): Desvio padrão do ruído (σ).
+
+        Retorna:
+        • np.ndarray: Sinal com ruído.
+        """
+        sinal = np.asarray(sinal, dtype=np.float64)
+        return sinal + self.rng.normal(0, sigma, size=sinal.shape)
+
+
+    def awgn_ebn0(self, sinal, ebn0_db:float, num_bits:int) -> np.ndarray:
+        """
+        Soma ruído branco gaussiano com a intensidade dada por Eb/N0.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal analógico.
+        • ebn0_db (float): Eb/N0 em dB.
+        • num_bits (int): Número de bits transportados pelo sinal.
+
+        Retorna:
+        • np.ndarray: Sinal com ruído.
+        """
+        return self.awgn(sinal, Canal.sigma_de_ebn0(ebn0_db, sinal, num_bits))
+
+
+    def gilbert_elliott(self, sinal, sigma_bom:float, sigma_ruim:float, p_bom_ruim:float, p_ruim_bom:float,
+                        amostras_por_estado:int = 100) -> np.ndarray:
+        """
+        Soma ruído em rajadas pelo modelo de Gilbert-Elliott (cadeia de Markov de 2 estados).
+
+        Dinâmica:
+            • Estado bom → ruído gaussiano de desvio sigma_bom.
+            • Estado ruim → ruído gaussiano de desvio sigma_ruim (rajada).
+            • O estado muda a cada amostras_por_estado amostras (ex: 1 bit), com as probabilidades de transição.
+
+        Funcionamento:
+        • Sorteia de uma vez as durações de cada estado (distribuição geométrica),
+          em vez de sortear a transição estado a estado.
+        • Expande os estados para as amostras e escala um único vetor de ruído gaussiano.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal analógico.
+        • sigma_bom (float): σ no estado bom.
+        • sigma_ruim (float): σ no estado ruim.
+        • p_bom_ruim (float): Probabilidade de ir do estado bom pro ruim.
+        • p_ruim_bom (float): Probabilidade de ir do estado ruim pro bom.
+        • amostras_por_estado (int): Amostras entre transições.
+
+        Retorna:
+        • np.ndarray: Sinal com ruído.
+        """
+        sinal = np.asarray(sinal, dtype=np.float64)
+        estados = self.estados_gilbert_elliott(-(-len(sinal) // amostras_por_estado), p_bom_ruim, p_ruim_bom)
+        sigmas = np.where(estados, sigma_ruim, sigma_bom)
+        sigma_por_amostra = np.repeat(sigmas, amostras_por_estado)[:len(sinal)]
+        return sinal + sigma_por_amostra * self.rng.standard_normal(len(sinal))
+
+
+    def estados_gilbert_elliott(self, num_estados:int, p_bom_ruim:float, p_ruim_bom:float) -> np.ndarray:
+        """
+        Sorteia a sequência de estados da cadeia de Gilbert-Elliott.
+
+        Parâmetros:
+        • num_estados (int): Tamanho da sequência.
+        • p_bom_ruim (float): Probabilidade de ir do estado bom pro ruim.
+        • p_ruim_bom (float): Probabilidade de ir do estado ruim pro bom.
+
+        Retorna:
+        • np.ndarray: Array bool (True = estado ruim).
+        """
+        if num_estados <= 0:
+            return np.zeros(0, dtype=bool)
+        if p_bom_ruim <= 0:
+            return np.zeros(num_estados, dtype=bool)
+        if p_ruim_bom <= 0:
+            return np.ones(num_estados, dtype=bool)
+
+        # Estado inicial pela distribuição estacionária
+        ruim = self.rng.random() < p_bom_ruim / (p_bom_ruim + p_ruim_bom)
+
+        # Número de pares (bom, ruim) suficiente na média, com folga
+        duracao_media = 1 / p_bom_ruim + 1 / p_ruim_bom
+        pares = int(num_estados / duracao_media * 1.2) + 8
+
+        duracoes = np.zeros(0, dtype=np.int64)
+        while duracoes.sum() < num_estados:
+            novas = np.empty(2 * pares, dtype=np.int64)
+            novas[0::2] = self.rng.geometric(p_ruim_bom if ruim else p_bom_ruim, pares)
+            novas[1::2] = self.rng.geometric(p_bom_ruim if ruim else p_ruim_bom, pares)
+            duracoes = np.concatenate([duracoes, novas])
+
+        # Estados alternam a cada duração, começando pelo estado inicial
+        valores = (np.arange(len(duracoes)) % 2 == 0) == ruim
+        return np.repeat(valores, duracoes)[:num_estados]
+
+
+    def impulsivo(self, sinal, probabilidade:float, amplitude:float, sigma:float = 0.0) -> np.ndarray:
+        """
+        Soma ruído impulsivo (picos isolados) sobre um ruído gaussiano de fundo.
+
+        Funcionamento:
+        • Cada amostra tem um pico com a probabilidade dada (máscara sorteada de uma vez).
+        • O pico tem sinal aleatório e módulo em torno da amplitude dada.
+
+        Parâmetros:
+        • sinal (np.ndarray | list): Sinal analógico.
+        • probabilidade (float): Probabilidade de pico por amostra.
+        • amplitude (float): Amplitude média dos picos.
+        • sigma (float): σ do ruído gaussiano de fundo.
+
+        Retorna:
+        • np.ndarray: Sinal com ruído.
+        """
+        sinal = np.asarray(sinal, dtype=np.float64)
+        picos = self.rng.random(sinal.shape) < probabilidade
+        sinais = self.rng.choice(np.array([-1.0, 1.0]), size=sinal.shape)
+        modulos = amplitude * (1 + 0.1 * self.rng.standard_normal(sinal.shape))
+        ruido = picos * sinais * modulos
+        if sigma > 0:
+            ruido += self.rng.normal(0, sigma, size=sinal.shape)
+        return sinal + ruido
+
+
+    @staticmethod
+    def sigma_de_ebn0(ebn0_db:float, sinal, num_bits:int) -> float:
+        """
+        Converte Eb/N0 (dB) no σ do ruído gaussiano por amostra.
+
+        Funcionamento:
+        • Eb = energia do sinal (Σ amostras²) dividida pelo número de bits.
+        • Com ruído branco de variância σ² por amostra, N0 = 2σ². Logo σ = √(Eb / (2·Eb/N0)).
+
+        Parâmetros:
+        • ebn0_db (float): Eb/N0 em dB.
+        • sinal (np.ndarray | list): Sinal modulado.
+        • num_bits (int): Número de bits transportados pelo sinal.
+
+        Retorna:
+        • float: σ do ruído.
+        """
+        eb = np.sum(np.square(sinal)) / num_bits
+        return float(np.sqrt(eb / (2 * 10 ** (ebn0_db / 10))))
@@ -0,0 +1,199 @@
+import functools
+import numpy as np
+
+class Constelacao:
+    # Constelações disponíveis (nomes usados na GUI e na CamadaFisica)
+    NOMES = ("BPSK", "QPSK", "8-PSK", "8-QAM", "16-QAM", "64-QAM")
+
+    # Tabela da constelação 8-QAM original, indexada pelo valor dos 3 bits ('000' → 0, ..., '111' → 7)
+    PONTOS_8QAM = (
+        (-1, -1),
+        (-1, 0),
+        (-1, 1),
+        (0, -1),
+        (0, 1),
+        (1, -1),
+        (1, 0),
+        (1, 1)
+    )
+
+    def __init__(self, nome:str, pontos):
+        self.nome = nome
+        self.pontos = np.asarray(pontos, dtype=np.complex128)  # Ponto de cada símbolo, indexado pelo valor dos bits (MSB primeiro)
+        self.pontos.setflags(write=False)
+        self.bits_por_simbolo = int(np.log2(len(self.pontos)))
+        if 2 ** self.bits_por_simbolo != len(self.pontos):
+            raise ValueError(f"Constelação com número de pontos inválido: {len(self.pontos)}")
+
+        # Bits de cada ponto (M × bits_por_simbolo), usados na decisão suave
+        indices = np.arange(len(self.pontos), dtype=np.uint8)[:, None]
+        self.bits_pontos = np.unpackbits(indices, axis=1)[:, 8 - self.bits_por_simbolo:].astype(bool)
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def por_nome(nome:str) -> "Constelacao":
+        """
+        Escolhe e monta (uma única vez) alguma constelação.
+
+        Parâmetros:
+        • nome (str): "BPSK", "QPSK", "8-PSK", "8-QAM", "16-QAM" ou "64-QAM".
+
+        Retorna:
+        • Constelacao: Constelação pronta pra mapear/demapear.
+        """
+        if nome == "BPSK":
+            return Constelacao.psk(2)
+        elif nome == "QPSK":
+            return Constelacao.psk(4)
+        elif nome == "8-PSK":
+            return Constelacao.psk(8)
+        elif nome == "8-QAM":
+            return Constelacao(nome, [complex(i, q) for i, q in Constelacao.PONTOS_8QAM])
+        elif nome == "16-QAM":
+            return Constelacao.qam(16)
+        elif nome == "64-QAM":
+            return Constelacao.qam(64)
+        raise ValueError(f"Constelação inválida: {nome}")
+
+
+    @staticmethod
+    def gray(n):
+        """Código Gray de n (posições vizinhas diferem em 1 bit)"""
+        return n ^ (n >> 1)
+
+
+    @staticmethod
+    def psk(m:int) -> "Constelacao":
+        """
+        Monta uma constelação M-PSK (pontos no círculo unitário, mapeamento Gray).
+
+        Parâmetros:
+        • m (int): Número de pontos (2, 4, 8...).
+
+        Retorna:
+        • Constelacao: Ponto da posição p no índice gray(p).
+        """
+        posicoes = np.arange(m)
+        pontos = np.empty(m, dtype=np.complex128)
+        pontos[Constelacao.gray(posicoes)] = np.exp(2j * np.pi * posicoes / m)
+        nome = "BPSK" if m == 2 else "QPSK" if m == 4 else f"{m}-PSK"
+        return Constelacao(nome, np.round(pontos, 15))
+
+
+    @staticmethod
+    def qam(m:int) -> "Constelacao":
+        """
+        Monta uma constelação M-QAM quadrada (mapeamento Gray em cada eixo).
+
+        Funcionamento:
+        • Metade dos bits (mais significativos) escolhe o nível de I e a outra metade o de Q.
+        • Níveis em {-(L-1), ..., -1, 1, ..., L-1} (L = √M), escalados pra I e Q em [-1, 1].
+
+        Parâmetros:
+        • m (int): Número de pontos (16, 64...).
+
+        Retorna:
+        • Constelacao: Constelação M-QAM.
+        """
+        lado = int(round(np.sqrt(m)))
+        if lado * lado != m:
+            raise ValueError(f"M-QAM quadrada precisa de M quadrado perfeito: {m}")
+
+        bits_eixo = int(np.log2(lado))
+        posicoes = np.arange(lado)
+        niveis = np.empty(lado)
+        niveis[Constelacao.gray(posicoes)] = (2 * posicoes - (lado - 1)) / (lado - 1)
+
+        indices = np.arange(m)
+        pontos = niveis[indices >> bits_eixo] + 1j * niveis[indices & (lado - 1)]
+        return Constelacao(f"{m}-QAM", pontos)
+
+
+    def mapear(self, bits) -> np.ndarray:
+        """
+        Mapeia bits em símbolos complexos (I + jQ), todos de uma vez.
+
+        Funcionamento:
+        • Completa os bits com zeros até múltiplo de bits_por_simbolo.
+        • Agrupa em uma matriz símbolos × bits_por_simbolo e converte cada linha no índice do ponto.
+
+        Parâmetros:
+        • bits (np.ndarray | list): Bits (0/1), MSB primeiro.
+
+        Retorna:
+        • np.ndarray: Símbolos complexos.
+        """
+        return self.pontos[self.indices(bits)]
+
+
+    def indices(self, bits) -> np.ndarray:
+        """
+        Converte bits no índice (valor dos bits) de cada símbolo.
+
+        Parâmetros:
+        • bits (np.ndarray | list): Bits (0/1), MSB primeiro.
+
+        Retorna:
+        • np.ndarray: Índice de cada símbolo na constelação.
+        """
+        k = self.bits_por_simbolo
+        bits = np.asarray(bits, dtype=np.intp)
+        padding = (k - len(bits) % k) % k
+        bits = np.concatenate([bits, np.zeros(padding, dtype=np.intp)])
+        return bits.reshape(-1, k) @ (1 << np.arange(k - 1, -1, -1))
+
+
+    def distancias(self, simbolos) -> np.ndarray:
+        """
+        Distância ao quadrado de cada símbolo recebido a cada ponto (símbolos × M).
+
+        • |y - c|² = |y|² - 2·Re(y·c*) + |c|², calculado com uma multiplicação de matrizes reais.
+        """
+        simbolos = np.asarray(simbolos, dtype=np.complex128)
+        y = np.stack([simbolos.real, simbolos.imag], axis=1)            # Símbolos × 2
+        c = np.stack([self.pontos.real, self.pontos.imag], axis=0)       # 2 × M
+        return (np.abs(simbolos) ** 2)[:, None] - 2 * (y @ c) + (np.abs(self.pontos) ** 2)[None, :]
+
+
+    def demapear(self, simbolos, tamanho_bloco:int = 65536) -> np.ndarray:
+        """
+        Decide cada símbolo pelo ponto de menor distância e devolve os bits.
+
+        Parâmetros:
+        • simbolos (np.ndarray | list): Símbolos complexos recebidos (com ruído).
+        • tamanho_bloco (int): Símbolos processados por vez (limita a matriz de distâncias).
+
+        Retorna:
+        • np.ndarray: Bits uint8 (bits_por_simbolo por símbolo, com o padding da modulação).
+        """
+        simbolos = np.asarray(simbolos, dtype=np.complex128)
+        indices = np.empty(len(simbolos), dtype=np.intp)
+        for i in range(0, len(simbolos), tamanho_bloco):
+            indices[i:i + tamanho_bloco] = np.argmin(self.distancias(simbolos[i:i + tamanho_bloco]), axis=1)
+        return self.bits_pontos[indices].astype(np.uint8).ravel()
+
+
+    def demapear_suave(self, simbolos, tamanho_bloco:int = 65536) -> np.ndarray:
+        """
+        Calcula a confiabilidade de cada bit (aproximação max-log).
+
+        Funcionamento:
+        • Para cada bit do símbolo: menor distância entre os pontos com bit 0 - menor distância entre os pontos com bit 1.
+
+        Parâmetros:
+        • simbolos (np.ndarray | list): Símbolos complexos recebidos (com ruído).
+        • tamanho_bloco (int): Símbolos processados por vez (limita a matriz de distâncias).
+
+        Retorna:
+        • np.ndarray: Confiabilidade de cada bit (> 0 → bit 1), com o padding da modulação.
+        """
+        simbolos = np.asarray(simbolos, dtype=np.complex128)
+        suave = np.empty((len(simbolos), self.bits_por_simbolo))
+        for i in range(0, len(simbolos), tamanho_bloco):
+            distancias = self.distancias(simbolos[i:i + tamanho_bloco])
+            for j in range(self.bits_por_simbolo):
+                com_1 = self.bits_pontos[:, j]
+                suave[i:i + tamanho_bloco, j] = (np.min(distancias[:, ~com_1], axis=1)
+                                                 - np.min(distancias[:, com_1], axis=1))
+        return suave.ravel()
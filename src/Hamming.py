@@ -0,0 +1,194 @@
+import functools
+import numpy as np
+
+class Hamming:
+    # Códigos disponíveis (nomes usados na GUI e na CamadaEnlace)
+    NOMES = ("Hamming (15,11)", "Hamming (31,26)", "Hamming (63,57)", "SECDED (16,11)", "SECDED (32,26)", "SECDED (64,57)")
+
+    def __init__(self, m:int, estendido:bool = False):
+        if not 3 <= m <= 8:
+            raise ValueError(f"Hamming com m inválido: {m} (3 a 8)")
+        self.m = m                                  # Bits de paridade
+        self.estendido = estendido                  # SECDED: + 1 bit de paridade geral (detecta erro duplo)
+        self.n_base = 2 ** m - 1                    # Tamanho da palavra sem o bit geral
+        self.k = self.n_base - m                    # Bits de dados por palavra
+        self.n = self.n_base + estendido            # Tamanho da palavra transmitida
+        self.nome = f"{'SECDED' if estendido else 'Hamming'} ({self.n},{self.k})"
+
+        # Posições 1..n_base: paridades nas potências de 2, dados nas outras (como no Hamming (7,4) do Enlace)
+        posicoes = np.arange(1, self.n_base + 1)
+        self.posicoes_paridade = (1 << np.arange(m)) - 1
+        self.posicoes_dados = np.flatnonzero(posicoes & (posicoes - 1))
+
+        # Matriz de verificação (n_base × m): linha j = bits da posição j + 1
+        self.verificacao = ((posicoes[:, None] >> np.arange(m)) & 1).astype(np.uint8)
+        self.pesos_sindrome = 1 << np.arange(m)
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def por_nome(nome:str) -> "Hamming":
+        """
+        Escolhe e monta (uma única vez) algum código.
+
+        Parâmetros:
+        • nome (str): Ex: "Hamming (15,11)", "SECDED (64,57)" (ver NOMES).
+
+        Retorna:
+        • Hamming: Código pronto pra codificar/decodificar.
+        """
+        for m in range(3, 9):
+            for estendido in (False, True):
+                codigo = Hamming(m, estendido)
+                if codigo.nome == nome:
+                    return codigo
+        raise ValueError(f"Código de Hamming inválido: {nome}")
+
+
+    def codificar(self, dados) -> np.ndarray:
+        """
+        Codifica blocos de dados, todos de uma vez.
+
+        Funcionamento:
+        • Coloca os bits de dados nas posições que não são potência de 2.
+        • Paridade i = XOR das posições com o bit i ligado (multiplicação pela matriz de verificação, módulo 2).
+        • SECDED: acrescenta na frente o bit de paridade geral (número par de 1s na palavra).
+
+        Parâmetros:
+        • dados (np.ndarray): Matriz blocos × k de bits (0/1).
+
+        Retorna:
+        • np.ndarray: Matriz blocos × n de bits (uint8).
+        """
+        dados = np.asarray(dados, dtype=np.uint8).reshape(-1, self.k)
+        palavras = np.zeros((len(dados), self.n_base), dtype=np.uint8)
+        palavras[:, self.posicoes_dados] = dados
+        palavras[:, self.posicoes_paridade] = (palavras @ self.verificacao) & 1
+        if self.estendido:
+            geral = palavras.sum(axis=1, dtype=np.int64) & 1
+            palavras = np.concatenate([geral[:, None].astype(np.uint8), palavras], axis=1)
+        return palavras
+
+
+    def decodificar(self, palavras) -> tuple:
+        """
+        Corrige e decodifica palavras, todas de uma vez.
+
+        Funcionamento:
+        • Síndrome = posição do bit errado (0 se não houver erro), corrigido direto na matriz.
+        • SECDED: síndrome ≠ 0 com paridade geral certa = erro duplo (detectado, não corrigido);
+          síndrome = 0 com paridade geral errada = erro só no bit geral.
+
+        Parâmetros:
+        • palavras (np.ndarray): Matriz blocos × n de bits recebidos.
+
+        Retorna:
+        • tuple: (dados blocos × k, palavras corrigidas (bool), palavras com erro duplo detectado (bool)).
+        """
+        palavras = np.array(palavras, dtype=np.uint8).reshape(-1, self.n)
+        if self.estendido:
+            paridade_geral = palavras.sum(axis=1, dtype=np.int64) & 1
+            palavras = palavras[:, 1:]
+
+        sindromes = ((palavras @ self.verificacao) & 1) @ self.pesos_sindrome
+        com_erro = sindromes != 0
+
+        if self.estendido:
+            duplos = com_erro & (paridade_geral == 0)
+            corrigir = com_erro & ~duplos
+            corrigidas = corrigir | (~com_erro & (paridade_geral == 1))
+        else:
+            duplos = np.zeros(len(palavras), dtype=bool)
+            corrigir = corrigidas = com_erro
+
+        linhas = np.flatnonzero(corrigir)
+        palavras[linhas, sindromes[linhas] - 1] ^= 1
+        return palavras[:, self.posicoes_dados], corrigidas, duplos
+
+
+    def codificar_bytes(self, dado:bytes, profundidade:int = 1) -> bytes:
+        """
+        Codifica bytes: marca o fim dos dados, divide em blocos de k bits, codifica e entrelaça.
+
+        Funcionamento:
+        • Acrescenta um bit 1 e completa com zeros até múltiplo de k (o decodificador corta no último 1),
+          então o tamanho original é recuperado mesmo com k > 8.
+        • Completa com palavras zero até múltiplo da profundidade do entrelaçador.
+
+        Parâmetros:
+        • dado (bytes): Dados a proteger.
+        • profundidade (int): Palavras por bloco do entrelaçador (1 = sem entrelaçamento).
+
+        Retorna:
+        • bytes: Palavras (entrelaçadas) em sequência, completadas com zeros até múltiplo de 8 bits.
+        """
+        bits = np.unpackbits(np.frombuffer(bytes(dado), dtype=np.uint8))
+        blocos = -(-(len(bits) + 1) // self.k)
+        blocos = -(-blocos // profundidade) * profundidade
+        dados = np.zeros(blocos * self.k, dtype=np.uint8)
+        dados[:len(bits)] = bits
+        dados[len(bits)] = 1  # Marca de fim
+        palavras = self.codificar(dados)
+        return np.packbits(Hamming.entrelacar(palavras, profundidade)).tobytes()
+
+
+    def decodificar_bytes(self, quadro:bytes, profundidade:int = 1) -> tuple:
+        """
+        Desfaz codificar_bytes, corrigindo os erros.
+
+        Parâmetros:
+        • quadro (bytes): Palavras recebidas (saída de codificar_bytes com erros).
+        • profundidade (int): Palavras por bloco do entrelaçador (a mesma da codificação).
+
+        Retorna:
+        • tuple: (dados, palavras corrigidas (bool por palavra), palavras com erro duplo detectado (bool por palavra)).
+
+        Exceção:
+        • ValueError: Se não houver a marca de fim dos dados.
+        """
+        bits = np.unpackbits(np.frombuffer(bytes(quadro), dtype=np.uint8))
+        blocos = len(bits) // self.n // profundidade * profundidade
+        palavras = Hamming.desentrelacar(bits[:blocos * self.n], profundidade, self.n)
+        dados, corrigidas, duplos = self.decodificar(palavras)
+
+        dados = dados.ravel()
+        uns = np.flatnonzero(dados)
+        if len(uns) == 0:
+            raise ValueError("Marca de fim dos dados não encontrada")
+        dados = dados[:uns[-1]]
+        return np.packbits(dados[:len(dados) // 8 * 8]).tobytes(), corrigidas, duplos
+
+
+    @staticmethod
+    def entrelacar(palavras, profundidade:int) -> np.ndarray:
+        """
+        Entrelaçador em bloco: transmite grupos de profundidade palavras coluna por coluna.
+
+        • Uma rajada de até profundidade bits seguidos atinge no máximo 1 bit de cada palavra (corrigível).
+
+        Parâmetros:
+        • palavras (np.ndarray): Matriz palavras × n (número de palavras múltiplo da profundidade).
+        • profundidade (int): Palavras por bloco.
+
+        Retorna:
+        • np.ndarray: Bits em ordem de transmissão.
+        """
+        palavras = np.asarray(palavras)
+        n = palavras.shape[1]
+        return palavras.reshape(-1, profundidade, n).transpose(0, 2, 1).ravel()
+
+
+    @staticmethod
+    def desentrelacar(bits, profundidade:int, n:int) -> np.ndarray:
+        """
+        Desfaz o entrelaçador em bloco.
+
+        Parâmetros:
+        • bits (np.ndarray): Bits recebidos (múltiplo de profundidade × n).
+        • profundidade (int): Palavras por bloco.
+        • n (int): Bits por palavra.
+
+        Retorna:
+        • np.ndarray: Matriz palavras × n.
+        """
+        return np.asarray(bits).reshape(-1, n, profundidade).transpose(0, 2, 1).reshape(-1, n)
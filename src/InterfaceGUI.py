@@ -6,6 +6,8 @@ matplotlib.use("GTK3Agg")
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_gtk3agg import FigureCanvasGTK3Agg as FigureCanvas
 import queue
+from src.Utils import graph_generator
+from src.Hamming import Hamming
 
 class Simulador(Gtk.Window):
     def __init__(self, in_queue: queue, out_queue: queue,  gui_rx):
@@ -35,6 +37,7 @@ class Simulador(Gtk.Window):
         self.mod_digital = Gtk.ComboBoxText()
         self.mod_analogica = Gtk.ComboBoxText()
         self.erros = Gtk.SpinButton()
+        self.entrelacamento = Gtk.SpinButton()
 
         widgets = [
             ("Entrada de texto", self.entrada_texto),
@@ -43,7 +46,8 @@ class Simulador(Gtk.Window):
             ("Tipo de detecção ou correção", self.detecao),
             ("Tipo de modulação digital", self.mod_digital),
             ("Tipo de modulação analógica", self.mod_analogica),
-            ("Nível de ruído (σ)", self.erros)
+            ("Nível de ruído (σ)", self.erros),
+            ("Profundidade do entrelaçamento", self.entrelacamento)
         ]
 
         self.simular_btn = Gtk.Button(label="Simular")
@@ -54,6 +58,9 @@ class Simulador(Gtk.Window):
         self.edc.set_value(8)  # Valor padrão inicial
         self.erros.set_adjustment(Gtk.Adjustment(lower=0, upper=100, step_increment=0.1, page_increment=1))
         self.erros.set_digits(2)
+        self.entrelacamento.set_adjustment(Gtk.Adjustment(lower=1, upper=64, step_increment=1, page_increment=8))
+        self.entrelacamento.set_value(1)  # 1 = sem entrelaçamento
+        self.entrelacamento.set_sensitive(False)  # Só para os códigos Hamming (n,k)/SECDED
 
         tipos_enquadramento = [
             "Contagem de caracteres",
@@ -68,7 +75,14 @@ class Simulador(Gtk.Window):
         tipos_detecao = [
             "Bit de paridade par",
             "CRC", 
-            "Hamming"
+            "Hamming",
+            "Hamming compactado",
+            "Hamming (15,11)",
+            "Hamming (31,26)",
+            "Hamming (63,57)",
+            "SECDED (16,11)",
+            "SECDED (32,26)",
+            "SECDED (64,57)"
         ]
         for tipo_detecao in tipos_detecao:
             self.detecao.append_text(tipo_detecao)
@@ -78,7 +92,12 @@ class Simulador(Gtk.Window):
         tipos_modulacao_analogica = [
             "ASK",
             "FSK",
-            "8-QAM"
+            "BPSK",
+            "QPSK",
+            "8-PSK",
+            "8-QAM",
+            "16-QAM",
+            "64-QAM"
         ]
         for tipo_modulacao_analogica in tipos_modulacao_analogica:
             self.mod_analogica.append_text(tipo_modulacao_analogica)
@@ -124,6 +143,8 @@ class Simulador(Gtk.Window):
             self.edc.set_sensitive(True)  # Ativa o campo EDC
         else:
             self.edc.set_sensitive(False)  # Desativa o campo EDC
+        # Entrelaçador em bloco só existe nos códigos Hamming (n,k)/SECDED
+        self.entrelacamento.set_sensitive(tipo in Hamming.NOMES)
     
     def on_simular_clicked(self, widget):
         GLib.idle_add(self.gui_rx.limpar_abas)
@@ -144,7 +165,8 @@ class Simulador(Gtk.Window):
             "detecao": self.detecao.get_active_text(),
             "mod_digital": self.mod_digital.get_active_text(),
             "mod_analogica": self.mod_analogica.get_active_text(),
-            "erros": self.erros.get_value()
+            "erros": self.erros.get_value(),
+            "entrelacamento": self.entrelacamento.get_value_as_int()
         })
     
     def atualizar_saidas(self):
@@ -152,6 +174,10 @@ class Simulador(Gtk.Window):
             while True:
                 camada, dado = self.in_queue.get_nowait()
 
+                # Gráficos chegam como (amostras, título, tipo) e são montados aqui, na thread da GUI
+                if camada == "fisica" and isinstance(dado, tuple):
+                    dado = graph_generator(*dado)
+
                 if camada == "aplicacao" and isinstance(dado, str):
                     label = Gtk.Label(label=dado)
                     self.aba_aplicacao.pack_start(label, False, False, 5)
@@ -210,6 +236,10 @@ class GUI_RX(Gtk.Window):
             while True:
                 camada, dado = self.in_queue.get_nowait()
 
+                # Gráficos chegam como (amostras, título, tipo) e são montados aqui, na thread da GUI
+                if camada == "fisica" and isinstance(dado, tuple):
+                    dado = graph_generator(*dado)
+
                 if camada == "aplicacao" and isinstance(dado, str):
                     label = Gtk.Label(label=dado)
                     self.aba_aplicacao.pack_start(label, False, False, 5)
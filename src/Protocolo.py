@@ -0,0 +1,151 @@
+import struct
+import numpy as np
+
+class Protocolo:
+    """
+    Formato binário das mensagens Transmissor → Receptor (substitui o pickle).
+
+    Mensagem = Cabeçalho + Textos (UTF-8) + Amostras do sinal (float32 little-endian)
+
+    • O cabeçalho dá o tamanho da mensagem inteira, então várias mensagens podem seguir
+      uma atrás da outra na mesma conexão TCP (ver tamanho_mensagem).
+
+    Cabeçalho (little-endian, 24 bytes):
+        mágica (4s) | versão (B) | tamanho do EDC (H) | profundidade do entrelaçador (B, 1 = sem) | ruído σ (d) |
+        tamanho de cada texto: mod_analogica, mod_digital, enquadramento, detecao (4 × B) | número de amostras (I)
+    """
+    MAGICA = b"GNSM"
+    VERSAO = 2
+    CABECALHO = struct.Struct("<4sBHBdBBBBI")
+    TEXTOS = ("mod_analogica", "mod_digital", "enquadramento", "detecao")  # Parâmetros de texto, nessa ordem
+    AMOSTRA = np.dtype("<f4")
+
+    @staticmethod
+    def serializar(sinal_modulado, data:dict) -> list:
+        """
+        Monta a mensagem binária, sem copiar as amostras pra dentro de um único buffer.
+
+        Parâmetros:
+        • sinal_modulado (np.ndarray | list): Sinal analógico (amostras).
+        • data (dict): Parâmetros da GUI (mod_analogica, mod_digital, enquadramento, detecao, edc, erros
+                       e, opcional, entrelacamento: 1 a 255, padrão 1).
+
+        Retorna:
+        • list[bytes | memoryview]: Buffers da mensagem, em ordem (cabeçalho + textos, amostras). Ex: pra socket.sendmsg.
+        """
+        textos = [str(data[chave]).encode("utf-8") for chave in Protocolo.TEXTOS]
+        if any(len(texto) > 0xFF for texto in textos):
+            raise ValueError("Parâmetro de texto maior que 255 bytes")
+        entrelacamento = int(data.get("entrelacamento", 1))
+        if not 1 <= entrelacamento <= 0xFF:
+            raise ValueError(f"Profundidade do entrelaçador inválida: {entrelacamento} (1 a 255)")
+
+        amostras = np.ascontiguousarray(sinal_modulado, dtype=Protocolo.AMOSTRA)
+        cabecalho = Protocolo.CABECALHO.pack(
+            Protocolo.MAGICA, Protocolo.VERSAO, int(data["edc"]), entrelacamento, float(data["erros"]),
+            *(len(texto) for texto in textos), len(amostras)
+        )
+        return [cabecalho + b"".join(textos), memoryview(amostras).cast("B")]
+
+
+    @staticmethod
+    def tamanho(buffers) -> int:
+        """Tamanho total, em bytes, da mensagem montada por serializar"""
+        return sum(memoryview(buffer).nbytes for buffer in buffers)
+
+
+    @staticmethod
+    def enviar(sock, buffers) -> None:
+        """
+        Envia os buffers com sendmsg (escrita com vários buffers, sem juntar tudo antes).
+
+        • sendmsg pode enviar só parte dos bytes: avança sobre os buffers e repete até enviar tudo.
+        • Sem sendmsg (ex: Windows), envia buffer por buffer com sendall.
+
+        Parâmetros:
+        • sock (socket.socket): Socket conectado.
+        • buffers (list[bytes | memoryview]): Saída de serializar.
+        """
+        if not hasattr(sock, "sendmsg"):
+            for buffer in buffers:
+                sock.sendall(buffer)
+            return
+
+        pendentes = [memoryview(buffer).cast("B") for buffer in buffers]
+        while pendentes:
+            enviados = sock.sendmsg(pendentes)
+            while pendentes and enviados >= len(pendentes[0]):
+                enviados -= len(pendentes[0])
+                pendentes.pop(0)
+            if pendentes:
+                pendentes[0] = pendentes[0][enviados:]
+
+
+    @staticmethod
+    def ler_cabecalho(mensagem) -> tuple:
+        """
+        Lê e valida o cabeçalho de uma mensagem.
+
+        Parâmetros:
+        • mensagem (bytes | bytearray | memoryview): Mensagem (pelo menos os CABECALHO.size primeiros bytes).
+
+        Retorna:
+        • tuple: (edc, entrelacamento, erros, tamanhos dos textos, número de amostras).
+
+        Exceção:
+        • ValueError: Se a mensagem não tiver a mágica ou tiver outra versão.
+        """
+        if len(mensagem) < Protocolo.CABECALHO.size:
+            raise ValueError("Mensagem menor que o cabeçalho")
+
+        magica, versao, edc, entrelacamento, erros, *tamanhos, num_amostras = Protocolo.CABECALHO.unpack_from(mensagem)
+        if magica != Protocolo.MAGICA:
+            raise ValueError("Mensagem com formato desconhecido")
+        if versao != Protocolo.VERSAO:
+            raise ValueError(f"Versão do formato não suportada: {versao} (esperada {Protocolo.VERSAO})")
+        return edc, entrelacamento, erros, tamanhos, num_amostras
+
+
+    @staticmethod
+    def tamanho_mensagem(cabecalho) -> int:
+        """
+        Tamanho total da mensagem (cabeçalho incluso) a partir só do cabeçalho.
+
+        • Usado pelo receptor pra saber quantos bytes ler antes de processar cada mensagem do fluxo.
+        """
+        _, _, _, tamanhos, num_amostras = Protocolo.ler_cabecalho(cabecalho)
+        return Protocolo.CABECALHO.size + sum(tamanhos) + num_amostras * Protocolo.AMOSTRA.itemsize
+
+
+    @staticmethod
+    def desserializar(mensagem) -> dict:
+        """
+        Lê uma mensagem binária recebida.
+
+        • As amostras são uma view (np.frombuffer) sobre a mensagem, sem cópia.
+
+        Parâmetros:
+        • mensagem (bytes | bytearray | memoryview): Mensagem completa.
+
+        Retorna:
+        • dict: Mesmas chaves de antes do formato binário ("modulated_signal", "mod_analogica", "mod_digital",
+                "enquadramento", "edc", "entrelacamento", "detecao", "erros").
+
+        Exceção:
+        • ValueError: Se a mensagem não tiver a mágica, tiver outra versão ou tamanho inconsistente.
+        """
+        mensagem = memoryview(mensagem).cast("B")
+        edc, entrelacamento, erros, tamanhos, num_amostras = Protocolo.ler_cabecalho(mensagem)
+
+        inicio_amostras = Protocolo.CABECALHO.size + sum(tamanhos)
+        if len(mensagem) != inicio_amostras + num_amostras * Protocolo.AMOSTRA.itemsize:
+            raise ValueError("Tamanho da mensagem não confere com o cabeçalho")
+
+        data = {"edc": edc, "entrelacamento": entrelacamento, "erros": erros}
+        posicao = Protocolo.CABECALHO.size
+        for chave, tamanho in zip(Protocolo.TEXTOS, tamanhos):
+            data[chave] = str(mensagem[posicao:posicao + tamanho], "utf-8")
+            posicao += tamanho
+
+        data["modulated_signal"] = np.frombuffer(mensagem, dtype=Protocolo.AMOSTRA, count=num_amostras, offset=inicio_amostras)
+        return data
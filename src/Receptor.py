@@ -1,18 +1,33 @@
 import socket
 import time
-import pickle
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from queue import Queue
 from src.CamadaFisica import CamadaFisica
 from src.CamadaEnlace import Enlace
-from src.Utils import byte_formarter, graph_generator
+from src.Canal import Canal
+from src.Hamming import Hamming
+from src.Segmentacao import Segmentacao, Remontador
+from src.Protocolo import Protocolo
+from src.Utils import byte_formarter
 
 class Receptor:
-    def __init__(self, host="localhost", port=27111, gui_queue=Queue()):
+    ATRASO_EXIBICAO = 2 # Espera (s) antes de exibir cada mensagem remontada (efeito visual na GUI)
+
+    def __init__(self, host="localhost", port=27111, gui_queue=Queue(), semente=None, tamanho_leitura=1 << 16, trabalhadores=None,
+                 max_mensagem=1 << 26):
         self.host = host
         self.port = port
+        self.tamanho_leitura = tamanho_leitura  # Máximo de bytes por recv_into (64 KiB por padrão)
+        self.max_mensagem = max_mensagem        # Maior mensagem aceita, em bytes (64 MiB por padrão)
+        self.trabalhadores = trabalhadores      # Threads de decodificação no modo asyncio (None = padrão do executor)
+        self.conexoes = set()                   # Conexões abertas no modo asyncio (fechadas no stop)
         self.gui_queue = gui_queue
         self.running = True  # Flag de controle
+        self.canal = Canal(semente=semente)  # Modelo de canal com gerador próprio (reprodutível pela semente)
+        self.remontador = Remontador()       # Junta os segmentos (um por quadro) de cada mensagem
 
 
     def start(self):
@@ -38,91 +53,290 @@ class Receptor:
                     # Sem conexão, volta pro início do loop pra checar o self.running
                     continue
                     
-                # conn é o "canal" de comunicação do transmissor com o receptor
+                # conn é o "canal" de comunicação do transmissor com o receptor (uma sessão com várias mensagens)
                 with conn:
                     print(f"Conectado por {addr}")
+                    conn.settimeout(1.0) # Evita bloqueio eterno no recv() entre uma mensagem e outra
+                    self.receber_sessao(conn)
 
-                    # Buffer pra armazenar os dados recebidos
-                    raw_data = b""
-
-                    while True:
-                        packet = conn.recv(4096) # Lê até 4096 bytes por vez na porta 27111
-                        if not packet:
-                            break # Encerra a conexão se não tiver mais dados
-                        raw_data += packet # Acumula dados no buffer
 
-                    try:
-                        data = pickle.loads(raw_data) # Reconstrói o dicionário (data) enviado pelo transmissor (Bytes -> Dicionário)
-                    except Exception as e:
-                        # Se não conseguir desserializar os bytes em dicionário
-                        self.gui_queue.put(["aplicacao", f"Erro ao desserializar: {e}"])
-                        continue
+    def receber_sessao(self, conn) -> None:
+        """
+        Recebe as mensagens de uma conexão, uma atrás da outra, até o transmissor fechar.
 
-                    self.processar(data)
+        Funcionamento:
+        • Processa cada mensagem assim que ela fica completa (ver receber_mensagem), sem esperar a conexão fechar.
+        • Mensagem com formato inválido: não dá pra achar o início da próxima, então encerra a sessão.
+        """
+        while self.running:
+            try:
+                data = self.receber_mensagem(conn)
+                if data is None:
+                    return # Transmissor fechou a conexão
+            except (ValueError, ConnectionError) as e:
+                # Se não conseguir desserializar os bytes em dicionário
+                self.gui_queue.put(["aplicacao", f"Erro ao desserializar: {e}"])
+                return
+
+            self.processar(data)
+
+
+    def receber_mensagem(self, conn):
+        """
+        Recebe uma mensagem inteira da conexão.
+
+        Funcionamento:
+        • Lê o cabeçalho, que dá o tamanho da mensagem (ver Protocolo.tamanho_mensagem).
+        • Aloca um único buffer do tamanho da mensagem e preenche o resto dele direto do socket (recv_into),
+          sem concatenar pacotes: tempo linear e as amostras viram uma view desse buffer.
+
+        Retorna:
+        • dict | None: Mensagem desserializada (ver Protocolo.desserializar), ou None se a conexão fechar antes.
+
+        Exceção:
+        • ValueError: Se a mensagem tiver formato inválido ou for maior que max_mensagem.
+        • ConnectionError: Se a conexão fechar no meio da mensagem.
+        """
+        cabecalho = bytearray(Protocolo.CABECALHO.size)
+        if not self.receber_em(conn, memoryview(cabecalho)):
+            return None
+        mensagem = bytearray(self.tamanho_mensagem(cabecalho))
+        mensagem[:len(cabecalho)] = cabecalho
+        if not self.receber_em(conn, memoryview(mensagem)[len(cabecalho):]):
+            return None
+        return Protocolo.desserializar(mensagem) # Reconstrói o dicionário (data) enviado pelo transmissor (Bytes -> Dicionário)
+
+
+    def tamanho_mensagem(self, cabecalho) -> int:
+        """
+        Tamanho da mensagem dado pelo cabeçalho, conferido antes de alocar o buffer.
+
+        • O cabeçalho vem da rede: sem o limite, um número de amostras forjado faria o receptor alocar até ~16 GiB.
+
+        Exceção:
+        • ValueError: Se a mensagem tiver formato inválido ou for maior que max_mensagem.
+        """
+        tamanho = Protocolo.tamanho_mensagem(cabecalho)
+        if tamanho > self.max_mensagem:
+            raise ValueError(f"Mensagem grande demais: {tamanho} bytes (máximo {self.max_mensagem})")
+        return tamanho
+
+
+    def start_async(self):
+        """
+        Modo servidor asyncio: atende vários transmissores ao mesmo tempo (alternativa ao start).
+
+        • Cada conexão é lida por um StreamReader na thread do loop de eventos.
+        • A decodificação (decodificar, sem GUI) roda num executor de threads, então uma conexão lenta
+          de decodificar não trava a leitura das outras. Os gráficos são montados pela GUI.
+        """
+        print("Receptor (asyncio) esperando conexões...")
+        asyncio.run(self.servir())
+
+
+    async def servir(self) -> None:
+        """Aceita conexões até o stop() e depois fecha as que ainda estiverem abertas"""
+        with ThreadPoolExecutor(max_workers=self.trabalhadores) as executor:
+            servidor = await asyncio.start_server(functools.partial(self.atender, executor), self.host, self.port,
+                                                  limit=self.tamanho_leitura, reuse_address=True)
+            async with servidor:
+                while self.running:
+                    await asyncio.sleep(0.5) # Confere o self.running de tempos em tempos
+                for escritor in list(self.conexoes):
+                    escritor.close()
+
+
+    async def atender(self, executor, leitor:asyncio.StreamReader, escritor:asyncio.StreamWriter) -> None:
+        """
+        Recebe as mensagens de uma conexão (modo asyncio), uma atrás da outra.
+
+        Funcionamento:
+        • Lê o cabeçalho e depois o resto da mensagem direto num único buffer do tamanho dela (ver ler_em).
+        • Decodifica no executor (decodificar, sem GUI) e espera terminar antes da próxima mensagem
+          da mesma conexão (segmentos em ordem); a exibição e a espera por mensagem ficam no loop de eventos,
+          então uma conexão não trava as outras.
+        • Cada conexão tem seu Remontador: transmissores diferentes usam os mesmos ids de mensagem.
+        """
+        print(f"Conectado por {escritor.get_extra_info('peername')}")
+        loop = asyncio.get_running_loop()
+        remontador = Remontador()
+        self.conexoes.add(escritor)
+        try:
+            while self.running:
+                cabecalho = bytearray(Protocolo.CABECALHO.size)
+                await self.ler_em(leitor, memoryview(cabecalho))
+                mensagem = bytearray(self.tamanho_mensagem(cabecalho))
+                mensagem[:len(cabecalho)] = cabecalho
+                await self.ler_em(leitor, memoryview(mensagem)[len(cabecalho):])
+                data = Protocolo.desserializar(mensagem) # Reconstrói o dicionário (data) enviado pelo transmissor (Bytes -> Dicionário)
 
+                try:
+                    resultado = await loop.run_in_executor(executor, self.decodificar, data)
+                except Exception as e:
+                    self.gui_queue.put(["aplicacao", f"Erro ao processar sinal: {e}"])
+                    continue
+                msg_bytes = self.exibir_camadas(resultado, remontador)
+                if msg_bytes is not None:
+                    await asyncio.sleep(self.ATRASO_EXIBICAO) # Espera uma vez por mensagem, sem travar as outras conexões
+                    self.exibir_mensagem(msg_bytes)
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                self.gui_queue.put(["aplicacao", "Erro ao desserializar: Conexão encerrada no meio da mensagem"])
+        except ConnectionError:
+            pass # Conexão fechada (pelo transmissor ou pelo stop)
+        except ValueError as e:
+            self.gui_queue.put(["aplicacao", f"Erro ao desserializar: {e}"])
+        finally:
+            self.conexoes.discard(escritor)
+            escritor.close()
+
+
+    async def ler_em(self, leitor:asyncio.StreamReader, destino:memoryview) -> None:
+        """
+        Preenche destino inteiro com bytes do leitor (modo asyncio), sem juntar pedaços em buffers intermediários.
+
+        Parâmetros:
+        • leitor (asyncio.StreamReader): Conexão com o transmissor.
+        • destino (memoryview): Trecho do buffer a preencher.
+
+        Exceção:
+        • asyncio.IncompleteReadError: Se a conexão fechar antes de preencher tudo (partial vazio = antes do primeiro byte).
+        """
+        recebidos = 0
+        while recebidos < len(destino):
+            pedaco = await leitor.read(min(len(destino) - recebidos, self.tamanho_leitura))
+            if not pedaco:
+                raise asyncio.IncompleteReadError(bytes(destino[:recebidos]), len(destino))
+            destino[recebidos:recebidos + len(pedaco)] = pedaco
+            recebidos += len(pedaco)
+
+
+    def receber_em(self, conn, destino:memoryview) -> bool:
+        """
+        Preenche destino inteiro com bytes da conexão (recv_into, sem cópias intermediárias).
+
+        Parâmetros:
+        • conn (socket.socket): Conexão com o transmissor.
+        • destino (memoryview): Trecho do buffer a preencher.
+
+        Retorna:
+        • bool: True se preencheu tudo, False se a conexão fechar (ou o receptor parar) antes do primeiro byte.
+
+        Exceção:
+        • ConnectionError: Se a conexão fechar no meio dos bytes.
+        """
+        recebidos = 0
+        while recebidos < len(destino):
+            try:
+                lidos = conn.recv_into(destino[recebidos:recebidos + self.tamanho_leitura]) # Lê até tamanho_leitura bytes por vez
+            except socket.timeout:
+                if not self.running:
+                    return False
+                continue # Sem dados ainda: volta pra checar o self.running
+            if lidos == 0:
+                if recebidos:
+                    raise ConnectionError("Conexão encerrada no meio da mensagem")
+                return False
+            recebidos += lidos
+        return True
+
+
+    def processar(self, data, remontador=None):
+        try:
+            msg_bytes = self.exibir_camadas(self.decodificar(data), remontador)
+            if msg_bytes is not None:
+                time.sleep(self.ATRASO_EXIBICAO) # Espera uma vez por mensagem (e não por quadro) antes de exibi-la (efeito visual na GUI)
+                self.exibir_mensagem(msg_bytes)
+        except Exception as e:
+            self.gui_queue.put(["aplicacao", f"Erro ao processar sinal: {e}"]) # Comunica erro de processamento
 
-    def processar(self, data):
-        time.sleep(2) # Espera 2 segundos pra processar o sinal (Efeito visual na GUI)
 
+    def decodificar(self, data) -> dict:
+        """
+        Decodifica um quadro sem tocar na GUI: ruído, demodulação, EDC e desenquadramento.
+
+        • Não cria gráficos nem espera, então pode rodar em qualquer thread (ex: no executor do modo asyncio).
+        • Erros do EDC e do desenquadramento não interrompem: ficam no resultado, pra GUI exibir.
+
+        Parâmetros:
+        • data (dict): Mensagem desserializada (ver Protocolo.desserializar).
+
+        Retorna:
+        • dict: params, sinal_modulado (com ruído), sinal_digital, quadro_bytes, valores_suaves, quadro_sem_edc,
+                correcoes, erro_edc, segmento e erro_desenquadramento.
+        """
+        # Extrai sinal e parâmetros de comunicação
+        sinal_modulado = np.asarray(data["modulated_signal"], dtype=np.float64) # Sinal analógico (modulado em FSK, ASK ou 8-QAM). Ex: [0, 0, 0.0627, 0.125...]
+        params = {
+            "tipo_mod_analogica": data["mod_analogica"],    # Ex: "FSK", "ASK", "8-QAM"
+            "tipo_mod_digital": data["mod_digital"],        # Ex: "NRZ-Polar", "Bipolar", "Manchester"
+            "tipo_enquadramento": data["enquadramento"],    # Ex: "Contagem de caracteres"...
+            "tipo_detecao": data["detecao"],                # Tipo de detecção de erro. Ex: "Hamming", "CRC", "Bit de paridade par" 
+            "tamanho_do_edc": data["edc"],                  # Ex: 8, 16, 24... (Caso use CRC)
+            "entrelacamento": data.get("entrelacamento", 1),# Profundidade do entrelaçador (Hamming (n,k)/SECDED)
+            "erros": float(data["erros"])                   # Nível de ruído (σ). Ex: 0.10, 0.20, 0.30...
+        }
+
+        # Processa ruído (se houver)
+        if (params["erros"]) > 0:
+            # Aplica o ruído ao sinal analógico
+            sinal_modulado = self.processar_ruido(sinal_modulado, params["erros"])
+
+        # Demodula o sinal analógico ruidoso, obtendo o quadro
+        quadro_bytes = CamadaFisica.demodulador(params["tipo_mod_analogica"], sinal_modulado)
+
+        # Hamming: confiabilidade de cada bit pra decodificação por decisão suave
+        valores_suaves = None
+        if params["tipo_detecao"] in Enlace.HAMMING_7_4:
+            valores_suaves = CamadaFisica.demodulador_suave(params["tipo_mod_analogica"], sinal_modulado)
+
+        # Codifica o quadro recuperado em banda base (erros do canal aparecem como níveis trocados)
+        sinal_digital = CamadaFisica.codficador_banda_base(params["tipo_mod_digital"], quadro_bytes)
+
+        # Verifica e remove o EDC uma única vez (enlace e aplicação usam o mesmo resultado)
         try:
-            # Extrai sinais e parâmetros de comunicação
-            sinal_digital = data["encoded_signal"]      # Sinal digital (codificado em NRZ-Polar, Bipolar ou Manchester). Ex: [-1, -1, 1, -1, 1, 1...]
-            sinal_modulado = data["modulated_signal"]   # Sinal analógico (modulado em FSK, ASK ou 8-QAM). Ex: [0, 0, 0.0627, 0.125...] 
-            params = {
-                "tipo_mod_analogica": data["mod_analogica"],    # Ex: "FSK", "ASK", "8-QAM"
-                "tipo_mod_digital": data["mod_digital"],        # Ex: "NRZ-Polar", "Bipolar", "Manchester"
-                "tipo_enquadramento": data["enquadramento"],    # Ex: "Contagem de caracteres"...
-                "tipo_detecao": data["detecao"],                # Tipo de detecção de erro. Ex: "Hamming", "CRC", "Bit de paridade par" 
-                "tamanho_do_edc": data["edc"],                  # Ex: 8, 16, 24... (Caso use CRC)
-                "erros": float(data["erros"])                   # Nível de ruído (σ). Ex: 0.10, 0.20, 0.30...
-            }
-
-            # Processa ruído (se houver)
-            if (params["erros"]) > 0:
-                # Aplica o mesmo ruído ao sinal analógico e digital
-                sinal_modulado, sinal_digital = self.processar_ruido(
-                    sinal_modulado, sinal_digital, params["erros"]
-                )
-
-            # Exibe sinais da camada física
-            self.exibir_camada_fisica(sinal_modulado, sinal_digital, params)
-
-            # Exibe e processa a camada de enlace
-            self.exibir_camada_enlace(sinal_digital, params)
-
-            # Decodifica sinal digital, obtendo o quadro
-            quadro_bytes = CamadaFisica.decodificador_banda_base(params["tipo_mod_digital"], sinal_digital)
-            
-            # Exibe e processa a camada de aplicação
-            self.exibir_camada_aplicacao(quadro_bytes, params)
+            quadro_sem_edc, correcoes = self.remover_edc(quadro_bytes, params, valores_suaves)
+            erro_edc = None
+        except Exception as e:
+            quadro_sem_edc, correcoes, erro_edc = quadro_bytes, None, e  # Mantém o quadro original se der erro
 
+        # Desenquadra pra recuperar o segmento da mensagem
+        try:
+            segmento = Enlace.desenquadramento(params["tipo_enquadramento"], quadro_sem_edc)
+            erro_desenquadramento = None
         except Exception as e:
-            self.gui_queue.put(["aplicacao", f"Erro ao processar sinal: {e}"]) # Comunica erro de processamento
+            segmento, erro_desenquadramento = quadro_sem_edc, e  # Mantém como estava se falhar
 
+        return {
+            "params": params, "sinal_modulado": sinal_modulado, "sinal_digital": sinal_digital,
+            "quadro_bytes": quadro_bytes, "valores_suaves": valores_suaves,
+            "quadro_sem_edc": quadro_sem_edc, "correcoes": correcoes, "erro_edc": erro_edc,
+            "segmento": segmento, "erro_desenquadramento": erro_desenquadramento
+        }
 
-    def processar_ruido(self, sinal_modulado, sinal_digital, sigma) -> tuple:
-        # Gera vetor de ruído pro sinal analógico considerando Curva Gaussiana
-        ruido = np.random.normal(0, sigma, size=len(sinal_modulado))
 
-        # Aplica ruído no sinal analógico (Alteração em todos os pontos)
-        sinal_modulado_ruidoso = np.array(sinal_modulado) + np.array(ruido)
+    def exibir_camadas(self, resultado:dict, remontador=None):
+        """
+        Exibe um quadro já decodificado (ver decodificar) nas abas da GUI e entrega o segmento ao remontador.
 
-        # Acumula a média do ruído anterior pra cada 100 pontos (1 bit)     
-        ruido_por_bit = [] 
+        • Só coloca textos e amostras na gui_queue: os gráficos são criados pela própria GUI.
 
-        # Pra cada 100 pontos (1 bit)
-        for i in range(0, len(ruido), 100): # (0, 100, 200, 300 ...)
-            media = np.mean(np.array(ruido[i:i+100])) # Tira média de ruído de 100 amostras
-            ruido_por_bit.append(media) # Guarda essa média
-                
-        # Aplica (soma) as médias do ruído de cada 100 pontos ao valor digital correspondente
-        sinal_digital_ruidoso = np.array(sinal_digital) + ruido_por_bit
+        Retorna:
+        • bytes | None: Mensagem completada por este quadro, ou None.
+        """
+        params = resultado["params"]
+        self.exibir_camada_fisica(resultado["sinal_modulado"], resultado["sinal_digital"], params)
+        self.exibir_camada_enlace(resultado, params)
+        return self.exibir_camada_aplicacao(resultado, params, remontador)
 
-        return (sinal_modulado_ruidoso.tolist(), sinal_digital_ruidoso.tolist())
+
+    def processar_ruido(self, sinal_modulado, sigma) -> np.ndarray:
+        # Aplica ruído gaussiano (AWGN) em todos os pontos do sinal analógico de uma vez
+        return self.canal.awgn(sinal_modulado, sigma)
 
 
     def exibir_camada_fisica(self, sinal_modulado, sinal_digital, params) -> None:
-        """Exibe as informações da camada física"""
+        """Exibe as informações da camada física (a GUI monta os gráficos a partir de (amostras, título, tipo))"""
         try: 
             tipo_mod_analogica = params["tipo_mod_analogica"] # Recupera tipo de modulação analógica
             tipo_mod_digital = params["tipo_mod_digital"]     # Recupera tipo de modulação digital
@@ -130,43 +344,60 @@ class Receptor:
             # Exibe sinal analógico
             self.gui_queue.put([
                 "fisica", 
-                graph_generator(sinal_modulado, f"Sinal Analógico Recebido em ({tipo_mod_analogica})", 'sinal_analogico')
+                (sinal_modulado, f"Sinal Analógico Recebido em ({tipo_mod_analogica})", 'sinal_analogico')
             ])
             print(f"Sinal Analógico Recebido em ({tipo_mod_analogica})")
             # Exibe sinal digital
             self.gui_queue.put([
                 "fisica", 
-                graph_generator(sinal_digital, f"Sinal Codificado em {tipo_mod_digital}", 'sinal_banda_base')
+                (sinal_digital, f"Sinal Codificado em {tipo_mod_digital}", 'sinal_banda_base')
             ])
         except Exception as e:
             self.gui_queue.put(["fisica", f"Erro ao processar camada física: {e}"])
 
 
-    def exibir_camada_enlace(self, sinal_digital, params) -> None:
-        """Processa e exibe as informações da camada de enlace"""
+    def remover_edc(self, quadro_bytes, params, valores_suaves) -> tuple:
+        """
+        Verifica e remove o EDC (Hamming (7,4) por decisão suave, a partir dos valores suaves).
+
+        Retorna:
+        • tuple: (quadro sem EDC, palavras corrigidas (uma entrada por palavra-código) nos códigos de Hamming, senão None).
+        """
+        tipo_detecao = params["tipo_detecao"]
+        if tipo_detecao in Enlace.HAMMING_7_4:
+            return Enlace.corrige_hamming_suave(valores_suaves, compactado=tipo_detecao == "Hamming compactado")
+        if tipo_detecao in Hamming.NOMES:
+            return Enlace.corrige_hamming_generico(quadro_bytes, tipo_detecao, params["entrelacamento"])
+        return Enlace.verificar_edc(tipo_detecao, quadro_bytes, params["tamanho_do_edc"], params["entrelacamento"]), None
+
+
+    def exibir_camada_enlace(self, resultado:dict, params) -> None:
+        """Exibe as informações da camada de enlace (quadro já decodificado em decodificar)"""
         try:
-            tipo_mod_digital = params["tipo_mod_digital"]       # Recupera tipo de modulação digital
             tipo_detecao = params["tipo_detecao"]               # Recupera tipo de detecção de erros
-            tamanho_do_edc = params["tamanho_do_edc"]           # Recupera tamanho do EDC
             tipo_enquadramento = params["tipo_enquadramento"]   # Recupera tipo de enquadramento
-
-            # Decodifica o sinal digital para obter o quadro com EDC
-            quadro_bytes = CamadaFisica.decodificador_banda_base(tipo_mod_digital, sinal_digital)
+            quadro_bytes = resultado["quadro_bytes"]
+            quadro_sem_edc = resultado["quadro_sem_edc"]
+            correcoes = resultado["correcoes"]
+            erro_edc = resultado["erro_edc"]
 
             # Exibe tipo de EDC utilizado
             self.gui_queue.put(["enlace", f">>> EDC utilizado: {tipo_detecao} <<<"])
+            if resultado["valores_suaves"] is not None:
+                self.gui_queue.put(["enlace", "Decodificação Hamming por decisão suave (amostras do sinal recebido)"])
 
             # Exibe quadro com EDC
             self.gui_queue.put(["enlace", f"Quadro com EDC: {byte_formarter(quadro_bytes)}"])
 
-            # Tenta verificar e remover o EDC e exibe o quadro resultante
-            try:
-                # Verifica se houve erro e recupera o quadro sem o EDC
-                quadro_sem_edc = Enlace.verificar_edc(tipo_detecao, quadro_bytes, tamanho_do_edc)
+            # Exibe o quadro sem o EDC ou o erro encontrado
+            if erro_edc is None:
                 self.gui_queue.put(["enlace", f"Quadro sem EDC: {byte_formarter(quadro_sem_edc)}"])
-            except Exception as e:
-                quadro_sem_edc = quadro_bytes  # Mantém o quadro original se der erro
-                self.gui_queue.put(["enlace", f"Erro ao verificar EDC: {e}"])
+
+                # Códigos de Hamming: quantas palavras-código foram corrigidas
+                if correcoes is not None:
+                    self.gui_queue.put(["enlace", f"Palavras Hamming corrigidas: {int(correcoes.sum())} de {len(correcoes)}"])
+            else:
+                self.gui_queue.put(["enlace", f"Erro ao verificar EDC: {erro_edc}"]) # quadro_sem_edc é o quadro original
 
             # Exibe tipo de enquadramento
             self.gui_queue.put(["enlace", f">>> Tipo de enquadramento: {tipo_enquadramento} <<<"])
@@ -174,38 +405,46 @@ class Receptor:
             # Exibe quadro antes e depois do desenquadramento
             self.gui_queue.put(["enlace", f"Quadro antes do desenquadramento: {byte_formarter(quadro_sem_edc)}"])
 
-            # Tenta desenquadrar o quadro e exibe o resultado
-            try:
-                # Desenquadra quadro pra recuperar msg da camada de aplicação
-                quadro_desenquadrado = Enlace.desenquadramento(tipo_enquadramento, quadro_sem_edc)
-                self.gui_queue.put(["enlace", f"Quadro desenquadrado (dados originais): {byte_formarter(quadro_desenquadrado)}"])
-            except Exception as e:
-                quadro_desenquadrado = quadro_sem_edc  # Mantém como estava se falhar
-                self.gui_queue.put(["enlace", f"Erro ao desenquadrar quadro: {e}"])
+            # Exibe o resultado do desenquadramento
+            if resultado["erro_desenquadramento"] is None:
+                self.gui_queue.put(["enlace", f"Quadro desenquadrado (dados originais): {byte_formarter(resultado['segmento'])}"])
+            else:
+                self.gui_queue.put(["enlace", f"Erro ao desenquadrar quadro: {resultado['erro_desenquadramento']}"])
         except Exception as e:
             self.gui_queue.put(["enlace", f"Erro ao processar camada de enlace: {e}"])
 
 
-    def exibir_camada_aplicacao(self, quadro_bytes, params) -> None:
-        """Processa e exibe as informações da camada de aplicação"""
+    def exibir_camada_aplicacao(self, resultado:dict, params, remontador=None):
+        """
+        Entrega o segmento ao remontador e exibe a sua chegada.
+
+        Retorna:
+        • bytes | None: Mensagem completada por este segmento (exibida depois com exibir_mensagem), ou None.
+        """
         try:    
-            tipo_enquadramento = params["tipo_enquadramento"] # Recupera tipo de enquadramento
-            tipo_detecao = params["tipo_detecao"]             # Recupera tipo de detecção de erros
-            tamanho_do_edc = params["tamanho_do_edc"]         # Recupera tamanho do EDC
+            # Quadro com erro detectado pelo EDC ou pelo desenquadramento não chega na aplicação
+            for erro in (resultado["erro_edc"], resultado["erro_desenquadramento"]):
+                if erro is not None:
+                    raise erro
+            segmento = resultado["segmento"]
+
+            # Remonta a mensagem original (só exibe quando todos os segmentos chegarem)
+            id_mensagem, sequencia, total, _ = Segmentacao.ler_cabecalho(segmento)
+            self.gui_queue.put(["aplicacao", f"Segmento {sequencia + 1}/{total} da mensagem {id_mensagem} recebido"])
+            remontador = self.remontador if remontador is None else remontador
+            return remontador.adicionar(segmento)
+        except Exception as e:
+            self.gui_queue.put(["enlace", f"Erro ao processar camada de aplicação: {e}"])
+            return None
 
-            # Remove EDC do quadro
-            quadro_sem_edc = Enlace.verificar_edc(tipo_detecao, quadro_bytes, tamanho_do_edc)
 
-            # Desenquadra quadro e recupera mensagem original
-            msg_bytes = Enlace.desenquadramento(tipo_enquadramento, quadro_sem_edc)
-            
-            # Exibe mensagem da aplicação em bits
-            self.gui_queue.put(["aplicacao", f"Mensagem recebida (bits): {byte_formarter(msg_bytes)}"])
+    def exibir_mensagem(self, msg_bytes:bytes) -> None:
+        """Exibe uma mensagem remontada na aba da camada de aplicação"""
+        # Exibe mensagem da aplicação em bits
+        self.gui_queue.put(["aplicacao", f"Mensagem recebida (bits): {byte_formarter(msg_bytes)}"])
 
-            # Exibe mensagem da aplicação em bytes
-            self.gui_queue.put(["aplicacao", f"Mensagem recebida: {msg_bytes}"])
-        except Exception as e:
-            self.gui_queue.put(["enlace", f"Erro ao processar camada de aplicação: {e}"])
+        # Exibe mensagem da aplicação em bytes
+        self.gui_queue.put(["aplicacao", f"Mensagem recebida: {msg_bytes}"])
 
 
     def stop(self):
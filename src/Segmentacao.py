@@ -0,0 +1,132 @@
+import struct
+from collections import deque
+
+class Segmentacao:
+    # Cabeçalho de cada segmento: id da mensagem (1 byte), número de sequência (2 bytes), total de segmentos (2 bytes)
+    CABECALHO = struct.Struct(">BHH")
+
+    # Tamanho máximo padrão de um segmento (cabeçalho + dados), em bytes.
+    # Cabe na contagem de caracteres, que guarda o tamanho do quadro em 1 byte (segmento ≤ 254 bytes).
+    MTU_PADRAO = 128
+
+    # Maior MTU de cada enquadramento que limita o tamanho do quadro (os outros não têm limite)
+    MTU_MAXIMA = {"Contagem de caracteres": 0xFF - 1}
+
+    @staticmethod
+    def segmentar(dado:bytes, mtu:int = MTU_PADRAO, id_mensagem:int = 0, enquadramento:str = None) -> list:
+        """
+        Divide uma mensagem em segmentos numerados, cada um enviado em um quadro.
+
+        Dinâmica:
+            Segmento = id_mensagem + sequência + total + pedaço dos dados
+            Uma mensagem vazia vira um único segmento sem dados.
+
+        Parâmetros:
+        • dado (bytes): Dados da camada de aplicação.
+        • mtu (int): Tamanho máximo de cada segmento (cabeçalho + dados), em bytes.
+        • id_mensagem (int): Identificador da mensagem (0 a 255), pra separar segmentos de mensagens diferentes.
+        • enquadramento (str): Enquadramento dos quadros, pra conferir a MTU máxima (ver MTU_MAXIMA). None = não confere.
+
+        Retorna:
+        • list[bytes]: Segmentos, em ordem.
+
+        Exceção:
+        • ValueError: Se a MTU for pequena demais, maior que a do enquadramento ou a mensagem tiver segmentos demais.
+
+        Exemplo:
+            Segmentacao.segmentar(b'abcdefgh', mtu=9) → [b'\x00\x00\x00\x00\x02abcd', b'\x00\x00\x01\x00\x02efgh']
+        """
+        tamanho_dados = mtu - Segmentacao.CABECALHO.size
+        if tamanho_dados <= 0:
+            raise ValueError(f"MTU muito pequena: {mtu} (mínimo {Segmentacao.CABECALHO.size + 1})")
+        mtu_maxima = Segmentacao.MTU_MAXIMA.get(enquadramento)
+        if mtu_maxima is not None and mtu > mtu_maxima:
+            raise ValueError(f"MTU muito grande para {enquadramento}: {mtu} (máximo {mtu_maxima})")
+
+        dado = bytes(dado)
+        total = max(1, -(-len(dado) // tamanho_dados))
+        if total > 0xFFFF:
+            raise ValueError(f"Mensagem grande demais para a MTU {mtu}: {total} segmentos")
+
+        return [
+            Segmentacao.CABECALHO.pack(id_mensagem % 256, sequencia, total)
+            + dado[sequencia * tamanho_dados:(sequencia + 1) * tamanho_dados]
+            for sequencia in range(total)
+        ]
+
+
+    @staticmethod
+    def ler_cabecalho(segmento:bytes) -> tuple:
+        """
+        Separa o cabeçalho dos dados de um segmento.
+
+        Parâmetros:
+        • segmento (bytes): Segmento recebido (já desenquadrado).
+
+        Retorna:
+        • tuple: (id_mensagem, sequencia, total, dados).
+
+        Exceção:
+        • ValueError: Se o segmento for menor que o cabeçalho ou tiver sequência fora do total.
+        """
+        segmento = bytes(segmento)
+        if len(segmento) < Segmentacao.CABECALHO.size:
+            raise ValueError("Segmento menor que o cabeçalho")
+        id_mensagem, sequencia, total = Segmentacao.CABECALHO.unpack_from(segmento)
+        if sequencia >= total:
+            raise ValueError(f"Sequência {sequencia} fora do total de segmentos {total}")
+        return id_mensagem, sequencia, total, segmento[Segmentacao.CABECALHO.size:]
+
+
+class Remontador:
+    """
+    Remonta as mensagens a partir dos segmentos recebidos (em qualquer ordem).
+
+    • Segmentos repetidos são ignorados (inclusive os de mensagens já entregues, ex: retransmissões).
+    • Guarda no máximo max_pendentes mensagens incompletas (descarta a mais antiga).
+    """
+    def __init__(self, max_pendentes:int = 8):
+        self.max_pendentes = max_pendentes
+        self.pendentes = {}                 # id_mensagem → (total, {sequencia: dados})
+        self.entregues = deque(maxlen=128)  # Ids das últimas mensagens entregues (menos da metade dos 256 ids)
+
+
+    def adicionar(self, segmento:bytes):
+        """
+        Guarda um segmento e devolve a mensagem se ela ficou completa.
+
+        Parâmetros:
+        • segmento (bytes): Segmento recebido (já desenquadrado e sem EDC).
+
+        Retorna:
+        • bytes | None: Mensagem completa, ou None se ainda faltam segmentos (ou se a mensagem já foi entregue).
+        """
+        id_mensagem, sequencia, total, dados = Segmentacao.ler_cabecalho(segmento)
+        if id_mensagem in self.entregues:
+            return None
+
+        # Mesmo id com outro total: é uma nova mensagem (o id dá a volta em 256)
+        if id_mensagem in self.pendentes and self.pendentes[id_mensagem][0] != total:
+            del self.pendentes[id_mensagem]
+
+        if id_mensagem not in self.pendentes:
+            if len(self.pendentes) >= self.max_pendentes:
+                del self.pendentes[next(iter(self.pendentes))]
+            self.pendentes[id_mensagem] = (total, {})
+
+        partes = self.pendentes[id_mensagem][1]
+        partes.setdefault(sequencia, dados)
+        if len(partes) < total:
+            return None
+
+        del self.pendentes[id_mensagem]
+        self.entregues.append(id_mensagem)
+        return b"".join(partes[i] for i in range(total))
+
+
+    def faltando(self, id_mensagem:int) -> list:
+        """Números de sequência ainda não recebidos de uma mensagem pendente"""
+        if id_mensagem not in self.pendentes:
+            return []
+        total, partes = self.pendentes[id_mensagem]
+        return [i for i in range(total) if i not in partes]
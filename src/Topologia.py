@@ -0,0 +1,228 @@
+import os
+import time
+import itertools
+import socket
+import threading
+import numpy as np
+from queue import Queue
+from concurrent.futures import ProcessPoolExecutor
+from src.CamadaFisica import CamadaFisica
+from src.CamadaEnlace import Enlace
+from src.Segmentacao import Segmentacao
+from src.Protocolo import Protocolo
+from src.Transmissor import Transmissor
+from src.Receptor import Receptor
+
+"""
+Padrao config de cada enlace (mesmas chaves da msg da GUI)
+{'enquadramento': 'Contagem de caracteres', 'detecao': 'CRC', 'edc': 16, 'mod_digital': 'NRZ-Polar', 'mod_analogica': 'QPSK', 'erros': 0.5}
+Opcional: 'mtu': 128 (tamanho máximo de cada segmento, em bytes)
+          'entrelacamento': 8 (profundidade do entrelaçador dos códigos Hamming (n,k)/SECDED)
+"""
+class Topologia:
+    """
+    Roda N enlaces (pares Transmissor → Receptor) independentes ao mesmo tempo, cada um em um processo
+    (sem disputar o GIL) e com sua própria porta TCP, e coleta vazão e erros de cada enlace.
+
+    • O transmissor usa a sessão TCP persistente do Transmissor e o formato binário do Protocolo.
+    • O receptor lê com Receptor.receber_mensagem e decodifica com Receptor.decodificar (sem gráficos nem espera).
+    """
+    def __init__(self, configs:list, mensagens=20, tamanho_mensagem=256, processos=None, porta_base=0, semente=0):
+        self.configs = configs                    # Configuração de cada enlace
+        self.mensagens = mensagens                # Mensagens aleatórias enviadas por enlace
+        self.tamanho_mensagem = tamanho_mensagem  # Bytes por mensagem
+        self.processos = processos or os.cpu_count() or 1
+        self.porta_base = porta_base              # Enlace i usa porta_base + i (0 = porta livre escolhida pelo sistema)
+        self.semente = semente
+
+
+    def executar(self) -> list:
+        """
+        Executa todos os enlaces no pool de processos.
+
+        • Com menos processos que enlaces, os enlaces excedentes esperam um processo livre.
+
+        Retorna:
+        • list[dict]: Um resultado por enlace, na ordem dos configs (ver resultado_vazio).
+        """
+        sementes = np.random.SeedSequence(self.semente).generate_state(len(self.configs))
+        with ProcessPoolExecutor(max_workers=min(self.processos, max(len(self.configs), 1))) as pool:
+            futuros = [
+                pool.submit(
+                    Topologia.executar_enlace, indice, config,
+                    self.porta_base + indice if self.porta_base else 0,
+                    self.mensagens, self.tamanho_mensagem, int(sementes[indice])
+                )
+                for indice, config in enumerate(self.configs)
+            ]
+            return [futuro.result() for futuro in futuros]
+
+
+    @staticmethod
+    def resultado_vazio(indice:int, config:dict) -> dict:
+        return {
+            "enlace": indice,
+            "detecao": config["detecao"],
+            "mod_analogica": config["mod_analogica"],
+            "porta": 0,
+            "mensagens": 0,              # Mensagens enviadas
+            "quadros": 0,                # Quadros (segmentos) enviados
+            "bytes_no_fio": 0,           # Bytes enviados pelo socket (formato binário)
+            "quadros_descartados": 0,    # Quadros descartados pelo EDC ou pelo desenquadramento
+            "quadros_nao_detectados": 0, # Quadros aceitos pelo EDC com segmento diferente do enviado
+            "entregues": 0,              # Mensagens remontadas iguais à original
+            "erros_nao_detectados": 0,   # Mensagens remontadas diferentes da original
+            "incompletas": 0,            # Mensagens nunca remontadas (segmentos faltando no Remontador)
+            "tempo": 0.0,                # Do primeiro envio até o receptor terminar (s)
+            "vazao": 0.0,                # Bits de mensagens entregues por segundo
+            "quadros_por_segundo": 0.0
+        }
+
+
+    @staticmethod
+    def executar_enlace(indice:int, config:dict, porta:int, mensagens:int, tamanho_mensagem:int, semente:int) -> dict:
+        """
+        Executa um enlace completo (executa dentro de um processo do pool).
+
+        Funcionamento:
+        • Abre o servidor do receptor (na porta pedida ou numa livre) e o atende numa thread.
+        • Gera as mensagens, segmenta, enquadra, aplica o EDC, modula e envia cada quadro pelo Transmissor.
+        • Fecha a conexão no fim, espera o receptor processar tudo e compara com o que foi enviado
+          cada segmento aceito pelo EDC e cada mensagem entregue.
+
+        Parâmetros:
+        • indice (int): Número do enlace.
+        • config (dict): Enquadramento, EDC, modulação e ruído do enlace.
+        • porta (int): Porta TCP do receptor (0 = livre).
+        • mensagens (int): Mensagens a enviar.
+        • tamanho_mensagem (int): Bytes por mensagem.
+        • semente (int): Semente do enlace (mensagens e ruído).
+
+        Retorna:
+        • dict: Estatísticas do enlace (ver resultado_vazio).
+        """
+        config = {"mod_digital": "NRZ-Polar", "erros": 0.0, **config}
+        semente_msg, semente_canal = np.random.SeedSequence(semente).spawn(2)
+        rng = np.random.default_rng(semente_msg)
+        originais = [rng.integers(0, 256, tamanho_mensagem, dtype=np.uint8).tobytes() for _ in range(mensagens)]
+        resultado = Topologia.resultado_vazio(indice, config)
+        recebidas = []  # (id_mensagem, mensagem) na ordem em que foram remontadas
+        enviados = []   # Segmento de cada quadro, na ordem de envio
+        aceitos = []    # (número do quadro, segmento) de cada quadro aceito pelo EDC e pelo desenquadramento
+
+        with socket.create_server(("localhost", porta)) as servidor:
+            resultado["porta"] = servidor.getsockname()[1]
+            servidor.settimeout(10.0) # Não espera o transmissor pra sempre se ele não conseguir conectar
+            receptor = Receptor(port=resultado["porta"], gui_queue=Queue(), semente=semente_canal)
+            thread = threading.Thread(target=Topologia.receber, args=(receptor, servidor, resultado, recebidas, aceitos))
+            thread.start()
+
+            transmissor = Transmissor(Queue(), Queue(), port=resultado["porta"])
+            mtu = config.get("mtu", Segmentacao.MTU_PADRAO)
+            inicio = time.perf_counter()
+            try:
+                for numero, mensagem in enumerate(originais):
+                    for segmento in Segmentacao.segmentar(mensagem, mtu, numero, config["enquadramento"]):
+                        quadro_sem_edc = Enlace.enquadramento(config["enquadramento"], segmento)
+                        quadro = Enlace.aplicar_edc(config["detecao"], quadro_sem_edc, config["edc"], config.get("entrelacamento", 1))
+                        buffers = Protocolo.serializar(CamadaFisica.modulador(config["mod_analogica"], quadro), config)
+                        transmissor.enviar(buffers)
+                        enviados.append(segmento)
+                        resultado["quadros"] += 1
+                        resultado["bytes_no_fio"] += Protocolo.tamanho(buffers)
+                    resultado["mensagens"] += 1
+            finally:
+                transmissor.desconectar() # Fim da sessão: o receptor termina depois de processar o que chegou
+                thread.join()
+            resultado["tempo"] = time.perf_counter() - inicio
+
+        # O TCP entrega todos os quadros em ordem: o n-ésimo quadro recebido é o n-ésimo enviado
+        resultado["quadros_nao_detectados"] = sum(segmento != enviados[quadro] for quadro, segmento in aceitos)
+
+        # Ids dão a volta em 256: a mensagem remontada é a próxima original com aquele id
+        proxima = 0
+        remontadas = set()
+        for id_mensagem, mensagem in recebidas:
+            numero = proxima + (id_mensagem - proxima) % 256
+            if numero < len(originais) and mensagem == originais[numero]:
+                resultado["entregues"] += 1
+            else:
+                resultado["erros_nao_detectados"] += 1
+            remontadas.add(numero)
+            proxima = numero + 1
+        resultado["incompletas"] = len(originais) - len(remontadas & set(range(len(originais))))
+
+        resultado["vazao"] = 8 * tamanho_mensagem * resultado["entregues"] / max(resultado["tempo"], 1e-9)
+        resultado["quadros_por_segundo"] = resultado["quadros"] / max(resultado["tempo"], 1e-9)
+        return resultado
+
+
+    @staticmethod
+    def receber(receptor:Receptor, servidor:socket.socket, resultado:dict, recebidas:list, aceitos:list) -> None:
+        """Lado receptor do enlace: atende uma conexão até o transmissor fechar"""
+        try:
+            conn, _ = servidor.accept()
+        except socket.timeout:
+            return
+        with conn:
+            for quadro in itertools.count():
+                try:
+                    data = receptor.receber_mensagem(conn)
+                except (ValueError, ConnectionError):
+                    return # Fluxo inválido: não dá pra achar a próxima mensagem
+                if data is None:
+                    return
+
+                try:
+                    segmento = Topologia.decodificar(receptor, data)
+                    id_mensagem = Segmentacao.ler_cabecalho(segmento)[0]
+                    mensagem = receptor.remontador.adicionar(segmento)
+                except ValueError:
+                    resultado["quadros_descartados"] += 1
+                    continue
+                aceitos.append((quadro, segmento))
+                if mensagem is not None:
+                    recebidas.append((id_mensagem, mensagem))
+
+
+    @staticmethod
+    def decodificar(receptor:Receptor, data:dict) -> bytes:
+        """
+        Decodifica o quadro com o próprio Receptor.decodificar (o mesmo receptor da aplicação, sem GUI).
+
+        Retorna:
+        • bytes: Segmento recebido.
+
+        Exceção:
+        • ValueError: Se o EDC ou o desenquadramento detectar erro.
+        """
+        resultado = receptor.decodificar(data)
+        for erro in (resultado["erro_edc"], resultado["erro_desenquadramento"]):
+            if erro is not None:
+                raise ValueError(str(erro)) from erro
+        return resultado["segmento"]
+
+
+if __name__ == "__main__":
+    import sys
+    num_enlaces = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    sigma = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    variacoes = [("CRC", "QPSK"), ("Bit de paridade par", "ASK"), ("SECDED (64,57)", "16-QAM"), ("Hamming", "FSK")]
+    configs = [
+        {"enquadramento": "Contagem de caracteres", "detecao": detecao, "edc": 16,
+         "mod_digital": "NRZ-Polar", "mod_analogica": mod_analogica, "erros": sigma}
+        for detecao, mod_analogica in (variacoes[i % len(variacoes)] for i in range(num_enlaces))
+    ]
+    inicio = time.perf_counter()
+    resultados = Topologia(configs).executar()
+    tempo = time.perf_counter() - inicio
+
+    print(f"{num_enlaces} enlaces, σ = {sigma}, {tempo:.1f} s")
+    print(f"{'enlace':>6} {'EDC':>20} {'mod.':>7} {'quadros':>7} {'descart.':>8} {'q. não det.':>11} {'entregues':>9} "
+          f"{'não detect.':>11} {'incompl.':>8} {'MB no fio':>9} {'vazão (kbit/s)':>14}")
+    for r in resultados:
+        entregues = f"{r['entregues']}/{r['mensagens']}"
+        print(f"{r['enlace']:>6} {r['detecao']:>20} {r['mod_analogica']:>7} {r['quadros']:>7} {r['quadros_descartados']:>8} "
+              f"{r['quadros_nao_detectados']:>11} {entregues:>9} {r['erros_nao_detectados']:>11} {r['incompletas']:>8} "
+              f"{r['bytes_no_fio'] / 1e6:>9.2f} {r['vazao'] / 1000:>14.1f}")
+    print(f"Vazão total: {sum(r['vazao'] for r in resultados) / 1000:.1f} kbit/s")
@@ -1,18 +1,27 @@
 import socket
-import pickle
+import time
 from queue import Queue
 from src.CamadaFisica import CamadaFisica
 from src.CamadaEnlace import Enlace
-from src.Utils import byte_formarter, graph_generator
+from src.Segmentacao import Segmentacao
+from src.Protocolo import Protocolo
+from src.Utils import byte_formarter
 
 """
 Padrao msg 
 {'entrada': '', 'quadro': 3, 'edc': 0, 'enquadramento': '1', 'detecao': 'Tipo 1', 'mod_digital': 'A', 'mod_analogica': 'Tipo 1', 'erros': 0}
+Opcional: 'mtu': 128 (tamanho máximo de cada segmento, em bytes)
+          'entrelacamento': 8 (profundidade do entrelaçador dos códigos Hamming (n,k)/SECDED, padrão 1 = sem)
 """
 class Transmissor:
-    def __init__(self, in_queue:Queue, gui_queue:Queue):
+    def __init__(self, in_queue:Queue, gui_queue:Queue, host="localhost", port=27111, tentativas=3):
         self.in_queue = in_queue
         self.gui_queue = gui_queue
+        self.host = host
+        self.port = port
+        self.tentativas = tentativas  # Tentativas de (re)conexão por quadro
+        self.id_mensagem = 0          # Identificador da próxima mensagem (segmentação)
+        self.socket = None            # Conexão com o receptor (aberta no primeiro envio e reaproveitada)
    
     def start(self):
         # Loop principal: aguarda novos dados da GUI pela fila
@@ -22,6 +31,7 @@ class Transmissor:
             # Condição de encerramento
             if data == "SAIR":
                 print("Transmissor encerrando...")
+                self.desconectar()
                 break # Interrompe o loop
             else:
                 # Mensagem (string) a ser enquadrada, modulada e transmitida
@@ -36,51 +46,87 @@ class Transmissor:
                 tipo_enquadramento = data["enquadramento"]  # Ex: "Contagem de caracteres"...
                 tamanho_do_edc = data["edc"]                # Ex: 8, 16, 24... (Caso use CRC)
                 tipo_detecao = data["detecao"]              # Tipo de detecção de erro. Ex: "Hamming", "CRC", "Bit de paridade par" 
+                entrelacamento = data.get("entrelacamento", 1)  # Profundidade do entrelaçador (Hamming (n,k)/SECDED)
 
                 # Exibe a camada de aplicação
                 self.exibir_camada_aplicacao(msg_bytes)
 
-                # Exibe e processa a camada de enlace
-                self.exibir_camada_enlace(msg_bytes, data)
-
-                # Aplica o enquadramento selecionado na msg da aplicação
-                quadro_sem_edc = Enlace.enquadramento(tipo_enquadramento, msg_bytes)
+                # Divide a mensagem em segmentos numerados (um quadro por segmento)
+                mtu = data.get("mtu", Segmentacao.MTU_PADRAO)
+                try:
+                    segmentos = Segmentacao.segmentar(msg_bytes, mtu, self.id_mensagem, tipo_enquadramento)
+                except ValueError as e:
+                    self.gui_queue.put(["enlace", f"Erro ao segmentar mensagem: {e}"])
+                    continue # Descarta a mensagem e espera a próxima
+                self.id_mensagem = (self.id_mensagem + 1) % 256
+                self.gui_queue.put(["enlace", f"Mensagem dividida em {len(segmentos)} quadro(s) (MTU: {mtu} bytes)"])
+
+                for segmento in segmentos:
+                    # Exibe e processa a camada de enlace
+                    self.exibir_camada_enlace(segmento, data)
+
+                    # Aplica o enquadramento selecionado no segmento
+                    quadro_sem_edc = Enlace.enquadramento(tipo_enquadramento, segmento)
+
+                    # Aplica o EDC no quadro
+                    quadro_bytes = Enlace.aplicar_edc(tipo_detecao, quadro_sem_edc, tamanho_do_edc, entrelacamento)
+
+                    # Exibe e processa sinais da camada física
+                    self.exibir_camada_fisica(quadro_bytes, data)
+
+                    # Obtém o sinal analógico
+                    sinal_modulado = CamadaFisica.modulador(tipo=tipo_mod_analogica, dado=quadro_bytes)
+
+                    # Sinal (amostras float32) e configurações no formato binário (ver Protocolo)
+                    buffers = Protocolo.serializar(sinal_modulado, data)
+
+                    # Transmissão do quadro pela conexão aberta com o Receptor
+                    try:
+                        self.enviar(buffers)
+                    except OSError as e:
+                        self.gui_queue.put(["aplicacao", f"Erro ao enviar quadro: {e}"])
+                        break # Não adianta mandar o resto da mensagem
+                else:
+                    print("Mensagem enviada com sucesso!") # Confirma envio
 
-                # Aplica o EDC no quadro
-                quadro_bytes = Enlace.aplicar_edc(tipo_detecao, quadro_sem_edc, tamanho_do_edc)
 
-                # Exibe e processa sinais da camada física
-                self.exibir_camada_fisica(quadro_bytes, data)
+    def conectar(self) -> socket.socket:
+        """Abre a conexão com o receptor, se ainda não estiver aberta"""
+        if self.socket is None:
+            self.socket = socket.create_connection((self.host, self.port)) # Porta e host iguais ao do receptor
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) # Quadros pequenos saem na hora
+        return self.socket
 
-                # Obtém o sinal digital
-                sinal_digital = CamadaFisica.codficador_banda_base(tipo=tipo_mod_digital, dado=quadro_bytes)
 
-                # Obtém o sinal analógico
-                sinal_modulado = CamadaFisica.modulador(tipo=tipo_mod_analogica, dado=quadro_bytes)
+    def desconectar(self) -> None:
+        """Fecha a conexão com o receptor (o próximo envio reconecta)"""
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
 
-                # Transmissão da Mensagem: Conecta com o Receptor
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.connect(("localhost", 27111))  # Porta e host iguais ao do receptor
 
-                    # Dados dos sinais e configurações
-                    msg_dict = {
-                        "encoded_signal": sinal_digital,        # Sinal digital (codificado em NRZ-Polar, Bipolar ou Manchester). Ex: [-1, -1, 1, -1, 1, 1...]
-                        "modulated_signal": sinal_modulado,     # Sinal analógico: lista de amostras. Ex: [0, 0, 0.0627, 0.125...] 
-                        "mod_analogica": data["mod_analogica"], # Ex: "FSK", "ASK", "8-QAM"
-                        "mod_digital": data["mod_digital"],     # Ex: "NRZ-Polar", "Bipolar", "Manchester"
-                        "enquadramento": data["enquadramento"], # Tipo de enquadramento. Ex: "Contagem de caracteres"...
-                        "edc": data["edc"],                     # Tamanho do EDC. Ex: 8, 16, 24... (Caso use CRC)
-                        "detecao": data["detecao"],             # Tipo de detecção de erro. Ex: "Hamming", "CRC", "Bit de paridade par"
-                        "erros": data["erros"]                  # Nível de ruído (σ). Ex: 0.10, 0.20, 0.30...
-                    }
+    def enviar(self, buffers) -> None:
+        """
+        Envia uma mensagem pela conexão persistente, reconectando se ela tiver caído.
 
-                    # Serializa o dicionário em bytes para envio
-                    serialized_data = pickle.dumps(msg_dict)
+        • As mensagens seguem uma atrás da outra na mesma conexão (o cabeçalho dá o tamanho de cada uma).
+        • Se o envio falhar, fecha a conexão, espera um pouco e reenvia a mensagem inteira numa conexão nova.
 
-                    # Envia os dados pra porta 27111 do servidor localhost
-                    s.sendall(serialized_data)
+        Parâmetros:
+        • buffers (list): Mensagem montada por Protocolo.serializar.
 
-                    print("Mensagem enviada com sucesso!") # Confirma envio
+        Exceção:
+        • OSError: Se falhar em todas as tentativas.
+        """
+        for tentativa in range(self.tentativas):
+            try:
+                Protocolo.enviar(self.conectar(), buffers)
+                return
+            except OSError:
+                self.desconectar()
+                if tentativa == self.tentativas - 1:
+                    raise
+                time.sleep(0.2 * (tentativa + 1))
 
 
     def exibir_camada_aplicacao(self, msg_bytes) -> None:
@@ -96,7 +142,7 @@ class Transmissor:
         
 
     def exibir_camada_enlace(self, msg_bytes, data) -> None:
-        """Processa e exibe as informações da camada de enlace"""
+        """Processa e exibe as informações da camada de enlace (de um segmento)"""
         try:
             tipo_detecao = data["detecao"]              # Recupera tipo de detecção de erros
             tamanho_do_edc = data["edc"]                # Recupera tamanho do EDC
@@ -115,7 +161,7 @@ class Transmissor:
             ]) # Exibe quadro (em bits) na interface gráfica
 
             # Aplica EDC (Error Detection Code) selecionado
-            quadro_bytes = Enlace.aplicar_edc(tipo_detecao, quadro_sem_edc, tamanho_do_edc)
+            quadro_bytes = Enlace.aplicar_edc(tipo_detecao, quadro_sem_edc, tamanho_do_edc, data.get("entrelacamento", 1))
             self.gui_queue.put([
                 "enlace", 
                 f"Quadro com EDC: {byte_formarter(quadro_bytes)}"
@@ -133,13 +179,13 @@ class Transmissor:
             sinal_digital = CamadaFisica.codficador_banda_base(tipo=tipo_mod_digital, dado=quadro)
             self.gui_queue.put([
                 "fisica", 
-                graph_generator(data=sinal_digital, title=f'Sinal Codificado em {tipo_mod_digital}', signal_type='sinal_banda_base')
+                (sinal_digital, f'Sinal Codificado em {tipo_mod_digital}', 'sinal_banda_base')
             ]) # Exibe gráfico resultante da codificação banda base
             
             sinal_modulado = CamadaFisica.modulador(tipo=tipo_mod_analogica, dado=quadro)
             self.gui_queue.put([
                 "fisica", 
-                graph_generator(data=sinal_modulado, title=f'Sinal Analógico Modulado em ({data["mod_analogica"]})', signal_type='sinal_analogico')
+                (sinal_modulado, f'Sinal Analógico Modulado em ({data["mod_analogica"]})', 'sinal_analogico')
             ]) # Exibe gráfico resultante da codificação analógica
         except Exception as e:
             self.gui_queue.put(["enlace", f"Erro ao processar camada física: {e}"])
@@ -1,13 +1,14 @@
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 import numpy as np 
+from src.Bits import Bits
 
 def byte_formarter(bytes_data):
     """
     Transforma bytes em string dos bits correspondentes.
 
     Parâmetros:
-    • bytes_data (bytes): Dados em bytes.
+    • bytes_data (bytes | Bits): Dados em bytes (ou sequência de bits).
 
     Retorna:
     • str: String dos bits formatada, com espaço entre os bytes.
@@ -16,22 +17,43 @@ def byte_formarter(bytes_data):
         Entrada → b'teste'
         Saída  → "01110100 01100101 01110011 01110100 01100101"
     """
+    if isinstance(bytes_data, Bits):
+        return bytes_data.formatar()
     return ' '.join(f"{byte:08b}" for byte in bytes_data)
 
 
+def unpack_bits(bytes_data) -> np.ndarray:
+    """
+    Transforma bytes em um array de bits (MSB primeiro).
+
+    Parâmetros:
+    • bytes_data (bytes | Bits): Dados em bytes (ou sequência de bits).
+
+    Retorna:
+    • np.ndarray: Array uint8 com um bit (0 ou 1) por posição.
+
+    Exemplo:
+        Entrada → b'A'
+        Saída  → array([0, 1, 0, 0, 0, 0, 0, 1], dtype=uint8)
+    """
+    if isinstance(bytes_data, Bits):
+        return bytes_data.para_array()
+    return np.unpackbits(np.frombuffer(bytes_data, dtype=np.uint8))
+
+
 def graph_generator(data, title, signal_type):
     """
     Gera um gráfico a partir de um array de inteiros e um título.
     
     Args:
-        data (list): Lista de inteiros para plotar no gráfico.
+        data (list | np.ndarray): Amostras do sinal para plotar no gráfico.
         titulo (str): Título do gráfico.
         signal_type (str): Sinal analógico ou digital
     
     Returns:
         Figure: Objeto Figure do matplotlib contendo o gráfico.
     """
-    if data:
+    if len(data) > 0:
         if signal_type == "sinal_analogico":
             # ===============
             # SINAL ANALÓGICO
@@ -59,7 +81,7 @@ def graph_generator(data, title, signal_type):
             # Título, labels e grid
             ax.set_title(title)
             x_label = "T (Tempo de Bit)"
-            if title == "Sinal Analógico Modulado em (8-QAM)" or title == "Sinal Analógico Recebido em (8-QAM)":
+            if "PSK)" in title or "QAM)" in title:
                 x_label = "T (Tempo de Símbolo)"
             ax.set_xlabel(x_label)
             ax.set_ylabel("Amplitude")
@@ -120,26 +142,6 @@ def graph_generator(data, title, signal_type):
     else:
         raise ValueError('Nenhum dado foi fornecido.')
     
-def findall(substring, string):
-    """
-    Encontra todas as ocorrencias de uma substring na string original
-     
-    Args:
-        substring: substring que deseja ser encotnrada
-        string: String original
-    
-    Returns:
-        Lista de com todos os indexs do inicio da substring
-
-    """
-    l = []
-    i = -1
-    while True:
-        i = string.find(substring, i+1)
-        if i == -1:
-            return l
-        l.append(string.find(substring, i))
-
 def find_xor(a:str, b:str) -> str:
     """
     Realiza o Xor bit a bit da palavra
@@ -0,0 +1,188 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from src.CamadaFisica import CamadaFisica
+from src.CamadaEnlace import Enlace
+from src.Receptor import Receptor
+from src.Canal import Canal
+from src.Hamming import Hamming
+import src.Utils as Utils
+
+"""
+Padrao config (mesmas chaves da msg da GUI)
+{'enquadramento': 'Contagem de caracteres', 'detecao': 'CRC', 'edc': 8, 'mod_analogica': 'ASK'}
+Opcional: 'decisao_suave': True (Hamming decodificado por decisão suave)
+          'entrelacamento': 8 (profundidade do entrelaçador dos códigos Hamming (n,k)/SECDED)
+          'rajadas': {'sigma_ruim': 3.0, 'p_bom_ruim': 0.01, 'p_ruim_bom': 0.2} (canal de Gilbert-Elliott, σ do ponto no estado bom)
+"""
+class Varredura:
+    def __init__(self, config:dict, tamanho_mensagem=16, quadros_por_lote=200, max_quadros=10000, alvo_erros=100, processos=None, semente=0):
+        self.config = config                      # Enquadramento, EDC e modulação de todos os quadros
+        self.tamanho_mensagem = tamanho_mensagem  # Bytes de payload aleatório por quadro
+        self.quadros_por_lote = quadros_por_lote  # Quadros simulados por tarefa do pool
+        self.max_quadros = max_quadros            # Limite de quadros por ponto
+        self.alvo_erros = alvo_erros              # Para o ponto quando atingir esse número de quadros errados
+        self.processos = processos or os.cpu_count() or 1
+        self.semente = semente
+
+
+    def executar(self, pontos, eixo="sigma") -> list:
+        """
+        Executa a varredura Monte Carlo em cada nível de ruído.
+
+        Funcionamento:
+        • Para cada ponto, distribui lotes de quadros entre os processos do pool.
+        • Mantém no máximo um lote por processo em andamento e soma os resultados conforme terminam.
+        • Para de enviar lotes quando atinge alvo_erros quadros errados ou max_quadros quadros.
+
+        Parâmetros:
+        • pontos (Iterable[float]): Níveis de ruído (σ ou Eb/N0 em dB).
+        • eixo (str): "sigma" (desvio padrão do ruído) ou "ebn0" (Eb/N0 em dB).
+
+        Retorna:
+        • list[dict]: Um resultado por ponto (ver simular_lote), com "ponto", "ber" e "fer".
+        """
+        resultados = []
+        with ProcessPoolExecutor(max_workers=self.processos) as pool:
+            for indice_ponto, ponto in enumerate(pontos):
+                total = Varredura.resultado_vazio()
+                pendentes = set()
+                enviados = 0
+                while True:
+                    # Envia lotes enquanto houver processo livre e o ponto não tiver terminado
+                    while (len(pendentes) < self.processos
+                           and enviados < self.max_quadros
+                           and total["erros_de_quadro"] < self.alvo_erros):
+                        num_quadros = min(self.quadros_por_lote, self.max_quadros - enviados)
+                        semente = int(np.random.SeedSequence([self.semente, indice_ponto, enviados]).generate_state(1)[0])
+                        pendentes.add(pool.submit(
+                            Varredura.simular_lote, self.config, ponto, eixo,
+                            self.tamanho_mensagem, num_quadros, semente
+                        ))
+                        enviados += num_quadros
+
+                    if not pendentes:
+                        break
+
+                    # Acumula os lotes que terminaram (lotes em andamento no fim também entram na conta)
+                    feitos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in feitos:
+                        for chave, valor in futuro.result().items():
+                            total[chave] += valor
+
+                total["ponto"] = ponto
+                total["ber"] = total["erros_de_bit"] / max(total["bits"], 1)
+                total["fer"] = total["erros_de_quadro"] / max(total["quadros"], 1)
+                resultados.append(total)
+        return resultados
+
+
+    @staticmethod
+    def resultado_vazio() -> dict:
+        return {
+            "quadros": 0,               # Quadros simulados
+            "bits": 0,                  # Bits transmitidos no canal (quadro com enquadramento e EDC)
+            "erros_de_bit": 0,          # Bits errados após a demodulação (antes do EDC)
+            "erros_de_quadro": 0,       # Quadros em que a mensagem entregue não é a original
+            "erros_detectados": 0,      # Quadros descartados pelo EDC ou pelo desenquadramento
+            "erros_nao_detectados": 0,  # Quadros entregues com a mensagem errada
+            "palavras_corrigidas": 0    # Palavras Hamming com um bit corrigido (decodificação por síndrome)
+        }
+
+
+    @staticmethod
+    def simular_lote(config, ponto, eixo, tamanho_mensagem, num_quadros, semente) -> dict:
+        """
+        Simula um lote de quadros por todo o pipeline (executa dentro de um processo do pool).
+
+        Funcionamento:
+        • Gera mensagens aleatórias, enquadra, aplica o EDC e modula.
+        • Aplica o ruído com o Receptor.processar_ruido e demodula.
+        • Conta bits errados no quadro demodulado e verifica EDC + desenquadramento.
+
+        Parâmetros:
+        • config (dict): Enquadramento, EDC e modulação (mesmas chaves da msg da GUI).
+        • ponto (float): Nível de ruído (σ ou Eb/N0 em dB, conforme eixo).
+        • eixo (str): "sigma" ou "ebn0".
+        • tamanho_mensagem (int): Bytes de payload por quadro.
+        • num_quadros (int): Quadros do lote.
+        • semente (int): Semente do lote (mensagens e ruído).
+
+        Retorna:
+        • dict: Contadores do lote (ver resultado_vazio).
+        """
+        # Sementes independentes para as mensagens e para o canal do receptor
+        semente_msg, semente_canal = np.random.SeedSequence(semente).spawn(2)
+        rng = np.random.default_rng(semente_msg)
+        receptor = Receptor(semente=semente_canal)
+
+        tipo_enquadramento = config["enquadramento"]
+        tipo_detecao = config["detecao"]
+        tamanho_do_edc = config["edc"]
+        tipo_mod_analogica = config["mod_analogica"]
+        decisao_suave = config.get("decisao_suave", False) and tipo_detecao in Enlace.HAMMING_7_4
+        compactado = tipo_detecao == "Hamming compactado"
+        entrelacamento = config.get("entrelacamento", 1)
+        rajadas = config.get("rajadas")
+
+        resultado = Varredura.resultado_vazio()
+        for _ in range(num_quadros):
+            msg_bytes = rng.integers(0, 256, tamanho_mensagem, dtype=np.uint8).tobytes()
+
+            # Transmissor
+            quadro_sem_edc = Enlace.enquadramento(tipo_enquadramento, msg_bytes)
+            quadro = Enlace.aplicar_edc(tipo_detecao, quadro_sem_edc, tamanho_do_edc, entrelacamento)
+            sinal_modulado = CamadaFisica.modulador(tipo_mod_analogica, quadro)
+
+            # Canal
+            sigma = ponto if eixo == "sigma" else Canal.sigma_de_ebn0(ponto, sinal_modulado, 8 * len(quadro))
+            if rajadas:
+                sinal_ruidoso = receptor.canal.gilbert_elliott(sinal_modulado, sigma, **rajadas)
+            else:
+                sinal_ruidoso = receptor.processar_ruido(sinal_modulado, sigma)
+
+            # Receptor
+            quadro_recebido = CamadaFisica.demodulador(tipo_mod_analogica, sinal_ruidoso)
+
+            bits_tx = Utils.unpack_bits(quadro)
+            bits_rx = Utils.unpack_bits(quadro_recebido)
+            resultado["bits"] += len(bits_tx)
+            resultado["erros_de_bit"] += int(np.count_nonzero(bits_tx != bits_rx))
+            resultado["quadros"] += 1
+
+            try:
+                if decisao_suave:
+                    valores_suaves = CamadaFisica.demodulador_suave(tipo_mod_analogica, sinal_ruidoso)
+                    quadro_verificado, correcoes = Enlace.corrige_hamming_suave(valores_suaves, compactado=compactado)
+                    resultado["palavras_corrigidas"] += int(correcoes.sum())
+                elif tipo_detecao in Enlace.HAMMING_7_4:
+                    quadro_verificado, correcoes = Enlace.corrige_hamming(quadro_recebido, compactado=compactado)
+                    resultado["palavras_corrigidas"] += int(correcoes.sum())
+                elif tipo_detecao in Hamming.NOMES:
+                    quadro_verificado, correcoes = Enlace.corrige_hamming_generico(quadro_recebido, tipo_detecao, entrelacamento)
+                    resultado["palavras_corrigidas"] += int(correcoes.sum())
+                else:
+                    quadro_verificado = Enlace.verificar_edc(tipo_detecao, quadro_recebido, tamanho_do_edc, entrelacamento)
+                msg_recebida = Enlace.desenquadramento(tipo_enquadramento, quadro_verificado)
+            except ValueError:
+                resultado["erros_de_quadro"] += 1
+                resultado["erros_detectados"] += 1
+                continue
+
+            if msg_recebida != msg_bytes:
+                resultado["erros_de_quadro"] += 1
+                resultado["erros_nao_detectados"] += 1
+        return resultado
+
+
+if __name__ == "__main__":
+    config = {
+        "enquadramento": "Contagem de caracteres",
+        "detecao": "CRC",
+        "edc": 8,
+        "mod_analogica": "ASK"
+    }
+    varredura = Varredura(config)
+    print(f"{'σ':>6} {'quadros':>8} {'BER':>10} {'FER':>10}")
+    for r in varredura.executar([0.5, 1.0, 1.5, 2.0]):
+        print(f"{r['ponto']:>6.2f} {r['quadros']:>8} {r['ber']:>10.2e} {r['fer']:>10.2e}")